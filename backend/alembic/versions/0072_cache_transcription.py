@@ -0,0 +1,60 @@
+"""cache_transcription — tenant-scoped judge transcription response cache
+
+Revision ID: 0072
+Revises: 0071
+Create Date: 2026-10-16
+"""
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0072"
+down_revision: Union[str, None] = "0071"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cache_transcription",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("cache_key", sa.Text(), nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("response", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["tenant_id"], ["platform.tenants.id"], ondelete="CASCADE"
+        ),
+        sa.UniqueConstraint(
+            "cache_key", "tenant_id", name="uq_cache_transcription_key_tenant"
+        ),
+        schema="platform",
+    )
+    op.create_index(
+        "idx_cache_transcription_expires_at",
+        "cache_transcription",
+        ["expires_at"],
+        schema="platform",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_cache_transcription_expires_at",
+        table_name="cache_transcription",
+        schema="platform",
+    )
+    op.drop_table("cache_transcription", schema="platform")
@@ -0,0 +1,60 @@
+"""cache_critique — tenant-scoped voice-rx critique response cache
+
+Revision ID: 0073
+Revises: 0072
+Create Date: 2026-10-16
+"""
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0073"
+down_revision: Union[str, None] = "0072"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cache_critique",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("cache_key", sa.Text(), nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("response", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["tenant_id"], ["platform.tenants.id"], ondelete="CASCADE"
+        ),
+        sa.UniqueConstraint(
+            "cache_key", "tenant_id", name="uq_cache_critique_key_tenant"
+        ),
+        schema="platform",
+    )
+    op.create_index(
+        "idx_cache_critique_expires_at",
+        "cache_critique",
+        ["expires_at"],
+        schema="platform",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_cache_critique_expires_at",
+        table_name="cache_critique",
+        schema="platform",
+    )
+    op.drop_table("cache_critique", schema="platform")
@@ -16,11 +16,21 @@ engine = create_async_engine(
     echo=False,
     pool_size=20,
     max_overflow=30,
-    pool_pre_ping=True,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    # LIFO keeps a few hot connections busy and lets the rest idle out.
+    pool_use_lifo=True,
 )
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Same pool, no BEGIN/ROLLBACK round-trips — for sessions that only SELECT.
+read_session = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 # Separate pool for analytics queries — smaller, with statement timeout.
 # Falls back to primary if ANALYTICS_DATABASE_URL is not set.
 analytics_engine = create_async_engine(
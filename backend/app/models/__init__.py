@@ -88,6 +88,8 @@ from app.models.tenant_llm_deployment import TenantLlmDeployment
 from app.models.tenant_curated_model import TenantCuratedModel
 from app.models.tenant_call_site_default import TenantCallSiteDefault
 from app.models.mail_send_log import MailSendLog
+from app.models.cache_transcription import CacheTranscription
+from app.models.cache_critique import CacheCritique
 from app.models.notification_subscription import NotificationSubscription
 
 __all__ = [
@@ -95,7 +97,7 @@ __all__ = [
     "Tenant", "TenantConfiguration", "User", "IdentityRefreshToken", "IdentityInviteLink", "IdentityInviteLinkUse",
     "Application", "AccessRole", "AccessRoleApplicationGrant", "AccessRolePermission", "AuditEventLog",
     "EvaluationDataset", "ApplicationUploadedFile", "LibraryPromptDefinition", "LibraryOutputSchemaDefinition", "Evaluator",
-    "MailSendLog", "NotificationSubscription",
+    "MailSendLog", "NotificationSubscription", "CacheTranscription", "CacheCritique",
     "ChatSession", "ChatMessage", "ApplicationEventHistory", "ApplicationSetting", "LibraryAdversarialTestCase", "ApplicationTag",
     "BackgroundJob",
     "EvaluationRun", "EvaluationRunThreadResult", "EvaluationRunAdversarialResult",
@@ -0,0 +1,30 @@
+"""Tenant-scoped cache of voice-rx critique responses, keyed by prompt hash."""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Text, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class CacheCritique(Base):
+    __tablename__ = "cache_critique"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    cache_key: Mapped[str] = mapped_column(Text, nullable=False)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("platform.tenants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    response: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("cache_key", "tenant_id", name="uq_cache_critique_key_tenant"),
+        Index("idx_cache_critique_expires_at", "expires_at"),
+        {"schema": "platform"},
+    )
@@ -42,9 +42,11 @@ from app.services.evaluators.credential_lane_scheduler import (
 from app.services.evaluators.kaira_client import KairaClient
 from app.services.evaluators.models import serialize
 from app.services.evaluators.runner_utils import (
-    save_api_log, promote_eval_run_to_running, finalize_eval_run,
+    API_LOG_BATCH_SIZE, ApiLogBuffer, promote_eval_run_to_running, finalize_eval_run,
     make_usage_callback,
+    provider_factory_kwargs,
     set_usage_call_purpose,
+    ProgressThrottle,
 )
 from app.services.job_worker import (
     JobCancelledError, is_job_cancelled, safe_error_message, update_job_progress,
@@ -456,18 +458,13 @@ async def run_adversarial_evaluation(
     api_key = resolved.credentials.secret.get("api_key", "")
     sa_path = resolved.credentials.service_account_path or ""
     auth_method = "service_account" if resolved.credentials.service_account_path else "api_key"
-    azure_endpoint = ""
-    api_version = ""
-    if resolved.provider == "azure_openai":
-        azure_endpoint = resolved.credentials.extra_config.get("base_url") or ""
-        api_version = resolved.api_version or resolved.credentials.extra_config.get("api_version", "2025-03-01-preview")
     llm_provider = resolved.provider
     llm_model = resolved.model
     inner_llm = create_llm_provider(
         provider=llm_provider, api_key=api_key,
         model_name=llm_model or "", temperature=temperature,
         service_account_path=sa_path,
-        azure_endpoint=azure_endpoint, api_version=api_version,
+        **provider_factory_kwargs(resolved),
     )
     usage_cb = make_usage_callback(
         tenant_id=tenant_id,
@@ -477,8 +474,11 @@ async def run_adversarial_evaluation(
         owner_id=run_id,
         default_call_purpose='adversarial_evaluation',
     )
+    # Each case logs a Kaira call per turn plus the judge's LLM calls;
+    # they are written in batches rather than one commit each.
+    api_logs = ApiLogBuffer(max_pending=API_LOG_BATCH_SIZE)
     llm: BaseLLMProvider = LoggingLLMWrapper(
-        inner_llm, log_callback=save_api_log, usage_callback=usage_cb,
+        inner_llm, log_callback=api_logs.add, usage_callback=usage_cb,
     )
     if timeouts:
         llm.set_timeouts(timeouts)
@@ -714,8 +714,11 @@ async def run_adversarial_evaluation(
                     "credential_user_id": credential["user_id"],
                 }
 
+        throttle = ProgressThrottle()
+
         async def _progress_bridge(current: int, total_count: int, message: str):
-            await report_progress(current, total_count, message)
+            if throttle.should_write(current, total_count):
+                await report_progress(current, total_count, message)
 
         def _progress_message(ok: int, err: int, current: int, tot: int) -> str:
             return f"Test case {current}/{tot} ({ok} ok, {err} errors)"
@@ -733,7 +736,7 @@ async def run_adversarial_evaluation(
             client_factory=lambda credential: KairaClient(
                 auth_token=credential["auth_token"],
                 base_url=kaira_api_url,
-                log_callback=save_api_log,
+                log_callback=api_logs.add,
                 run_id=str(run_id),
                 timeout=kaira_timeout,
             ),
@@ -836,3 +839,9 @@ async def run_adversarial_evaluation(
             error_message=safe_error_message(e),
         )
         raise
+
+    finally:
+        try:
+            await api_logs.flush()
+        except Exception:
+            logger.warning("Failed to save API logs for run %s", run_id, exc_info=True)
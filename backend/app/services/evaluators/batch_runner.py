@@ -47,16 +47,19 @@ from app.services.evaluators.models import RunMetadata, serialize
 from app.services.evaluators.adversarial_config import load_config_from_db
 from app.services.evaluators.thread_canonical import build_canonical_thread_evaluation
 from app.services.evaluators.output_schema_utils import find_primary_field
-from app.services.evaluators.prompt_resolver import resolve_prompt
+from app.services.evaluators.prompt_resolver import format_chat_transcript, resolve_prompt
 from app.services.evaluators.schema_generator import generate_json_schema
 from app.services.evaluators.response_parser import _safe_parse_json
 from app.services.evaluators.parallel_engine import run_parallel
 from app.services.evaluators.runner_utils import (
-    save_api_log,
+    API_LOG_BATCH_SIZE,
+    ApiLogBuffer,
     promote_eval_run_to_running,
     finalize_eval_run,
     make_usage_callback,
+    provider_factory_kwargs,
     set_usage_call_purpose,
+    ProgressThrottle,
 )
 from app.services.job_worker import (
     JobCancelledError,
@@ -192,11 +195,6 @@ async def run_batch_evaluation(
     api_key = resolved.credentials.secret.get("api_key", "")
     service_account_path = resolved.credentials.service_account_path or ""
     auth_method = "service_account" if resolved.credentials.service_account_path else "api_key"
-    azure_endpoint = ""
-    api_version = ""
-    if resolved.provider == "azure_openai":
-        azure_endpoint = resolved.credentials.extra_config.get("base_url") or ""
-        api_version = resolved.api_version or resolved.credentials.extra_config.get("api_version", "2025-03-01-preview")
     # Caller previously passed llm_model verbatim; runner now uses the resolved
     # model string (which may equal the override when provided).
     llm_model = resolved.model
@@ -289,8 +287,7 @@ async def run_batch_evaluation(
         model_name=llm_model or "",
         temperature=temperature,
         service_account_path=service_account_path,
-        azure_endpoint=azure_endpoint,
-        api_version=api_version,
+        **provider_factory_kwargs(resolved),
     )
     usage_cb = make_usage_callback(
         tenant_id=tenant_id,
@@ -300,8 +297,10 @@ async def run_batch_evaluation(
         owner_id=run_id,
         default_call_purpose='batch_evaluation',
     )
+    # Every thread makes several LLM calls; their logs are written in batches.
+    api_logs = ApiLogBuffer(max_pending=API_LOG_BATCH_SIZE)
     llm: BaseLLMProvider = LoggingLLMWrapper(
-        inner_llm, log_callback=save_api_log, usage_callback=usage_cb,
+        inner_llm, log_callback=api_logs.add, usage_callback=usage_cb,
     )
     if timeouts:
         llm.set_timeouts(timeouts)
@@ -465,11 +464,15 @@ async def run_batch_evaluation(
                             {"role": "assistant", "content": m.final_response_message}
                         )
                     set_usage_call_purpose(worker_llm, 'custom_evaluation')
+                    # Format the thread once for all of its custom evaluators.
+                    resolve_ctx = {
+                        "messages": interleaved,
+                        "chat_transcript": format_chat_transcript(interleaved),
+                    }
 
                     async def _run_one_custom(cev):
                         cev_id = str(cev.id)
                         try:
-                            resolve_ctx = {"messages": interleaved}
                             resolved = resolve_prompt(cev.prompt, resolve_ctx)
                             prompt_text = resolved["prompt"]
                             json_schema = generate_json_schema(cev.output_schema)
@@ -648,8 +651,10 @@ async def run_batch_evaluation(
 
                 return {"is_error": True}
 
+        throttle = ProgressThrottle()
+
         async def _progress_bridge(current: int, total_count: int, message: str):
-            if progress_callback:
+            if progress_callback and throttle.should_write(current, total_count):
                 await progress_callback(job_id, current, total_count, message)
 
         def _progress_message(ok: int, err: int, current: int, tot: int) -> str:
@@ -856,3 +861,9 @@ async def run_batch_evaluation(
             error_message=safe_error_message(e),
         )
         raise
+
+    finally:
+        try:
+            await api_logs.flush()
+        except Exception:
+            logger.warning("Failed to save API logs for run %s", run_id, exc_info=True)
@@ -8,6 +8,7 @@ per-field comparisons and only needs to judge clinical equivalence.
 Path format: index-based for items in API data (rx.medications[0].dosage),
 name-based only for judge-only items (rx.medications[Crocin]).
 """
+import itertools
 import json
 from dataclasses import dataclass
 
@@ -82,7 +83,7 @@ def _stringify(val) -> str:
     if isinstance(val, (list, dict)):
         if not val:
             return "(empty)"
-        return json.dumps(val, ensure_ascii=False)
+        return json.dumps(val, ensure_ascii=False, separators=(",", ":"))
     return str(val)
 
 
@@ -123,11 +124,8 @@ def _compare_array_field(
     api_index = _build_index(api_items, key_field)
     judge_index = _build_index(judge_items, key_field)
 
-    all_keys = list(dict.fromkeys(
-        list(api_index.keys()) + list(judge_index.keys())
-    ))
-
-    for norm_key in all_keys:
+    # Insertion-ordered union: API items first, then judge-only items.
+    for norm_key in dict.fromkeys(itertools.chain(api_index, judge_index)):
         api_entry = api_index.get(norm_key)
         judge_entry = judge_index.get(norm_key)
 
@@ -234,10 +232,10 @@ def _compare_string_array_field(
 ) -> list[ComparisonEntry]:
     """Compare string arrays as ordered lists."""
     entries: list[ComparisonEntry] = []
-    max_len = max(len(api_items), len(judge_items))
-    for i in range(max_len):
-        api_val = _stringify(api_items[i]) if i < len(api_items) else "(empty)"
-        judge_val = _stringify(judge_items[i]) if i < len(judge_items) else "(empty)"
+    # The shorter side pads with None, which _stringify renders as "(empty)".
+    for i, (api_item, judge_item) in enumerate(itertools.zip_longest(api_items, judge_items)):
+        api_val = _stringify(api_item)
+        judge_val = _stringify(judge_item)
         hint = "match" if api_val == judge_val else "mismatch"
         entries.append(ComparisonEntry(
             field_path=f"rx.{field_name}[{i}]",
@@ -327,15 +325,15 @@ def format_comparison_for_prompt(entries: list[ComparisonEntry]) -> str:
     if not entries:
         return "(no structured data fields to compare)"
 
+    # One flat line list joined once; blank entries separate the blocks.
     lines: list[str] = []
     for i, entry in enumerate(entries, 1):
-        block = f"[{i}] FIELD: {entry.field_path}\n"
+        if i > 1:
+            lines.append("")
+        lines.append(f"[{i}] FIELD: {entry.field_path}")
         if entry.item_name:
-            block += f"    ITEM:  {entry.item_name}\n"
-        block += (
-            f"    API:   {entry.api_value}\n"
-            f"    JUDGE: {entry.judge_value}\n"
-            f"    HINT:  {entry.match_hint}"
-        )
-        lines.append(block)
-    return "\n\n".join(lines)
+            lines.append(f"    ITEM:  {entry.item_name}")
+        lines.append(f"    API:   {entry.api_value}")
+        lines.append(f"    JUDGE: {entry.judge_value}")
+        lines.append(f"    HINT:  {entry.match_hint}")
+    return "\n".join(lines)
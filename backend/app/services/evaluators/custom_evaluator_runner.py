@@ -11,8 +11,11 @@ import json
 import logging
 import time
 import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Optional
+from types import SimpleNamespace
+from typing import Optional
 
 from sqlalchemy import select, update
 
@@ -23,20 +26,23 @@ from app.models.eval_run import EvaluationRun
 from app.models.eval_template import EvaluationTemplate
 from app.models.evaluator import Evaluator
 from app.models.application_uploaded_file import ApplicationUploadedFile
+from app.services.access_control import readable_scope_clause
 from app.services.file_storage import file_storage
+from app.services.llm_credentials import ResolvedLlmCall, resolve_llm_call
 from app.services.evaluators.llm_base import (
     BaseLLMProvider, LoggingLLMWrapper, create_llm_provider,
 )
-from app.services.evaluators.prompt_resolver import resolve_prompt
+from app.services.evaluators.prompt_resolver import AUDIO_ATTACHED_MARKER, resolve_prompt
 from app.services.evaluators.schema_generator import generate_json_schema
 from app.services.evaluators.response_parser import _safe_parse_json
 from app.services.evaluators.output_schema_utils import (
     find_primary_field,
     build_visible_breakdown,
 )
+from app.services.evaluators.parallel_engine import run_parallel
 from app.services.evaluators.runner_utils import (
     save_api_log, promote_eval_run_to_running, finalize_eval_run,
-    make_usage_callback,
+    make_usage_callback, provider_factory_kwargs, ProgressThrottle,
 )
 from app.services.job_worker import (
     is_job_cancelled, JobCancelledError, safe_error_message, update_job_progress,
@@ -105,9 +111,60 @@ def _extract_scores(output: dict, output_schema: list[dict]) -> Optional[dict]:
     }
 
 
+# ── LLM Call Resolution ─────────────────────────────────────────────
+
+# Set by run_custom_eval_batch so sibling sub-runs share one resolution per
+# (call_site, provider, model) instead of each going through the resolver.
+_BATCH_RESOLVED_CALLS: ContextVar[dict[tuple, ResolvedLlmCall] | None] = ContextVar(
+    "custom_batch_resolved_calls", default=None,
+)
+
+# Set by run_custom_eval_batch: the batch owns the job's progress row, so
+# sub-runs must not write their own 0/2 and 1/2 steps over it.
+_IN_BATCH: ContextVar[bool] = ContextVar("custom_batch_in_progress", default=False)
+
+
+async def _resolve_llm_call_for_run(
+    tenant_id: uuid.UUID, call_site: str, provider_override: Optional[str], model_override: Optional[str],
+) -> ResolvedLlmCall:
+    memo = _BATCH_RESOLVED_CALLS.get()
+    key = (call_site, provider_override, model_override)
+    if memo is not None and key in memo:
+        return memo[key]
+    async with async_session() as db:
+        resolved = await resolve_llm_call(
+            db, tenant_id, call_site,
+            provider_override=provider_override,
+            model_override=model_override,
+        )
+    if memo is not None:
+        memo[key] = resolved
+    return resolved
+
+
 # ── Single Custom Evaluator ─────────────────────────────────────────
 
 
+async def _finalize_cancelled_run(
+    eval_run_id: uuid.UUID, tenant_id: uuid.UUID, user_id: uuid.UUID, app_id: str, start_time: float,
+) -> None:
+    """Mark a user-cancelled run as cancelled and queue its analytics row."""
+    await finalize_eval_run(
+        eval_run_id,
+        tenant_id,
+        status="cancelled",
+        duration_ms=(time.monotonic() - start_time) * 1000,
+        error_message="Cancelled",
+    )
+    try:
+        from app.services.analytics import submit_analytics_job
+        async with async_session() as db:
+            await submit_analytics_job(db=db, run_id=eval_run_id, app_id=app_id, tenant_id=tenant_id, user_id=user_id)
+            await db.commit()
+    except Exception:
+        logger.warning("Failed to submit analytics job for run %s", eval_run_id, exc_info=True)
+
+
 async def run_custom_evaluator(job_id, params: dict, *, tenant_id: uuid.UUID, user_id: uuid.UUID) -> dict:
     """Execute a custom evaluator on a voice-rx listing or kaira-bot session.
 
@@ -144,11 +201,14 @@ async def run_custom_evaluator(job_id, params: dict, *, tenant_id: uuid.UUID, us
         evaluator_id=uuid.UUID(str(evaluator_id)),
     )
 
+    report_progress = not _IN_BATCH.get()
+
     # Update job progress with run_id for frontend tracking
-    await update_job_progress(
-        job_id, 0, 2, "Loading evaluator...",
-        evaluator_id=str(evaluator_id), run_id=str(eval_run_id),
-    )
+    if report_progress:
+        await update_job_progress(
+            job_id, 0, 2, "Loading evaluator...",
+            evaluator_id=str(evaluator_id), run_id=str(eval_run_id),
+        )
 
     # ── Load evaluator + entity ──────────────────────────────────
     listing = None
@@ -158,9 +218,6 @@ async def run_custom_evaluator(job_id, params: dict, *, tenant_id: uuid.UUID, us
     mime_type = "audio/mpeg"
 
     async with async_session() as db:
-        from types import SimpleNamespace
-        from app.services.access_control import readable_scope_clause
-
         evaluator = await db.scalar(
             select(Evaluator).where(
                 Evaluator.id == evaluator_id,
@@ -215,7 +272,7 @@ async def run_custom_evaluator(job_id, params: dict, *, tenant_id: uuid.UUID, us
 
     # ── Resolve prompt variables ─────────────────────────────────
     if is_session_flow:
-        resolve_ctx = {"messages": messages}
+        resolve_ctx = {"messages": messages, "audio_marker": AUDIO_ATTACHED_MARKER}
     else:
         resolve_ctx = {
             "listing": {
@@ -225,6 +282,7 @@ async def run_custom_evaluator(job_id, params: dict, *, tenant_id: uuid.UUID, us
                 "sourceType": listing.source_type,
                 "apiResponse": listing.api_response,
             },
+            "audio_marker": AUDIO_ATTACHED_MARKER,
         }
     # ── Load prompt & schema from template if linked, else use inline ──
     if evaluator.template_id:
@@ -240,8 +298,8 @@ async def run_custom_evaluator(job_id, params: dict, *, tenant_id: uuid.UUID, us
     resolved = resolve_prompt(raw_prompt, resolve_ctx)
     prompt_text = resolved["prompt"]
 
-    # Fail-fast: unresolved non-audio variables mean the listing is missing required data
-    unresolved = [v for v in resolved["unresolved_variables"] if v != "{{audio}}"]
+    # Fail-fast: unresolved variables mean the listing is missing required data
+    unresolved = resolved["unresolved_variables"]
     if unresolved:
         var_names = ", ".join(unresolved)
         raise ValueError(
@@ -250,35 +308,25 @@ async def run_custom_evaluator(job_id, params: dict, *, tenant_id: uuid.UUID, us
         )
 
     has_audio = "{{audio}}" in raw_prompt and audio_bytes is not None
-    prompt_text = prompt_text.replace("{{audio}}", "[Audio file attached]")
 
     # ── Generate JSON schema from output definition ──────────────
     json_schema = generate_json_schema(output_schema_data)
 
     # ── Resolve LLM credentials ─────────────────────────────────
-    from app.services.llm_credentials import resolve_llm_call
-
     call_site = params.get("call_site") or "chat_text"
     provider_override = params.get("provider")
     model_override = params.get("model") or evaluator.model_id or None
-    async with async_session() as db:
-        resolved = await resolve_llm_call(
-            db, tenant_id, call_site,
-            provider_override=provider_override or None,
-            model_override=model_override,
-        )
+    resolved = await _resolve_llm_call_for_run(
+        tenant_id, call_site, provider_override or None, model_override,
+    )
 
-    factory_kwargs: dict[str, Any] = {}
-    if resolved.provider == "azure_openai":
-        factory_kwargs["azure_endpoint"] = resolved.credentials.extra_config.get("base_url") or ""
-        factory_kwargs["api_version"] = resolved.api_version or resolved.credentials.extra_config.get("api_version", "2025-03-01-preview")
     inner = create_llm_provider(
         provider=resolved.provider,
         api_key=resolved.credentials.secret.get("api_key", ""),
         model_name=resolved.model,
         temperature=0.2,
         service_account_path=resolved.credentials.service_account_path or "",
-        **factory_kwargs,
+        **provider_factory_kwargs(resolved),
     )
     # Remaining downstream code reads `model` / `provider_name`; re-bind to the
     # resolved values so attribution stays consistent with what we executed.
@@ -332,10 +380,11 @@ async def run_custom_evaluator(job_id, params: dict, *, tenant_id: uuid.UUID, us
             raise JobCancelledError("BackgroundJob was cancelled by user")
 
         # Update progress
-        await update_job_progress(
-            job_id, 1, 2, "Running evaluator...",
-            evaluator_id=str(evaluator_id), run_id=str(eval_run_id),
-        )
+        if report_progress:
+            await update_job_progress(
+                job_id, 1, 2, "Running evaluator...",
+                evaluator_id=str(evaluator_id), run_id=str(eval_run_id),
+            )
 
         # ── Call LLM ─────────────────────────────────────────────
         if has_audio and audio_bytes:
@@ -385,23 +434,27 @@ async def run_custom_evaluator(job_id, params: dict, *, tenant_id: uuid.UUID, us
             logger.warning("Failed to submit analytics job for run %s", eval_run_id, exc_info=True)
 
     except JobCancelledError:
-        await finalize_eval_run(
-            eval_run_id,
-            tenant_id,
-            status="cancelled",
-            duration_ms=(time.monotonic() - start_time) * 1000,
-            error_message="Cancelled",
-        )
-        try:
-            from app.services.analytics import submit_analytics_job
-            async with async_session() as db:
-                await submit_analytics_job(db=db, run_id=eval_run_id, app_id=app_id, tenant_id=tenant_id, user_id=user_id)
-                await db.commit()
-        except Exception:
-            logger.warning("Failed to submit analytics job for run %s", eval_run_id, exc_info=True)
+        await _finalize_cancelled_run(eval_run_id, tenant_id, user_id, app_id, start_time)
         logger.info("Custom evaluator %s cancelled for %s", evaluator_id, entity_ref)
         raise
 
+    # run_parallel cancels in-flight batch siblings as soon as one sees the job
+    # cancelled, so their rows must not stay 'running'. Any other task
+    # cancellation (worker shutdown, outer timeout) is not a user cancel: the
+    # run is left to recover_stale_eval_runs once the job reaches a terminal state.
+    except asyncio.CancelledError:
+        if await asyncio.shield(is_job_cancelled(job_id, tenant_id=tenant_id)):
+            await asyncio.shield(
+                _finalize_cancelled_run(eval_run_id, tenant_id, user_id, app_id, start_time)
+            )
+            logger.info("Custom evaluator %s cancelled for %s", evaluator_id, entity_ref)
+        else:
+            logger.warning(
+                "Custom evaluator %s interrupted for %s; leaving run %s to recovery",
+                evaluator_id, entity_ref, eval_run_id,
+            )
+        raise
+
     except Exception as e:
         error_msg = safe_error_message(e)
         await finalize_eval_run(
@@ -432,6 +485,17 @@ async def run_custom_evaluator(job_id, params: dict, *, tenant_id: uuid.UUID, us
 # ── Batch Custom Evaluator ───────────────────────────────────────────
 # Merged from voice_rx_batch_custom_runner.py
 
+# Keeps each IN (...) list well under Postgres' bind-parameter limit.
+_VALIDATION_CHUNK_SIZE = 1000
+# Caps concurrent sub-runs so large batches don't exhaust the DB pool or LLM quota.
+_DEFAULT_BATCH_CONCURRENCY = 8
+
+
+@dataclass
+class _BatchTally:
+    completed: int = 0
+    errors: int = 0
+
 
 async def run_custom_eval_batch(job_id, params: dict, *, tenant_id: uuid.UUID, user_id: uuid.UUID) -> dict:
     """Run multiple custom evaluators on a single listing/session.
@@ -442,6 +506,7 @@ async def run_custom_eval_batch(job_id, params: dict, *, tenant_id: uuid.UUID, u
         session_id: str           - UUID of session (kaira-bot) — optional
         app_id: str               - "voice-rx" or "kaira-bot"
         parallel: bool            - Run evaluators in parallel (default: True)
+        concurrency: int          - Max evaluators in flight when parallel (default: 8)
         timeouts: dict            - LLM timeout config
     """
     evaluator_ids = params["evaluator_ids"]
@@ -450,23 +515,23 @@ async def run_custom_eval_batch(job_id, params: dict, *, tenant_id: uuid.UUID, u
     app_id = params.get("app_id", "voice-rx")
     parallel = params.get("parallel", True)
 
-    # Validate evaluators exist and are accessible
-    async with async_session() as db:
-        from types import SimpleNamespace
-        from app.services.access_control import readable_scope_clause
+    # One session for validation and every batch-level progress write
+    async with async_session() as batch_db:
+        scope = readable_scope_clause(
+            Evaluator,
+            SimpleNamespace(tenant_id=tenant_id, user_id=user_id, app_access=frozenset()),
+        )
+        found: set[str] = set()
+        for start in range(0, len(evaluator_ids), _VALIDATION_CHUNK_SIZE):
+            chunk = evaluator_ids[start:start + _VALIDATION_CHUNK_SIZE]
+            rows = await batch_db.scalars(
+                select(Evaluator.id).where(Evaluator.id.in_(chunk), scope)
+            )
+            found.update(str(row) for row in rows)
 
         valid_ids = []
         for eid in evaluator_ids:
-            ev = await db.scalar(
-                select(Evaluator).where(
-                    Evaluator.id == eid,
-                    readable_scope_clause(
-                        Evaluator,
-                        SimpleNamespace(tenant_id=tenant_id, user_id=user_id, app_access=frozenset()),
-                    ),
-                )
-            )
-            if ev:
+            if str(eid).lower() in found:
                 valid_ids.append(eid)
             else:
                 logger.warning("Evaluator %s not found or not accessible, skipping", eid)
@@ -474,83 +539,91 @@ async def run_custom_eval_batch(job_id, params: dict, *, tenant_id: uuid.UUID, u
         if not valid_ids:
             raise ValueError("No valid evaluators found")
 
-    total = len(valid_ids)
-    completed = 0
-    errors = 0
-    eval_run_ids: list[str] = []
-    first_run_id_written = False
-
-    await update_job_progress(job_id, 0, total, f"Starting {total} evaluators...")
-
-    async def _run_one(eid: str, index: int) -> dict:
-        """Run one evaluator, creating its own EvaluationRun via run_custom_evaluator."""
-        nonlocal completed, errors, first_run_id_written
+        total = len(valid_ids)
+        concurrency = max(1, int(params.get("concurrency") or _DEFAULT_BATCH_CONCURRENCY)) if parallel else 1
+        tally = _BatchTally()
+        eval_run_ids: list[str] = []
+        first_run_id: str | None = None
+
+        await update_job_progress(job_id, 0, total, f"Starting {total} evaluators...", db=batch_db)
+
+        async def _run_one(_index: int, eid: str) -> dict:
+            """Run one evaluator, creating its own EvaluationRun via run_custom_evaluator."""
+            nonlocal first_run_id
+
+            sub_params = {
+                "evaluator_id": eid,
+                "app_id": app_id,
+                "thinking": params.get("thinking", "low"),
+                "timeouts": params.get("timeouts"),
+                "provider": params.get("provider"),
+                "model": params.get("model"),
+            }
+            if listing_id:
+                sub_params["listing_id"] = listing_id
+            if session_id:
+                sub_params["session_id"] = session_id
 
-        if await is_job_cancelled(job_id, tenant_id=tenant_id):
-            raise JobCancelledError("Batch cancelled")
-
-        sub_params = {
-            "evaluator_id": eid,
-            "app_id": app_id,
-            "thinking": params.get("thinking", "low"),
-            "timeouts": params.get("timeouts"),
-            "provider": params.get("provider"),
-            "model": params.get("model"),
-        }
-        if listing_id:
-            sub_params["listing_id"] = listing_id
-        if session_id:
-            sub_params["session_id"] = session_id
-
-        try:
-            result = await run_custom_evaluator(job_id=job_id, params=sub_params, tenant_id=tenant_id, user_id=user_id)
-            run_id = result.get("eval_run_id")
-            if run_id:
-                eval_run_ids.append(run_id)
-
-            # Write first completed run_id to job progress so frontend can redirect
-            if run_id and not first_run_id_written:
-                first_run_id_written = True
-                await update_job_progress(
-                    job_id, completed + 1, total,
-                    f"Completed {completed + 1}/{total}...",
-                    run_id=run_id,
-                )
-
-            completed += 1
-            return result
-        except JobCancelledError:
-            raise
-        except Exception as e:
-            errors += 1
-            logger.error("Batch custom eval %s failed: %s", eid, e)
-            return {"evaluator_id": eid, "status": "failed", "error": safe_error_message(e)}
-
-    try:
-        if parallel:
-            tasks = [asyncio.create_task(_run_one(eid, i)) for i, eid in enumerate(valid_ids)]
             try:
-                await asyncio.gather(*tasks)
+                result = await run_custom_evaluator(job_id=job_id, params=sub_params, tenant_id=tenant_id, user_id=user_id)
+                run_id = result.get("eval_run_id")
+                if run_id:
+                    eval_run_ids.append(run_id)
+                    first_run_id = first_run_id or run_id
+                tally.completed += 1
+                return result
             except JobCancelledError:
-                for t in tasks:
-                    if not t.done():
-                        t.cancel()
-                await asyncio.gather(*tasks, return_exceptions=True)
                 raise
-        else:
-            for i, eid in enumerate(valid_ids):
-                await update_job_progress(job_id, i, total, f"Running evaluator {i + 1}/{total}...")
-                await _run_one(eid, i)
-
-        await update_job_progress(job_id, total, total, f"Completed: {completed} success, {errors} failed")
+            except Exception as e:
+                tally.errors += 1
+                logger.error("Batch custom eval %s failed: %s", eid, e)
+                return {"evaluator_id": eid, "status": "failed", "error": safe_error_message(e)}
+
+        throttle = ProgressThrottle()
+        progress_lock = asyncio.Lock()
+        run_id_written = False
+
+        async def _progress(current: int, total_count: int, message: str) -> None:
+            nonlocal run_id_written
+            # First completed run_id lets the frontend redirect while the rest finish,
+            # so it bypasses the throttle once.
+            first_write_with_run_id = first_run_id is not None and not run_id_written
+            if not throttle.should_write(current, total_count, force=first_write_with_run_id):
+                return
+            extra = {"run_id": first_run_id} if first_run_id else {}
+            # run_parallel awaits this from concurrent workers; the session is not task-safe.
+            async with progress_lock:
+                await update_job_progress(job_id, current, total_count, message, db=batch_db, **extra)
+            if first_run_id:
+                run_id_written = True
+
+        resolved_calls_token = _BATCH_RESOLVED_CALLS.set({})
+        in_batch_token = _IN_BATCH.set(True)
+        try:
+            await run_parallel(
+                valid_ids,
+                _run_one,
+                concurrency=concurrency,
+                job_id=job_id,
+                tenant_id=tenant_id,
+                progress_callback=_progress,
+                progress_message=lambda _ok, _err, current, tot: f"Completed {current}/{tot}...",
+            )
+            await update_job_progress(
+                job_id, total, total, f"Completed: {tally.completed} success, {tally.errors} failed",
+                db=batch_db,
+            )
 
-    except JobCancelledError:
-        logger.info("Batch custom eval cancelled at %d/%d", completed, total)
-        raise
+        except JobCancelledError:
+            logger.info("Batch custom eval cancelled at %d/%d", tally.completed, total)
+            raise
+        finally:
+            _IN_BATCH.reset(in_batch_token)
+            _BATCH_RESOLVED_CALLS.reset(resolved_calls_token)
 
     return {
         "total": total,
-        "completed": completed,
-        "errors": errors,
+        "completed": tally.completed,
+        "errors": tally.errors,
         "eval_run_ids": eval_run_ids,
     }
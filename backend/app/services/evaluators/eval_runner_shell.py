@@ -39,7 +39,9 @@ from app.services.evaluators.runner_utils import (
     finalize_eval_run,
     make_usage_callback,
     promote_eval_run_to_running,
+    provider_factory_kwargs,
     save_api_log,
+    ProgressThrottle,
 )
 from app.services.evaluators.parallel_engine import run_parallel
 from app.services.evaluators.selection import (
@@ -303,21 +305,13 @@ async def run_eval(
             provider_override=params.llm_config.provider or None,
             model_override=params.llm_config.model or None,
         )
-    provider_kwargs: dict[str, Any] = {}
-    if resolved.provider == "azure_openai":
-        provider_kwargs["azure_endpoint"] = resolved.credentials.extra_config.get("base_url") or ""
-        provider_kwargs["api_version"] = (
-            resolved.api_version
-            or resolved.credentials.extra_config.get("api_version")
-            or "2025-03-01-preview"
-        )
     provider = create_llm_provider(
         provider=resolved.provider,
         api_key=resolved.credentials.secret.get("api_key", ""),
         model_name=resolved.model,
         temperature=params.llm_config.temperature,
         service_account_path=resolved.credentials.service_account_path or "",
-        **provider_kwargs,
+        **provider_factory_kwargs(resolved),
     )
     usage_cb = make_usage_callback(
         tenant_id=tenant_id,
@@ -428,8 +422,11 @@ async def run_eval(
     def _msg(ok: int, err: int, current: int, tot: int) -> str:
         return f"Record {current}/{tot} ({ok} ok, {err} errors)"
 
+    throttle = ProgressThrottle()
+
     async def _progress_cb(current: int, total_count: int, message: str) -> None:
-        await update_job_progress(job_id, current, total_count, message)
+        if throttle.should_write(current, total_count):
+            await update_job_progress(job_id, current, total_count, message)
 
     try:
         results = await run_parallel(
@@ -4,6 +4,7 @@ All hardcoded prompts, schemas, display names, and normalization templates
 for both upload and API flows. Separated from voice_rx_runner.py for
 maintainability.
 """
+import functools
 
 # ═══════════════════════════════════════════════════════════════
 # SCRIPT DISPLAY NAMES
@@ -37,11 +38,12 @@ SCRIPT_DISPLAY_NAMES = {
 }
 
 
+@functools.lru_cache(maxsize=128)
 def resolve_script_name(script_id: str) -> str:
     """Convert a script ID to a human-readable name for use in prompts."""
     if not script_id or script_id == "auto":
         return ""  # Caller handles auto case
-    return SCRIPT_DISPLAY_NAMES.get(script_id, script_id.title())
+    return SCRIPT_DISPLAY_NAMES.get(script_id) or script_id.title()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -49,6 +51,7 @@ def resolve_script_name(script_id: str) -> str:
 # ═══════════════════════════════════════════════════════════════
 
 
+@functools.lru_cache(maxsize=64)
 def build_transcription_system_prompt(script_display: str, language: str) -> str:
     """Build a system prompt for the transcription (judge) call.
 
@@ -143,8 +146,33 @@ INPUT TRANSCRIPT:
 OUTPUT: Return the transliterated transcript text. ALL text MUST be in {target_script} script."""
 
 
+_NORMALIZATION_PROMPT_SPLIT = NORMALIZATION_PROMPT.replace("{transcript_json}", "{transcript}")
+_NORMALIZATION_PROMPT_PLAIN_SPLIT = NORMALIZATION_PROMPT_PLAIN.replace("{transcript_text}", "{transcript}")
+
+
+@functools.lru_cache(maxsize=64)
+def _normalization_prompt_frame(template: str, target_script: str, source_instruction: str, language: str) -> tuple[str, str]:
+    """Format everything around the transcript slot once per script/language."""
+    head, tail = template.split("{transcript}")
+    fmt = dict(target_script=target_script, source_instruction=source_instruction, language=language)
+    return head.format(**fmt), tail.format(**fmt)
+
+
+def build_normalization_prompt(
+    transcript: str, target_script: str, source_instruction: str, language: str, *, plain: bool = False,
+) -> str:
+    """Assemble a normalization prompt; batches of one transcript share the cached frame."""
+    template = _NORMALIZATION_PROMPT_PLAIN_SPLIT if plain else _NORMALIZATION_PROMPT_SPLIT
+    head, tail = _normalization_prompt_frame(template, target_script, source_instruction, language)
+    return "".join((head, transcript, tail))
+
+
+@functools.lru_cache(maxsize=64)
 def build_normalization_schema(target_script: str) -> dict:
-    """Build normalization schema with target script constraint in text description."""
+    """Build normalization schema with target script constraint in text description.
+
+    Cached per script name; callers must treat the returned dict as read-only.
+    """
     return {
         "type": "object",
         "properties": {
@@ -166,8 +194,12 @@ def build_normalization_schema(target_script: str) -> dict:
     }
 
 
+@functools.lru_cache(maxsize=64)
 def build_normalization_schema_plain(target_script: str) -> dict:
-    """Build plain-text normalization schema with target script constraint."""
+    """Build plain-text normalization schema with target script constraint.
+
+    Cached per script name; callers must treat the returned dict as read-only.
+    """
     return {
         "type": "object",
         "properties": {
@@ -184,22 +216,18 @@ def build_normalization_schema_plain(target_script: str) -> dict:
 # UPLOAD FLOW — EVALUATION PROMPT & SCHEMA
 # ═══════════════════════════════════════════════════════════════
 
-UPLOAD_EVALUATION_PROMPT = """You are an expert medical transcription auditor acting as a JUDGE.
+# Static rubric first, per-run table last: the byte-stable prefix is what
+# provider prompt caches (OpenAI automatic, Anthropic cache_control) reuse.
+UPLOAD_EVALUATION_PROMPT_PREFIX = """You are an expert medical transcription auditor acting as a JUDGE.
 
 ═══════════════════════════════════════════════════════════════════════════════
 TASK: SEGMENT-BY-SEGMENT TRANSCRIPT COMPARISON
 ═══════════════════════════════════════════════════════════════════════════════
 
-Below is a pre-built comparison table with {segment_count} segments. Each row pairs the ORIGINAL transcript segment (system under test) with the JUDGE transcript segment (your reference from Call 1). Both cover the EXACT same time window.
+At the end of this prompt is a pre-built comparison table. Each row pairs the ORIGINAL transcript segment (system under test) with the JUDGE transcript segment (your reference from Call 1). Both cover the EXACT same time window.
 
 Your job: For each segment, determine if there is a meaningful discrepancy. If the segments essentially match, do NOT include that segment in your output — only report segments with actual discrepancies.
 
-═══════════════════════════════════════════════════════════════════════════════
-SEGMENT COMPARISON TABLE
-═══════════════════════════════════════════════════════════════════════════════
-
-{comparison_table}
-
 ═══════════════════════════════════════════════════════════════════════════════
 SEVERITY CLASSIFICATION
 ═══════════════════════════════════════════════════════════════════════════════
@@ -229,7 +257,33 @@ OUTPUT RULES
 - Segments not in your output are assumed to be matches
 - For each discrepancy segment, provide: segmentIndex, severity, discrepancy description, likelyCorrect (original/judge/both/unclear), confidence, and category
 - Provide an overallAssessment summarizing transcript quality
-- Output structure is controlled by the schema — just provide the data"""
+- Output structure is controlled by the schema — just provide the data
+"""
+
+UPLOAD_EVALUATION_PROMPT_SUFFIX = """
+═══════════════════════════════════════════════════════════════════════════════
+SEGMENT COMPARISON TABLE ({segment_count} segments)
+═══════════════════════════════════════════════════════════════════════════════
+
+{comparison_table}"""
+
+UPLOAD_EVALUATION_PROMPT = UPLOAD_EVALUATION_PROMPT_PREFIX + UPLOAD_EVALUATION_PROMPT_SUFFIX
+
+# The per-run table is always last, so the suffix splits once at import into
+# a head that only needs the count; the (large) table is appended verbatim.
+_UPLOAD_SUFFIX_HEAD, _UPLOAD_SUFFIX_TAIL = UPLOAD_EVALUATION_PROMPT_SUFFIX.split("{comparison_table}")
+_UPLOAD_SUFFIX_HEAD = _UPLOAD_SUFFIX_HEAD.replace("{segment_count}", "%d")
+
+
+def build_upload_evaluation_prompt(segment_count: int, comparison_table: str) -> str:
+    """Assemble the upload critique prompt; the rubric prefix stays byte-stable."""
+    return "".join((
+        UPLOAD_EVALUATION_PROMPT_PREFIX,
+        _UPLOAD_SUFFIX_HEAD % segment_count,
+        comparison_table,
+        _UPLOAD_SUFFIX_TAIL,
+    ))
+
 
 UPLOAD_EVALUATION_SCHEMA = {
     "type": "object",
@@ -271,16 +325,15 @@ UPLOAD_EVALUATION_SCHEMA = {
 # API FLOW — EVALUATION PROMPT & SCHEMA
 # ═══════════════════════════════════════════════════════════════
 
-API_EVALUATION_PROMPT = """You are an expert Medical Informatics Auditor evaluating rx JSON accuracy.
+API_EVALUATION_PROMPT_PREFIX = """You are an expert Medical Informatics Auditor evaluating rx JSON accuracy.
 
 ═══════════════════════════════════════════════════════════════════════════════
 TASK: JUDGE PRE-ALIGNED FIELD COMPARISONS
 ═══════════════════════════════════════════════════════════════════════════════
 
-Below is a server-built comparison. Section 1 compares transcripts. Section 2
-lists individual structured-data fields, already matched and aligned for you.
-
-{comparison}
+At the end of this prompt is a server-built comparison. Section 1 compares
+transcripts. Section 2 lists individual structured-data fields, already matched
+and aligned for you.
 
 ═══════════════════════════════════════════════════════════════════════════════
 YOUR JOB
@@ -311,7 +364,25 @@ OUTPUT RULES
 - Use the EXACT fieldPath string from the comparison data
 - Copy apiValue and judgeValue as-is from the comparison
 - Provide an overallAssessment summarizing API quality
-- Output structure is controlled by the schema — just provide the data"""
+- Output structure is controlled by the schema — just provide the data
+"""
+
+API_EVALUATION_PROMPT_SUFFIX = """
+═══════════════════════════════════════════════════════════════════════════════
+COMPARISON
+═══════════════════════════════════════════════════════════════════════════════
+
+{comparison}"""
+
+API_EVALUATION_PROMPT = API_EVALUATION_PROMPT_PREFIX + API_EVALUATION_PROMPT_SUFFIX
+
+_API_SUFFIX_HEAD, _API_SUFFIX_TAIL = API_EVALUATION_PROMPT_SUFFIX.split("{comparison}")
+
+
+def build_api_evaluation_prompt(comparison: str) -> str:
+    """Assemble the API critique prompt; the rubric prefix stays byte-stable."""
+    return "".join((API_EVALUATION_PROMPT_PREFIX, _API_SUFFIX_HEAD, comparison, _API_SUFFIX_TAIL))
+
 
 API_EVALUATION_SCHEMA = {
     "type": "object",
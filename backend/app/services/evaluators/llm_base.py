@@ -4,10 +4,12 @@ Ported from kaira-evals/src/llm/ — converted to async using asyncio.to_thread
 to wrap the sync SDK calls (both google-genai and openai SDKs are sync).
 """
 import asyncio
+import functools
+import io
 import json
 import logging
+import os
 import random
-import tempfile
 import time
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, Tuple, Type
@@ -36,6 +38,51 @@ _MAX_TIMEOUT = 600
 VALID_TIMEOUT_KEYS = {"text_only", "with_schema", "with_audio", "with_audio_and_schema"}
 
 
+@functools.lru_cache(maxsize=32)
+def _read_service_account_file(path: str, mtime_ns: int, size: int) -> str:
+    with open(path) as f:
+        return f.read()
+
+
+# One pooled httpx client per SDK for the process: provider objects are built
+# per pipeline step, and each SDK client would otherwise open its own TLS pool.
+@functools.lru_cache(maxsize=1)
+def _shared_openai_http_client():
+    from openai import DefaultHttpxClient
+    return DefaultHttpxClient()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_anthropic_http_client():
+    from anthropic import DefaultHttpxClient
+    return DefaultHttpxClient()
+
+
+# Rendered schema text keyed by dict identity: critique/normalization schemas
+# are shared read-only constants, so each is rendered once instead of per
+# call and per retry. The stored dict pins the id against reuse.
+_SCHEMA_TEXT_CACHE: dict[int, Tuple[dict, str]] = {}
+_SCHEMA_TEXT_CACHE_MAX = 64
+
+
+def _schema_text(json_schema: dict) -> str:
+    """Return ``json_schema`` as compact JSON for inclusion in a prompt."""
+    entry = _SCHEMA_TEXT_CACHE.get(id(json_schema))
+    if entry is not None and entry[0] is json_schema:
+        return entry[1]
+    text = json.dumps(json_schema, ensure_ascii=False, separators=(",", ":"))
+    if len(_SCHEMA_TEXT_CACHE) >= _SCHEMA_TEXT_CACHE_MAX:
+        _SCHEMA_TEXT_CACHE.clear()
+    _SCHEMA_TEXT_CACHE[id(json_schema)] = (json_schema, text)
+    return text
+
+
+def _load_service_account_json(path: str) -> str:
+    """Return a service-account file's JSON text, re-reading only when the file changes."""
+    stat = os.stat(path)
+    return _read_service_account_file(path, stat.st_mtime_ns, stat.st_size)
+
+
 class BaseLLMProvider(ABC):
     """Abstract base class for async LLM providers."""
 
@@ -212,24 +259,21 @@ class GeminiProvider(BaseLLMProvider):
         http_opts = genai_types.HttpOptions(retry_options=retry_opts)
 
         if service_account_path:
-            from pathlib import Path
-            sa_path = Path(service_account_path)
-            if sa_path.exists():
-                import json as _json
-                from google.oauth2 import service_account as sa_module
-                with open(sa_path) as f:
-                    sa_info = _json.load(f)
-                project_id = sa_info.get("project_id", "")
-                credentials = sa_module.Credentials.from_service_account_info(
-                    sa_info, scopes=["https://www.googleapis.com/auth/cloud-platform"],
-                )
-                self.client = genai.Client(
-                    vertexai=True, project=project_id, credentials=credentials,
-                    http_options=http_opts,
-                )
-                self.auth_method = "service_account"
-            else:
-                raise FileNotFoundError(f"Service account file not found: {sa_path}")
+            try:
+                sa_json = _load_service_account_json(service_account_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Service account file not found: {service_account_path}") from None
+            from google.oauth2 import service_account as sa_module
+            sa_info = json.loads(sa_json)
+            project_id = sa_info.get("project_id", "")
+            credentials = sa_module.Credentials.from_service_account_info(
+                sa_info, scopes=["https://www.googleapis.com/auth/cloud-platform"],
+            )
+            self.client = genai.Client(
+                vertexai=True, project=project_id, credentials=credentials,
+                http_options=http_opts,
+            )
+            self.auth_method = "service_account"
         elif api_key:
             self.client = genai.Client(api_key=api_key, http_options=http_opts)
             self.auth_method = "api_key"
@@ -413,45 +457,32 @@ class GeminiProvider(BaseLLMProvider):
         existing upload-and-poll flow which handles large files better.
         """
         from google.genai import types
-        import os
 
         if self.auth_method == "service_account":
             # Vertex AI: inline bytes — no Files API available
             audio_part = types.Part.from_bytes(data=audio_bytes, mime_type=mime_type)
         else:
-            # Developer API: upload via Files API + poll until ACTIVE
-            suffix = ".mp3"
-            if "wav" in mime_type:
-                suffix = ".wav"
-            elif "ogg" in mime_type:
-                suffix = ".ogg"
-            elif "mp4" in mime_type or "m4a" in mime_type:
-                suffix = ".m4a"
-            elif "webm" in mime_type:
-                suffix = ".webm"
-
-            tmp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
-            try:
-                tmp.write(audio_bytes)
-                tmp.close()
-
-                uploaded_file = self.client.files.upload(file=tmp.name)
-
-                poll_start = time.monotonic()
-                while uploaded_file.state and uploaded_file.state.name != "ACTIVE":
-                    if time.monotonic() - poll_start > 30:
-                        raise TimeoutError(
-                            f"File upload timed out after 30s (state={uploaded_file.state.name})"
-                        )
-                    time.sleep(1)
-                    uploaded_file = self.client.files.get(name=uploaded_file.name)
-
-                audio_part = types.Part.from_uri(
-                    file_uri=uploaded_file.uri,
-                    mime_type=uploaded_file.mime_type or mime_type,
-                )
-            finally:
-                os.unlink(tmp.name)
+            # Developer API: upload via Files API + poll until ACTIVE. The
+            # bytes are uploaded from memory; a temp-file copy of a long
+            # recording would add a disk write and read-back per call.
+            uploaded_file = self.client.files.upload(
+                file=io.BytesIO(audio_bytes),
+                config=types.UploadFileConfig(mime_type=mime_type),
+            )
+
+            poll_start = time.monotonic()
+            while uploaded_file.state and uploaded_file.state.name != "ACTIVE":
+                if time.monotonic() - poll_start > 30:
+                    raise TimeoutError(
+                        f"File upload timed out after 30s (state={uploaded_file.state.name})"
+                    )
+                time.sleep(1)
+                uploaded_file = self.client.files.get(name=uploaded_file.name)
+
+            audio_part = types.Part.from_uri(
+                file_uri=uploaded_file.uri,
+                mime_type=uploaded_file.mime_type or mime_type,
+            )
 
         # Prompt first, audio second — model reads text instructions (including
         # script constraints) before processing the audio signal, reducing the
@@ -539,21 +570,19 @@ class VertexProvider(GeminiProvider):
         # Per-tenant SA arrives via service_account_path (same handoff as the
         # env-var SA); read it into the in-memory JSON the rest of __init__ uses.
         if not service_account_json and service_account_path:
-            with open(service_account_path) as _sa_file:
-                service_account_json = _sa_file.read()
+            service_account_json = _load_service_account_json(service_account_path)
         if not service_account_json:
             raise ValueError(
                 "VertexProvider requires service_account_json or service_account_path"
             )
 
-        import json as _json
         from google import genai
         from google.genai import types as genai_types
         from google.oauth2 import service_account as sa_module
 
         try:
-            sa_info = _json.loads(service_account_json)
-        except _json.JSONDecodeError as exc:
+            sa_info = json.loads(service_account_json)
+        except json.JSONDecodeError as exc:
             raise ValueError(f"service_account_json is not valid JSON: {exc}") from exc
         derived_project = project_id or sa_info.get("project_id", "")
         if not derived_project:
@@ -592,7 +621,7 @@ class OpenAIProvider(BaseLLMProvider):
     def __init__(self, api_key: str, model_name: str = "", temperature: float = 1.0):
         super().__init__(api_key, model_name, temperature)
         from openai import OpenAI
-        self.client = OpenAI(api_key=api_key, max_retries=4)
+        self.client = OpenAI(api_key=api_key, max_retries=4, http_client=_shared_openai_http_client())
 
         from openai import (
             APIConnectionError, APITimeoutError,
@@ -769,6 +798,7 @@ class AzureOpenAIProvider(OpenAIProvider):
             api_version=api_version,
             azure_endpoint=azure_endpoint,
             max_retries=4,
+            http_client=_shared_openai_http_client(),
         )
 
         from openai import (
@@ -788,7 +818,7 @@ class AnthropicProvider(BaseLLMProvider):
     def __init__(self, api_key: str, model_name: str = "", temperature: float = 1.0):
         super().__init__(api_key, model_name, temperature)
         from anthropic import Anthropic
-        self.client = Anthropic(api_key=api_key, max_retries=4)
+        self.client = Anthropic(api_key=api_key, max_retries=4, http_client=_shared_anthropic_http_client())
 
         from anthropic import (
             APIConnectionError, APITimeoutError,
@@ -840,16 +870,32 @@ class AnthropicProvider(BaseLLMProvider):
         text = response.content[0].text if response.content else ""
         return text, tokens_in, tokens_out, meta
 
-    def _sync_generate_json(self, prompt, system_prompt, json_schema):
+    SUPPORTS_PROMPT_CACHE = True
+
+    def _user_content(self, prompt, cache_prefix):
+        """Mark a stable leading ``cache_prefix`` of ``prompt`` as a cache breakpoint."""
+        if (
+            not self.SUPPORTS_PROMPT_CACHE
+            or not cache_prefix
+            or len(prompt) <= len(cache_prefix)
+            or not prompt.startswith(cache_prefix)
+        ):
+            return prompt
+        return [
+            {"type": "text", "text": cache_prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": prompt[len(cache_prefix):]},
+        ]
+
+    def _sync_generate_json(self, prompt, system_prompt, json_schema, cache_prefix=None):
         json_instruction = "Respond with valid JSON only. No markdown fences, no extra text."
         if json_schema:
-            json_instruction += f"\n\nJSON Schema:\n{json.dumps(json_schema, indent=2)}"
+            json_instruction += f"\n\nJSON Schema:\n{_schema_text(json_schema)}"
         full_system = f"{system_prompt}\n\n{json_instruction}" if system_prompt else json_instruction
 
         kwargs = {
             "model": self.model_name,
             "max_tokens": 16384,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": [{"role": "user", "content": self._user_content(prompt, cache_prefix)}],
             "temperature": self.temperature,
             "system": full_system,
         }
@@ -882,6 +928,7 @@ class AnthropicProvider(BaseLLMProvider):
         try:
             data, self._last_tokens_in, self._last_tokens_out, self._last_metadata = await self._with_retry(
                 self._sync_generate_json, prompt, system_prompt, json_schema,
+                kwargs.get("cache_prefix"),
                 per_attempt_timeout=timeout,
             )
             return data
@@ -902,6 +949,9 @@ class BedrockProvider(AnthropicProvider):
     selection in the request path.
     """
 
+    # Bedrock-hosted Claude only honours cache_control on some models.
+    SUPPORTS_PROMPT_CACHE = False
+
     def __init__(
         self,
         access_key_id: str,
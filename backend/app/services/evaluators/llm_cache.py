@@ -0,0 +1,116 @@
+"""Tenant-scoped exact-match cache for expensive LLM responses.
+
+Two tiers sit in front of the LLM call:
+  1. In-process TTLCache — serves back-to-back reruns in the same worker
+     without a DB round trip; an entry never outlives its row's ``expires_at``.
+  2. Postgres cache tables (cache_transcription, cache_critique) — shared
+     across workers, expired via ``expires_at`` and pruned by
+     ``prune_expired_responses``.
+
+Keys are sha256 over every input that shapes the request (see
+``request_cache_key``), so any prompt, schema, model or audio change misses.
+Cache failures are logged and treated as misses; they never fail a run.
+"""
+import copy
+import hashlib
+import json
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.database import async_session, read_session
+from app.models.cache_critique import CacheCritique
+from app.models.cache_transcription import CacheTranscription
+from app.services.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Transcription responses run to tens of KB, so the hot tier stays small.
+_HOT_TIER: TTLCache[tuple, tuple[Any, datetime]] = TTLCache(ttl_seconds=600, max_entries=64, name="llm_response_cache")
+
+# Tables swept by prune_expired_responses.
+_CACHE_MODELS = (CacheTranscription, CacheCritique)
+
+
+class _CacheMiss(Exception):
+    pass
+
+
+def request_cache_key(*parts) -> str:
+    """Stable sha256 over JSON-serialisable request inputs."""
+    request = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+
+async def read_cached_response(cache_model, tenant_id: uuid.UUID, cache_key: str):
+    """Return a fresh cached response from ``cache_model``, or None on miss/error."""
+
+    async def _load():
+        async with read_session() as db:
+            row = (await db.execute(
+                select(cache_model.response, cache_model.expires_at).where(
+                    cache_model.cache_key == cache_key,
+                    cache_model.tenant_id == tenant_id,
+                    cache_model.expires_at > datetime.now(timezone.utc),
+                )
+            )).first()
+        if row is None:
+            raise _CacheMiss
+        return row.response, row.expires_at
+
+    hot_key = (cache_model.__tablename__, tenant_id, cache_key)
+    try:
+        response, expires_at = await _HOT_TIER.get_or_load(hot_key, _load)
+    except _CacheMiss:
+        return None
+    except Exception:
+        logger.warning("%s lookup failed", cache_model.__tablename__, exc_info=True)
+        return None
+    # The hot tier's TTL can outlive the row; the row's expiry wins.
+    if expires_at <= datetime.now(timezone.utc):
+        _HOT_TIER.invalidate(hot_key)
+        return None
+    # Callers stamp run metadata onto dict responses; keep the cached copy pristine.
+    return copy.deepcopy(response)
+
+
+async def write_cached_response(
+    cache_model, tenant_id: uuid.UUID, cache_key: str, response, ttl: timedelta,
+) -> None:
+    """Store a response; concurrent writers for one key keep the first."""
+    expires_at = datetime.now(timezone.utc) + ttl
+    _HOT_TIER.set((cache_model.__tablename__, tenant_id, cache_key), (copy.deepcopy(response), expires_at))
+    try:
+        async with async_session() as db:
+            await db.execute(
+                pg_insert(cache_model)
+                .values(
+                    cache_key=cache_key,
+                    tenant_id=tenant_id,
+                    response=response,
+                    expires_at=expires_at,
+                )
+                .on_conflict_do_nothing(index_elements=["cache_key", "tenant_id"])
+            )
+            await db.commit()
+    except Exception:
+        logger.warning("%s write failed", cache_model.__tablename__, exc_info=True)
+
+
+async def prune_expired_responses() -> int:
+    """Delete expired cache rows. Called from the recovery loop."""
+    now = datetime.now(timezone.utc)
+    pruned = 0
+    async with async_session() as db:
+        for cache_model in _CACHE_MODELS:
+            result = await db.execute(delete(cache_model).where(cache_model.expires_at < now))
+            if result.rowcount:
+                logger.info("Pruned %d expired %s rows", result.rowcount, cache_model.__tablename__)
+                pruned += result.rowcount
+        if pruned:
+            await db.commit()
+    return pruned
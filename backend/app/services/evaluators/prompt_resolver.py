@@ -13,6 +13,16 @@ from app.services.evaluators.evaluation_constants import resolve_script_name
 
 logger = logging.getLogger(__name__)
 
+# Stands in for {{audio}}; the runner sends the audio itself as file data.
+AUDIO_ATTACHED_MARKER = "[Audio file attached]"
+
+_VARIABLE_RE = re.compile(r"\{\{[a-zA-Z0-9_.]+\}\}")
+
+
+def _compact_json(value) -> str:
+    """JSON for prompt injection: no indentation and raw non-ASCII, both of which only cost tokens."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
 
 def format_chat_transcript(messages: list[dict]) -> str:
     """Format chat messages as a readable User/Bot transcript.
@@ -33,7 +43,7 @@ def format_chat_transcript(messages: list[dict]) -> str:
 def _format_transcript_as_text(transcript: dict) -> str:
     """Format TranscriptData segments as readable text."""
     segments = transcript.get("segments", [])
-    return "\n".join(f"[{s.get('speaker', 'Unknown')}]: {s.get('text', '')}" for s in segments)
+    return "\n".join([f"[{s.get('speaker', 'Unknown')}]: {s.get('text', '')}" for s in segments])
 
 
 def _extract_speakers(transcript: dict) -> list[str]:
@@ -83,6 +93,10 @@ def resolve_prompt(
             - ai_eval: dict | None (existing AIEvaluation)
             - prerequisites: dict | None (language, targetScript, etc.)
             - messages: list[dict] — for kaira-bot (chat messages)
+            - chat_transcript: str | None — ``messages`` already formatted,
+              for callers resolving several prompts over one thread
+            - audio_marker: str | None — text to put in place of {{audio}}
+              when the runner attaches the audio itself
 
     Returns:
         Dict with:
@@ -94,32 +108,34 @@ def resolve_prompt(
     ai_eval = context.get("ai_eval")
     prerequisites = context.get("prerequisites", {})
 
-    # Find all {{variable}} tokens
-    variables = set(re.findall(r"\{\{[a-zA-Z0-9_.]+\}\}", prompt_text))
+    api_response = listing.get("api_response") or listing.get("apiResponse")
 
     resolved = {}
     unresolved = []
-    result = prompt_text
 
-    for var_key in variables:
+    # Each distinct {{variable}} is resolved once, in order of first use.
+    for var_key in dict.fromkeys(_VARIABLE_RE.findall(prompt_text)):
         inner = var_key[2:-2]  # strip {{ and }}
         value = _resolve_single(inner, listing, ai_eval, prerequisites, context)
 
+        if value is None and api_response and isinstance(api_response, dict):
+            # Try API JSON path variables (e.g., rx.vitals.temperature)
+            nested = _get_nested_value(api_response, inner)
+            if nested is not None:
+                value = _compact_json(nested) if isinstance(nested, (dict, list)) else str(nested)
+
         if value is not None:
             resolved[var_key] = value
-            result = result.replace(var_key, value)
         else:
-            # Try API JSON path variables (e.g., rx.vitals.temperature)
-            api_response = listing.get("api_response") or listing.get("apiResponse")
-            if api_response and isinstance(api_response, dict):
-                nested = _get_nested_value(api_response, inner)
-                if nested is not None:
-                    str_val = json.dumps(nested, indent=2) if isinstance(nested, (dict, list)) else str(nested)
-                    resolved[var_key] = str_val
-                    result = result.replace(var_key, str_val)
-                    continue
             unresolved.append(var_key)
 
+    # One pass over the template instead of a full-string copy per variable;
+    # tokens inside substituted values (e.g. a transcript) are left as-is.
+    result = (
+        _VARIABLE_RE.sub(lambda m: resolved.get(m.group(0), m.group(0)), prompt_text)
+        if resolved else prompt_text
+    )
+
     return {
         "prompt": result,
         "resolved_variables": resolved,
@@ -137,6 +153,8 @@ def _resolve_single(
     """Resolve a single variable key (without braces)."""
     # Kaira-bot variable: chat transcript
     if key == "chat_transcript":
+        if (context or {}).get("chat_transcript") is not None:
+            return context["chat_transcript"]
         messages = (context or {}).get("messages", [])
         if messages:
             return format_chat_transcript(messages)
@@ -146,10 +164,9 @@ def _resolve_single(
     api_response = listing.get("api_response") or listing.get("apiResponse")
 
     if key == "audio":
-        # Audio is handled by the runner (sent as actual file data).
-        # Return None so it lands in unresolved_variables — the runner
-        # replaces {{audio}} with a marker after resolution.
-        return None
+        # Audio is handled by the runner (sent as actual file data). Without
+        # a marker it lands in unresolved_variables.
+        return (context or {}).get("audio_marker")
 
     if key == "transcript":
         if transcript:
@@ -245,14 +262,14 @@ def _resolve_single(
 
     if key == "api_response":
         if api_response:
-            return json.dumps(api_response, indent=2)
+            return _compact_json(api_response)
         return None
 
     if key == "eval_structured":
         if ai_eval:
             judge_output = ai_eval.get("judgeOutput") or ai_eval.get("judge_output")
             if judge_output and judge_output.get("structuredData"):
-                return json.dumps(judge_output["structuredData"], indent=2)
+                return _compact_json(judge_output["structuredData"])
         return None
 
     # Unknown variable
@@ -6,11 +6,14 @@ transcript parsing, and critique parsing for the two-call evaluation pipeline.
 import json
 import logging
 import re
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
 
 def repair_truncated_json(text: str) -> str:
     """Try to repair truncated JSON by closing open brackets/braces."""
@@ -99,9 +102,10 @@ def _safe_parse_json(text: str) -> tuple[dict, bool]:
         Tuple of (parsed_dict, was_repaired).
         was_repaired is True if the JSON needed truncation repair.
     """
-    # Try direct parse
+    # Try direct parse; json.loads already skips surrounding whitespace, so
+    # no stripped copy of a multi-KB response is needed.
     try:
-        return json.loads(text.strip()), False
+        return json.loads(text), False
     except json.JSONDecodeError:
         pass
 
@@ -127,24 +131,30 @@ def _safe_parse_json(text: str) -> tuple[dict, bool]:
         raise ValueError(f"Invalid JSON in response: {e}") from e
 
 
+_SEVERITIES = frozenset(("none", "minor", "moderate", "critical"))
+_LIKELY_CORRECT = frozenset(("original", "judge", "both", "unclear"))
+_CONFIDENCES = frozenset(("high", "medium", "low"))
+
+
 def _validate_severity(value) -> str:
-    valid = ("none", "minor", "moderate", "critical")
-    s = str(value).lower() if value is not None else "none"
-    return s if s in valid else "none"
+    if value is None:
+        return "none"
+    s = str(value).lower()
+    return s if s in _SEVERITIES else "none"
 
 
 def _validate_likely_correct(value) -> str:
-    valid = ("original", "judge", "both", "unclear")
-    s = str(value).lower() if value is not None else "unclear"
-    return s if s in valid else "unclear"
+    if value is None:
+        return "unclear"
+    s = str(value).lower()
+    return s if s in _LIKELY_CORRECT else "unclear"
 
 
 def _validate_confidence(value) -> Optional[str]:
     if not value:
         return None
-    valid = ("high", "medium", "low")
     s = str(value).lower()
-    return s if s in valid else None
+    return s if s in _CONFIDENCES else None
 
 
 # ── Transcript parsing ───────────────────────────────────────────
@@ -166,17 +176,24 @@ def parse_transcript_response(text: str) -> dict:
     parsed, _repaired = _safe_parse_json(text)
 
     segments = []
+    lines = []
     for idx, seg in enumerate(parsed.get("segments", [])):
+        # One lookup per key; the snake_case fallbacks are only read when needed.
+        start = seg.get("startTime", _MISSING)
+        end = seg.get("endTime", _MISSING)
+        speaker = str(seg.get("speaker", "Unknown"))
+        text = str(seg.get("text", ""))
         segments.append({
-            "speaker": str(seg.get("speaker", "Unknown")),
-            "text": str(seg.get("text", "")),
-            "startTime": str(seg.get("startTime", seg.get("start_time", idx))),
-            "endTime": str(seg.get("endTime", seg.get("end_time", idx + 1))),
-            "startSeconds": seg.get("startTime") if isinstance(seg.get("startTime"), (int, float)) else None,
-            "endSeconds": seg.get("endTime") if isinstance(seg.get("endTime"), (int, float)) else None,
+            "speaker": speaker,
+            "text": text,
+            "startTime": str(seg.get("start_time", idx) if start is _MISSING else start),
+            "endTime": str(seg.get("end_time", idx + 1) if end is _MISSING else end),
+            "startSeconds": start if isinstance(start, (int, float)) else None,
+            "endSeconds": end if isinstance(end, (int, float)) else None,
         })
+        lines.append(f"[{speaker}]: {text}")
 
-    full_transcript = "\n".join(f"[{s['speaker']}]: {s['text']}" for s in segments)
+    full_transcript = "\n".join(lines)
     now = datetime.now(timezone.utc).isoformat()
 
     return {
@@ -264,15 +281,17 @@ def parse_critique_response(
     critique_indices = {s["segmentIndex"] for s in segments}
     match_count = actual_total - len(critique_indices)
 
+    severity_counts = Counter(s["severity"] for s in segments)
+    verdict_counts = Counter(s["likelyCorrect"] for s in segments)
     stats = {
         "totalSegments": actual_total,
-        "criticalCount": sum(1 for s in segments if s["severity"] == "critical"),
-        "moderateCount": sum(1 for s in segments if s["severity"] == "moderate"),
-        "minorCount": sum(1 for s in segments if s["severity"] == "minor"),
+        "criticalCount": severity_counts["critical"],
+        "moderateCount": severity_counts["moderate"],
+        "minorCount": severity_counts["minor"],
         "matchCount": match_count,
-        "originalCorrectCount": sum(1 for s in segments if s["likelyCorrect"] == "original"),
-        "judgeCorrectCount": sum(1 for s in segments if s["likelyCorrect"] == "judge"),
-        "unclearCount": sum(1 for s in segments if s["likelyCorrect"] == "unclear"),
+        "originalCorrectCount": verdict_counts["original"],
+        "judgeCorrectCount": verdict_counts["judge"],
+        "unclearCount": verdict_counts["unclear"],
     }
 
     return {
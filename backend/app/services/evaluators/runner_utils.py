@@ -14,12 +14,15 @@ Submit-time placeholder flow (Phase 0, 2026-04):
   - promote_eval_run_to_running: called from runners. UPDATE-if-placeholder-
     exists, INSERT-otherwise (backward compat for non-wizard paths).
 """
+import asyncio
+import time
 import uuid
 import logging
 from datetime import datetime, timezone
-from typing import Any, Awaitable, Callable, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
 
-from sqlalchemy import update
+from sqlalchemy import bindparam, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.eval_run import EvaluationRun, EvaluationRunApiCallLog
 from app.models.job import BackgroundJob
@@ -27,6 +30,11 @@ from app.services.cost_tracking.provider_map import internal_provider_from_class
 from app.services.cost_tracking.recorder import record_llm_usage
 from app.services.evaluators.output_schema_utils import find_primary_field
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.services.llm_credentials import ResolvedLlmCall
+
 logger = logging.getLogger(__name__)
 
 # ── BackgroundJob type → eval type mapping ─────────────────────────────────────
@@ -56,12 +64,7 @@ def _async_session():
 # ── API Log Persistence ──────────────────────────────────────────────
 
 
-async def save_api_log(log_entry: dict) -> None:
-    """Persist an LLM API log entry to PostgreSQL.
-
-    Superset version: handles all optional fields including test_case_label
-    (used by adversarial runner).
-    """
+def _api_log_row(log_entry: dict) -> EvaluationRunApiCallLog:
     run_id = log_entry.get("run_id")
     if run_id and isinstance(run_id, str):
         try:
@@ -69,25 +72,70 @@ async def save_api_log(log_entry: dict) -> None:
         except ValueError:
             run_id = None
 
+    return EvaluationRunApiCallLog(
+        run_id=run_id,
+        thread_id=log_entry.get("thread_id"),
+        test_case_label=log_entry.get("test_case_label"),
+        provider=log_entry.get("provider", "unknown"),
+        model=log_entry.get("model", "unknown"),
+        method=log_entry.get("method", "unknown"),
+        prompt=log_entry.get("prompt", ""),
+        system_prompt=log_entry.get("system_prompt"),
+        response=log_entry.get("response"),
+        error=log_entry.get("error"),
+        duration_ms=log_entry.get("duration_ms"),
+        tokens_in=log_entry.get("tokens_in"),
+        tokens_out=log_entry.get("tokens_out"),
+    )
+
+
+async def save_api_log(log_entry: dict) -> None:
+    """Persist an LLM API log entry to PostgreSQL.
+
+    Superset version: handles all optional fields including test_case_label
+    (used by adversarial runner).
+    """
     async with _async_session() as db:
-        db.add(EvaluationRunApiCallLog(
-            run_id=run_id,
-            thread_id=log_entry.get("thread_id"),
-            test_case_label=log_entry.get("test_case_label"),
-            provider=log_entry.get("provider", "unknown"),
-            model=log_entry.get("model", "unknown"),
-            method=log_entry.get("method", "unknown"),
-            prompt=log_entry.get("prompt", ""),
-            system_prompt=log_entry.get("system_prompt"),
-            response=log_entry.get("response"),
-            error=log_entry.get("error"),
-            duration_ms=log_entry.get("duration_ms"),
-            tokens_in=log_entry.get("tokens_in"),
-            tokens_out=log_entry.get("tokens_out"),
-        ))
+        db.add(_api_log_row(log_entry))
         await db.commit()
 
 
+# Flush threshold for runners that make many LLM calls per run.
+API_LOG_BATCH_SIZE = 50
+
+
+class ApiLogBuffer:
+    """Collect a run's API log entries and persist them with one commit.
+
+    Pass ``add`` as a ``LoggingLLMWrapper`` log_callback and call ``flush``
+    once the run reaches a terminal state. ``flush(db=...)`` joins the
+    caller's transaction instead of committing its own. Long runs pass
+    ``max_pending`` so logs are written in batches of that size as they
+    accumulate instead of all at the end.
+    """
+
+    def __init__(self, *, max_pending: Optional[int] = None) -> None:
+        self._rows: list[EvaluationRunApiCallLog] = []
+        self._max_pending = max_pending
+
+    async def add(self, log_entry: dict) -> None:
+        self._rows.append(_api_log_row(log_entry))
+        if self._max_pending is not None and len(self._rows) >= self._max_pending:
+            await self.flush()
+
+    async def flush(self, db: "Optional[AsyncSession]" = None) -> None:
+        if not self._rows:
+            return
+        rows, self._rows = self._rows, []
+        if db is not None:
+            db.add_all(rows)
+            await db.flush()
+            return
+        async with _async_session() as db:
+            db.add_all(rows)
+            await db.commit()
+
+
 # ── LLM Usage (cost_tracking) Callback Factory ───────────────────────
 
 
@@ -150,6 +198,97 @@ def set_usage_call_purpose(
         setter(purpose, stage_index=stage_index)
 
 
+# ── LLM Provider Factory Kwargs ──────────────────────────────────────
+
+_DEFAULT_AZURE_API_VERSION = "2025-03-01-preview"
+
+
+def _azure_openai_kwargs(resolved: "ResolvedLlmCall") -> dict[str, str]:
+    extra = resolved.credentials.extra_config
+    return {
+        "azure_endpoint": extra.get("base_url") or "",
+        "api_version": resolved.api_version or extra.get("api_version") or _DEFAULT_AZURE_API_VERSION,
+    }
+
+
+_PROVIDER_KWARG_EXTRACTORS: dict[str, Callable[["ResolvedLlmCall"], dict[str, str]]] = {
+    "azure_openai": _azure_openai_kwargs,
+}
+
+
+def provider_factory_kwargs(resolved: "ResolvedLlmCall") -> dict[str, str]:
+    """Provider-specific ``create_llm_provider`` kwargs for a resolved call site."""
+    extractor = _PROVIDER_KWARG_EXTRACTORS.get(resolved.provider)
+    return extractor(resolved) if extractor else {}
+
+
+# ── Job Progress Throttling ──────────────────────────────────────────
+
+
+class ProgressThrottle:
+    """Decide when a job-progress write is worth a DB round-trip.
+
+    A write is due when ``min_interval`` seconds have passed, when ``current``
+    advanced by at least ``min_fraction`` of ``total``, or on the final step.
+    """
+
+    __slots__ = ("_min_interval", "_min_fraction", "_last_at", "_last_current")
+
+    def __init__(self, *, min_interval: float = 0.5, min_fraction: float = 0.05) -> None:
+        self._min_interval = min_interval
+        self._min_fraction = min_fraction
+        self._last_at: Optional[float] = None
+        self._last_current = 0
+
+    def should_write(self, current: int, total: int, *, force: bool = False) -> bool:
+        now = time.monotonic()
+        due = (
+            force
+            or current >= total
+            or self._last_at is None
+            or now - self._last_at >= self._min_interval
+            or current - self._last_current >= max(1, int(total * self._min_fraction))
+        )
+        if due:
+            self._last_at = now
+            self._last_current = current
+        return due
+
+
+class BackgroundProgress:
+    """Write job progress off the pipeline's critical path.
+
+    ``publish`` records the latest progress and returns immediately; a single
+    background task writes it, coalescing updates that arrive while a write
+    is in flight so only the newest state is sent. ``close`` waits for the
+    last write and must run before the job reaches a terminal state.
+    """
+
+    __slots__ = ("_write", "_pending", "_task")
+
+    def __init__(self, write: Callable[..., Awaitable[None]]) -> None:
+        self._write = write
+        self._pending: Optional[tuple[tuple, dict]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def publish(self, *args, **kwargs) -> None:
+        self._pending = (args, kwargs)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while self._pending is not None:
+            (args, kwargs), self._pending = self._pending, None
+            try:
+                await self._write(*args, **kwargs)
+            except Exception:
+                logger.warning("Failed to write job progress", exc_info=True)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            await self._task
+
+
 # ── EvaluationRun Lifecycle ────────────────────────────────────────────────
 
 
@@ -230,6 +369,7 @@ async def promote_eval_run_to_running(
         new attempt owns the row.
 
     Match by primary key; tenant_id is added as a belt-and-braces filter.
+    Both cases are one ``INSERT ... ON CONFLICT (id) DO UPDATE`` round-trip.
     """
     now = datetime.now(timezone.utc)
     values: dict[str, Any] = {
@@ -257,34 +397,36 @@ async def promote_eval_run_to_running(
     if batch_metadata is not None:
         values["batch_metadata"] = batch_metadata
 
-    async with _async_session() as db:
-        result = await db.execute(
-            update(EvaluationRun)
-            .where(EvaluationRun.id == id, EvaluationRun.tenant_id == tenant_id)
-            .values(**values)
+    stmt = (
+        pg_insert(EvaluationRun)
+        .values(
+            id=id,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            app_id=app_id,
+            eval_type=eval_type,
+            job_id=job_id,
+            listing_id=listing_id,
+            session_id=session_id,
+            evaluator_id=evaluator_id,
+            status="running",
+            started_at=now,
+            llm_provider=llm_provider,
+            llm_model=llm_model,
+            config=config or {},
+            batch_metadata=batch_metadata,
+        )
+        .on_conflict_do_update(
+            index_elements=[EvaluationRun.id],
+            set_=values,
+            where=EvaluationRun.tenant_id == tenant_id,
         )
-        if result.rowcount:
-            await db.commit()
-            return
-
-    # No placeholder → fall through to INSERT via the existing helper.
-    await create_eval_run(
-        id=id,
-        tenant_id=tenant_id,
-        user_id=user_id,
-        app_id=app_id,
-        eval_type=eval_type,
-        job_id=job_id,
-        listing_id=listing_id,
-        session_id=session_id,
-        evaluator_id=evaluator_id,
-        llm_provider=llm_provider,
-        llm_model=llm_model,
-        config=config,
-        batch_metadata=batch_metadata,
-        status="running",
-        started_at=now,
     )
+    async with _async_session() as db:
+        result = await db.execute(stmt)
+        if not result.rowcount:
+            raise ValueError(f"EvaluationRun {id} belongs to another tenant")
+        await db.commit()
 
 
 def _uuid_or_none(value) -> Optional[uuid.UUID]:
@@ -379,6 +521,29 @@ async def create_pending_eval_run_for_job(job: BackgroundJob, params: dict) -> O
     return eval_run_id
 
 
+# Built once so every finalize reuses the same WHERE clause; only the SET
+# list varies, and SQLAlchemy's compiled cache keys on that small set of
+# column combinations. No session has the run loaded when it finalizes,
+# so there is nothing to synchronize.
+_FINALIZE_RUN_STMT = (
+    update(EvaluationRun)
+    # b_ prefixes: UPDATE reserves column names (tenant_id) as bind names.
+    .where(EvaluationRun.id == bindparam("b_run_id"), EvaluationRun.tenant_id == bindparam("b_tenant_id"))
+    .returning(EvaluationRun.status)
+    .execution_options(synchronize_session=False)
+)
+# Only an in-flight run is finalized, so the first terminal write wins when
+# cancel, failure and completion race.
+_FINALIZE_IN_FLIGHT_RUN_STMT = _FINALIZE_RUN_STMT.where(
+    EvaluationRun.status.in_(("pending", "running"))
+)
+# The cancel route marks the run cancelled first; the runner still fills in
+# duration and summary.
+_FINALIZE_CANCELLED_RUN_STMT = _FINALIZE_RUN_STMT.where(
+    EvaluationRun.status.in_(("pending", "running", "cancelled"))
+)
+
+
 async def finalize_eval_run(
     run_id: uuid.UUID,
     tenant_id: uuid.UUID,
@@ -389,12 +554,18 @@ async def finalize_eval_run(
     summary: Optional[dict] = None,
     error_message: Optional[str] = None,
     config: Optional[dict] = None,
-) -> None:
+    db: "Optional[AsyncSession]" = None,
+) -> bool:
     """Set an EvaluationRun to a terminal state.
 
-    Guards against overwriting a cancel for non-cancel finalize
-    (WHERE status != 'cancelled').  Cancel finalize always applies.
-    Filters by tenant_id to ensure we only update our own records.
+    Only a pending or running run is updated, so a failure can't overwrite
+    a cancel or a completion (and vice versa); cancel finalize may also
+    update a run the cancel route already marked cancelled. The UPDATE
+    reports the row back via RETURNING, so the winner is known without a
+    re-read. Filters by tenant_id to ensure we only update our own records.
+    Returns False when no row was updated (another terminal state won).
+
+    Pass ``db`` to join the caller's transaction; the caller commits.
     """
     values: dict = {
         "status": status,
@@ -410,13 +581,16 @@ async def finalize_eval_run(
     if config is not None:
         values["config"] = config
 
+    base = _FINALIZE_CANCELLED_RUN_STMT if status == "cancelled" else _FINALIZE_IN_FLIGHT_RUN_STMT
+    stmt = base.values(**values)
+    params = {"b_run_id": run_id, "b_tenant_id": tenant_id}
+
+    if db is not None:
+        return (await db.execute(stmt, params)).first() is not None
     async with _async_session() as db:
-        condition = (EvaluationRun.id == run_id) & (EvaluationRun.tenant_id == tenant_id)
-        if status != "cancelled":
-            # Don't overwrite a cancel that arrived via the cancel route
-            condition = condition & (EvaluationRun.status != "cancelled")  # type: ignore[assignment]
-        await db.execute(update(EvaluationRun).where(condition).values(**values))
+        row = (await db.execute(stmt, params)).first()
         await db.commit()
+    return row is not None
 
 
 # ── Schema Utilities ─────────────────────────────────────────────────
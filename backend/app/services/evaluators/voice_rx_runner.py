@@ -10,20 +10,36 @@ Standard pipeline contract:
   - Statistics: computed server-side from known data (never trust LLM counts)
   - Critique step: text-only (generate_json, NOT generate_with_audio)
 """
+import asyncio
 import copy
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import time
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import select, update
-
-from app.database import async_session
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any
+from sqlalchemy import cast, select
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import load_only
+
+from app.constants import SYSTEM_TENANT_ID
+from app.database import async_session, read_session
 from app.models.evaluation_dataset import EvaluationDataset
 from app.models.application_uploaded_file import ApplicationUploadedFile
 from app.models.eval_template import EvaluationTemplate
 from app.models.eval_run import EvaluationRun
+from app.models.cache_critique import CacheCritique
+from app.models.cache_transcription import CacheTranscription
+from app.services.analytics import submit_analytics_job
 from app.services.file_storage import file_storage
+from app.services.ttl_cache import TTLCache
+from app.services.llm_credentials import ResolvedLlmCall, resolve_llm_call
 from app.services.evaluators.llm_base import (
     BaseLLMProvider, LoggingLLMWrapper, LLMTimeoutError, create_llm_provider,
 )
@@ -33,20 +49,26 @@ from app.services.evaluators.response_parser import (
     parse_api_critique_response,
     _safe_parse_json,
 )
-from app.services.evaluators.prompt_resolver import resolve_prompt
+from app.services.evaluators.prompt_resolver import AUDIO_ATTACHED_MARKER, resolve_prompt
 from app.services.evaluators.flow_config import FlowConfig
+from app.services.evaluators.llm_cache import (
+    read_cached_response,
+    request_cache_key,
+    write_cached_response,
+)
 from app.services.evaluators.evaluation_constants import (
     resolve_script_name,
     build_transcription_system_prompt,
     CRITIQUE_SYSTEM_PROMPT,
-    NORMALIZATION_PROMPT,
-    NORMALIZATION_PROMPT_PLAIN,
     NORMALIZATION_SYSTEM_PROMPT,
+    build_normalization_prompt,
     build_normalization_schema,
     build_normalization_schema_plain,
-    UPLOAD_EVALUATION_PROMPT,
+    UPLOAD_EVALUATION_PROMPT_PREFIX,
+    build_upload_evaluation_prompt,
     UPLOAD_EVALUATION_SCHEMA,
-    API_EVALUATION_PROMPT,
+    API_EVALUATION_PROMPT_PREFIX,
+    build_api_evaluation_prompt,
     API_EVALUATION_SCHEMA,
 )
 from app.services.evaluators.comparison_builder import (
@@ -54,8 +76,8 @@ from app.services.evaluators.comparison_builder import (
     format_comparison_for_prompt,
 )
 from app.services.evaluators.runner_utils import (
-    save_api_log, promote_eval_run_to_running, finalize_eval_run,
-    make_usage_callback,
+    ApiLogBuffer, BackgroundProgress, promote_eval_run_to_running, finalize_eval_run,
+    make_usage_callback, provider_factory_kwargs,
 )
 from app.services.job_worker import (
     is_job_cancelled, JobCancelledError, safe_error_message, update_job_progress,
@@ -63,56 +85,98 @@ from app.services.job_worker import (
 
 logger = logging.getLogger(__name__)
 
+_TRANSCRIPTION_CACHE_TTL = timedelta(days=7)
+_CRITIQUE_CACHE_TTL = timedelta(days=7)
+
+# Segment normalization echoes its input back, so long transcripts are split
+# before either the prompt or the response outgrows the model's limits.
+_NORMALIZATION_BATCH_CHARS = 24_000
+
+_COMPARISON_THREAD_MIN_ITEMS = 32
+# Below this, a thread hop costs more than parsing the LLM response inline.
+_PARSE_IN_THREAD_CHARS = 64 * 1024
+
+# Shared read-only stand-in for a segment missing on one side of a pairing.
+_EMPTY_SEGMENT = MappingProxyType({})
+
 
 # ── DB helpers for loading default prompts/schemas ────────────────────
 
 
-async def _load_default_prompt(app_id: str, prompt_type: str, source_type: str) -> str:
-    """Load the default prompt text from the DB for a given app/type/source."""
-    from app.constants import SYSTEM_TENANT_ID
-    async with async_session() as db:
-        result = await db.execute(
-            select(EvaluationTemplate).where(
-                EvaluationTemplate.tenant_id == SYSTEM_TENANT_ID,
-                EvaluationTemplate.app_id == app_id,
-                EvaluationTemplate.template_type == prompt_type,
-                EvaluationTemplate.source_type == source_type,
-                EvaluationTemplate.is_default == True,
-            )
-        )
-        template = result.scalar_one_or_none()
-        if not template:
-            raise ValueError(f"No default {prompt_type} prompt for {app_id}/{source_type}")
-        return template.prompt
+# System-tenant defaults only change on seed/migration, so a short TTL is the
+# whole invalidation contract; batches of listings hit memory instead of Postgres.
+_DEFAULT_TEMPLATE_CACHE: TTLCache[tuple[str, str, str], tuple[str, dict]] = TTLCache(
+    ttl_seconds=60, max_entries=256, name='voice_rx_default_templates',
+)
 
 
-async def _load_default_schema(app_id: str, prompt_type: str, source_type: str) -> dict:
-    """Load the default schema from the DB for a given app/type/source."""
-    from app.constants import SYSTEM_TENANT_ID
-    async with async_session() as db:
-        result = await db.execute(
-            select(EvaluationTemplate).where(
-                EvaluationTemplate.tenant_id == SYSTEM_TENANT_ID,
-                EvaluationTemplate.app_id == app_id,
-                EvaluationTemplate.template_type == prompt_type,
-                EvaluationTemplate.source_type == source_type,
-                EvaluationTemplate.is_default == True,
-            )
-        )
-        template = result.scalar_one_or_none()
-        if not template:
-            raise ValueError(f"No default {prompt_type} schema for {app_id}/{source_type}")
-        return template.schema_data
+# Normalizations keyed by (tenant_id, sourceKey). sourceKey hashes every
+# input of the call, so any listing with identical input can reuse an entry.
+_NORMALIZATION_CACHE: TTLCache[tuple[uuid.UUID, str], dict] = TTLCache(
+    ttl_seconds=600, max_entries=64, name='voice_rx_normalizations',
+)
+
+
+# Uploads are write-once under a fresh storage key, so a path's digest never
+# changes; knowing it lets a transcription cache hit skip the audio download.
+_AUDIO_DIGEST_CACHE: TTLCache[str, str] = TTLCache(
+    ttl_seconds=3600, max_entries=1024, name='voice_rx_audio_digests',
+)
+
+
+class _NoPriorNormalization(Exception):
+    pass
+
+
+async def _load_default_prompt_and_schema(
+    app_id: str, prompt_type: str, source_type: str,
+) -> tuple[str, dict]:
+    """Load the default prompt text and schema for a given app/type/source.
+
+    Both live on the same default EvaluationTemplate row, so one query
+    returns them together.
+    """
+    async def _load() -> tuple[str, dict]:
+        async with read_session() as db:
+            row = (await db.execute(
+                select(EvaluationTemplate.prompt, EvaluationTemplate.schema_data).where(
+                    EvaluationTemplate.tenant_id == SYSTEM_TENANT_ID,
+                    EvaluationTemplate.app_id == app_id,
+                    EvaluationTemplate.template_type == prompt_type,
+                    EvaluationTemplate.source_type == source_type,
+                    EvaluationTemplate.is_default == True,
+                )
+            )).one_or_none()
+            if not row:
+                raise ValueError(f"No default {prompt_type} template for {app_id}/{source_type}")
+            return row.prompt, row.schema_data
+
+    return await _DEFAULT_TEMPLATE_CACHE.get_or_load((app_id, prompt_type, source_type), _load)
 
 
 class PipelineStepError(Exception):
-    """Error from a specific pipeline step with context."""
-    def __init__(self, step: str, message: str, partial_result: dict | None = None):
+    """Error from a specific pipeline step with context.
+
+    ``partial_result_factory`` defers snapshotting the evaluation until the
+    handler reads ``partial_result``; the snapshot is taken at most once.
+    """
+    def __init__(
+        self, step: str, message: str, partial_result: dict | None = None,
+        *, partial_result_factory: Callable[[], dict] | None = None,
+    ):
         self.step = step
         self.message = message
-        self.partial_result = partial_result
+        self._partial_result = partial_result
+        self._partial_result_factory = partial_result_factory
         super().__init__(f"Step '{step}' failed: {message}")
 
+    @property
+    def partial_result(self) -> dict | None:
+        if self._partial_result_factory is not None:
+            self._partial_result = self._partial_result_factory()
+            self._partial_result_factory = None
+        return self._partial_result
+
 
 def _validate_pipeline_inputs(flow, listing, params: dict) -> list[str]:
     """Validate all inputs before starting the pipeline. Returns list of error messages."""
@@ -140,6 +204,78 @@ def _validate_pipeline_inputs(flow, listing, params: dict) -> list[str]:
     return errors
 
 
+async def _load_listing_with_audio_file(
+    listing_id, *, tenant_id: uuid.UUID, user_id: uuid.UUID,
+) -> tuple[EvaluationDataset, ApplicationUploadedFile]:
+    """Load the listing and its audio file record in one query.
+
+    The outer join on the listing's ``audio_file.id`` keeps the listing row
+    when the file record is missing, so each failure keeps its own message.
+    Only the columns the pipeline reads are loaded; the listing's other JSON
+    columns (uploaded-file metadata, structured outputs) can be large.
+    """
+    async with read_session() as db:
+        row = (await db.execute(
+            select(EvaluationDataset, ApplicationUploadedFile)
+            .outerjoin(
+                ApplicationUploadedFile,
+                ApplicationUploadedFile.id
+                == cast(EvaluationDataset.audio_file["id"].as_string(), PG_UUID(as_uuid=True)),
+            )
+            .options(
+                load_only(
+                    EvaluationDataset.id,
+                    EvaluationDataset.source_type,
+                    EvaluationDataset.audio_file,
+                    EvaluationDataset.transcript,
+                    EvaluationDataset.api_response,
+                ),
+                load_only(
+                    ApplicationUploadedFile.id,
+                    ApplicationUploadedFile.storage_path,
+                    ApplicationUploadedFile.mime_type,
+                ),
+            )
+            .where(
+                EvaluationDataset.id == listing_id,
+                EvaluationDataset.tenant_id == tenant_id,
+                EvaluationDataset.user_id == user_id,
+            )
+        )).first()
+    if not row:
+        raise ValueError(f"Listing {listing_id} not found or not accessible")
+    listing, file_record = row
+
+    audio_file_meta = listing.audio_file
+    if not audio_file_meta:
+        raise ValueError(f"Listing {listing_id} has no audio file")
+    if not file_record:
+        raise ValueError(f"File record {audio_file_meta.get('id')} not found")
+    return listing, file_record
+
+
+async def _resolve_step_llm_calls(
+    tenant_id: uuid.UUID, *, provider_override: str | None, model_override: str | None,
+) -> tuple[ResolvedLlmCall, ResolvedLlmCall]:
+    """Resolve the transcription and critique call sites in one session.
+
+    Resolution only SELECTs, so it uses the autocommit read session and
+    skips the BEGIN/ROLLBACK round-trips of a transactional one.
+    """
+    async with read_session() as db:
+        transcribe_resolved = await resolve_llm_call(
+            db, tenant_id, "audio_transcription",
+            provider_override=provider_override,
+            model_override=model_override,
+        )
+        critique_resolved = await resolve_llm_call(
+            db, tenant_id, "chat_text",
+            provider_override=provider_override,
+            model_override=model_override,
+        )
+    return transcribe_resolved, critique_resolved
+
+
 async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID, user_id: uuid.UUID) -> dict:
     """Run voice-rx FlowConfig-driven evaluation pipeline.
 
@@ -168,49 +304,7 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
     _placeholder_id = params.get("eval_run_id")
     eval_run_id = uuid.UUID(_placeholder_id) if _placeholder_id else uuid.uuid4()
 
-    await promote_eval_run_to_running(
-        id=eval_run_id,
-        tenant_id=tenant_id,
-        user_id=user_id,
-        app_id=app_id,
-        eval_type="full_evaluation",
-        job_id=job_id,
-        listing_id=uuid.UUID(listing_id) if isinstance(listing_id, str) else listing_id,
-    )
-
-    await update_job_progress(
-        job_id, 0, 3, "Initializing...",
-        listing_id=listing_id, run_id=str(eval_run_id),
-    )
-
-    # ── Load listing ─────────────────────────────────────────────
-    async with async_session() as db:
-        listing = await db.scalar(
-            select(EvaluationDataset).where(
-                EvaluationDataset.id == listing_id,
-                EvaluationDataset.tenant_id == tenant_id,
-                EvaluationDataset.user_id == user_id,
-            )
-        )
-        if not listing:
-            raise ValueError(f"Listing {listing_id} not found or not accessible")
-
-    audio_file_meta = listing.audio_file
-    if not audio_file_meta:
-        raise ValueError(f"Listing {listing_id} has no audio file")
-
-    file_id = audio_file_meta.get("id")
-    async with async_session() as db:
-        file_record = await db.get(ApplicationUploadedFile, file_id)
-        if not file_record:
-            raise ValueError(f"File record {file_id} not found")
-
-    audio_bytes = await file_storage.read(file_record.storage_path)
-    mime_type = file_record.mime_type or audio_file_meta.get("mimeType", "audio/mpeg")
-
-    # ── Resolve LLM credentials ─────────────────────────────────
-    from app.services.llm_credentials import ResolvedLlmCall, resolve_llm_call
-
+    # ── Load listing + audio file record, resolve LLM credentials ──
     # Voice-Rx runs two stages with DIFFERENT call sites:
     # - transcription/normalization → audio_transcription (audio-capable model)
     # - critique → chat_text (text-only judge)
@@ -221,17 +315,50 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
     provider_override = params.get("provider")
     selected_model = params.get("model") or ""
     step_models = params.get("step_models") or {}
-    async with async_session() as db:
-        transcribe_resolved = await resolve_llm_call(
-            db, tenant_id, "audio_transcription",
-            provider_override=provider_override or None,
-            model_override=selected_model or None,
+
+    async def _load_listing_and_audio():
+        listing, file_record = await _load_listing_with_audio_file(
+            listing_id, tenant_id=tenant_id, user_id=user_id,
         )
-        critique_resolved = await resolve_llm_call(
-            db, tenant_id, "chat_text",
+        flow = FlowConfig.from_params(params, listing.source_type or "upload")
+
+        async def _read_audio():
+            known_digest = _AUDIO_DIGEST_CACHE.get(file_record.storage_path)
+            if known_digest is not None:
+                return None, known_digest
+            audio_bytes = await file_storage.read(file_record.storage_path)
+            digest = await _audio_digest(audio_bytes)
+            _AUDIO_DIGEST_CACHE.set(file_record.storage_path, digest)
+            return audio_bytes, digest
+
+        # The flow type is all the template lookup needs, so it overlaps the storage read.
+        (audio_bytes, audio_digest), (prompt, schema) = await asyncio.gather(
+            _read_audio(),
+            _load_default_prompt_and_schema(app_id, "transcription", flow.flow_type),
+        )
+        return listing, file_record, flow, audio_bytes, audio_digest, prompt, schema
+
+    # The progress write, listing/audio load and credential resolution are
+    # independent, so they run together instead of back to back.
+    (
+        _,
+        (listing, file_record, flow, audio_bytes, audio_digest, transcription_prompt, transcription_schema),
+        (transcribe_resolved, critique_resolved),
+    ) = await asyncio.gather(
+        update_job_progress(
+            job_id, 0, 3, "Initializing...",
+            listing_id=listing_id, run_id=str(eval_run_id),
+        ),
+        _load_listing_and_audio(),
+        _resolve_step_llm_calls(
+            tenant_id,
             provider_override=provider_override or None,
             model_override=selected_model or None,
-        )
+        ),
+    )
+    audio_file_meta = listing.audio_file
+    mime_type = file_record.mime_type or audio_file_meta.get("mimeType", "audio/mpeg")
+
     # provider/service_account_path are used by downstream config-snapshot
     # attribution; they come from the transcription resolve since that's the
     # "primary" identity for this runner type. The per-step api_key + endpoint
@@ -247,6 +374,9 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
         owner_id=eval_run_id,
     )
 
+    # The pipeline's 3+ API logs are written together when the run ends.
+    api_logs = ApiLogBuffer()
+
     def _create_llm(model: str, *, resolved: ResolvedLlmCall) -> BaseLLMProvider:
         """Build a logging LLM client from a resolved call site.
 
@@ -255,25 +385,15 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
         steps pass ``transcribe_resolved`` and the critique step passes
         ``critique_resolved``; nothing leaks across the call-site boundary.
         """
-        azure_endpoint = ""
-        api_version = ""
-        if resolved.provider == "azure_openai":
-            azure_endpoint = resolved.credentials.extra_config.get("base_url") or ""
-            api_version = (
-                resolved.api_version
-                or resolved.credentials.extra_config.get("api_version")
-                or "2025-03-01-preview"
-            )
         inner = create_llm_provider(
             provider=resolved.provider,
             api_key=resolved.credentials.secret.get("api_key", ""),
             model_name=model, temperature=0.3,
             service_account_path=resolved.credentials.service_account_path or "",
-            azure_endpoint=azure_endpoint,
-            api_version=api_version,
+            **provider_factory_kwargs(resolved),
         )
         llm = LoggingLLMWrapper(
-            inner, log_callback=save_api_log, usage_callback=usage_cb,
+            inner, log_callback=api_logs.add, usage_callback=usage_cb,
         )
         if params.get("timeouts"):
             llm.set_timeouts(params["timeouts"])
@@ -284,9 +404,6 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
     prerequisites = params.get("prerequisites", {})
     thinking = params.get("thinking", "low")
 
-    # ── Build FlowConfig ─────────────────────────────────────────
-    flow = FlowConfig.from_params(params, listing.source_type or "upload")
-
     # Compute outputScript — what script the judge should produce
     if flow.normalize_original:
         output_script = prerequisites.get("targetScript", prerequisites.get("target_script", "roman"))
@@ -299,10 +416,6 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
     if errors:
         raise ValueError(f"Pipeline validation failed: {'; '.join(errors)}")
 
-    # ── Load prompts/schemas from DB and hardcoded constants ─────
-    transcription_prompt = await _load_default_prompt(app_id, "transcription", flow.flow_type)
-    transcription_schema = await _load_default_schema(app_id, "transcription", flow.flow_type)
-
     # Evaluation schema: hardcoded (standard pipeline, stored in config snapshot only)
     evaluation_schema = UPLOAD_EVALUATION_SCHEMA if flow.requires_segments else API_EVALUATION_SCHEMA
 
@@ -337,18 +450,23 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
         "flow_type": flow.flow_type,
         "auth_method": "service_account" if service_account_path else "api_key",
         "thinking": thinking,
+        "audio_sha256": audio_digest,
     }
 
-    # Update eval_run with config and LLM info
-    async with async_session() as db:
-        await db.execute(
-            update(EvaluationRun).where(EvaluationRun.id == eval_run_id, EvaluationRun.tenant_id == tenant_id).values(
-                config=config_snapshot,
-                llm_provider=provider,
-                llm_model=selected_model,
-            )
-        )
-        await db.commit()
+    # Promoting once the config is known writes the snapshot in the same
+    # UPDATE; early failures leave a pending placeholder the worker fails.
+    await promote_eval_run_to_running(
+        id=eval_run_id,
+        tenant_id=tenant_id,
+        user_id=user_id,
+        app_id=app_id,
+        eval_type="full_evaluation",
+        job_id=job_id,
+        listing_id=uuid.UUID(listing_id) if isinstance(listing_id, str) else listing_id,
+        llm_provider=provider,
+        llm_model=selected_model,
+        config=config_snapshot,
+    )
 
     # Build the evaluation result (camelCase keys for frontend compat)
     evaluation = {
@@ -364,26 +482,52 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
     }
 
     current_step = 0
+    norm_task: asyncio.Task | None = None
+    # Step progress is written in the background so it never delays an LLM call.
+    progress = BackgroundProgress(functools.partial(update_job_progress, job_id))
 
     try:
         async def check_cancel():
             if await is_job_cancelled(job_id, tenant_id=tenant_id):
                 raise JobCancelledError("BackgroundJob was cancelled by user")
 
+        # Normalization reads only the listing's original transcript, so its
+        # LLM call overlaps transcription; the result is merged in step 2.
+        if flow.normalize_original:
+            async def _normalize_original() -> dict:
+                norm_model = (
+                    step_models.get("normalization")
+                    or prerequisites.get("normalizationModel")
+                    or prerequisites.get("normalization_model")
+                    or selected_model
+                )
+                # Normalization is a text→text step, so it shares the
+                # critique stage's chat_text resolution (not the audio-only
+                # transcription resolution).
+                return await _run_normalization(
+                    flow=flow,
+                    llm=_create_llm(norm_model, resolved=critique_resolved),
+                    listing=listing,
+                    prerequisites=prerequisites,
+                    thinking=thinking,
+                    model=f"{critique_resolved.provider}:{norm_model}",
+                    cache_tenant_id=tenant_id,
+                )
+
+            norm_task = asyncio.create_task(_normalize_original())
+
         # ── STEP 1: Transcription ───────────────────────────────
         current_step += 1
-        await update_job_progress(
-            job_id, current_step, total_steps,
+        progress.publish(
+            current_step, total_steps,
             "Transcribing audio..." if flow.requires_segments else "Judge is transcribing audio...",
             listing_id=listing_id, run_id=str(eval_run_id),
         )
         await check_cancel()
 
         try:
-            _transcription_llm = _create_llm(
-                step_models.get("transcription") or transcribe_resolved.model,
-                resolved=transcribe_resolved,
-            )
+            transcription_model = step_models.get("transcription") or transcribe_resolved.model
+            _transcription_llm = _create_llm(transcription_model, resolved=transcribe_resolved)
             if hasattr(_transcription_llm, 'set_call_purpose'):
                 _transcription_llm.set_call_purpose('transcription', stage_index=0)
             transcription_result = await _run_transcription(
@@ -391,11 +535,15 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
                 llm=_transcription_llm,
                 listing=listing,
                 audio_bytes=audio_bytes,
+                audio_digest=audio_digest,
+                read_audio=functools.partial(file_storage.read, file_record.storage_path),
                 mime_type=mime_type,
                 prompt_text=transcription_prompt,
                 schema=transcription_schema,
                 prerequisites=prerequisites,
                 thinking=thinking,
+                model=f"{transcribe_resolved.provider}:{transcription_model}",
+                cache_tenant_id=tenant_id,
             )
             evaluation.update(transcription_result)
         except JobCancelledError:
@@ -404,7 +552,7 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
             raise PipelineStepError(
                 step="transcription",
                 message=safe_error_message(e),
-                partial_result=dict(evaluation),
+                partial_result_factory=lambda: dict(evaluation),
             ) from e
 
         # Validate judge output before proceeding
@@ -414,38 +562,26 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
                 raise PipelineStepError(
                     step="transcription",
                     message="Judge did not produce structured rx data — cannot compare against API output",
-                    partial_result=dict(evaluation),
+                    partial_result_factory=lambda: dict(evaluation),
                 )
 
+        # Only transcription consumes the audio; don't pin it through critique.
+        audio_bytes = None
+
         await check_cancel()
 
-        # ── STEP 2: Normalization (optional) ────────────────────
-        if flow.normalize_original:
+        # ── STEP 2: Normalization (optional, started alongside step 1) ──
+        if norm_task is not None:
             current_step += 1
-            await update_job_progress(
-                job_id, current_step, total_steps,
+            progress.publish(
+                current_step, total_steps,
                 "Normalizing transcript...",
                 listing_id=listing_id, run_id=str(eval_run_id),
             )
             await check_cancel()
 
             try:
-                norm_model = (
-                    step_models.get("normalization")
-                    or prerequisites.get("normalizationModel")
-                    or prerequisites.get("normalization_model")
-                    or selected_model
-                )
-                # Normalization is a text→text step, so it shares the
-                # critique stage's chat_text resolution (not the audio-only
-                # transcription resolution).
-                norm_result = await _run_normalization(
-                    flow=flow,
-                    llm=_create_llm(norm_model, resolved=critique_resolved),
-                    listing=listing,
-                    prerequisites=prerequisites,
-                    thinking=thinking,
-                )
+                norm_result = await norm_task
                 evaluation.update(norm_result)
             except JobCancelledError:
                 raise
@@ -472,16 +608,17 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
 
         # ── STEP 3: Critique ───────────────────────────────────
         current_step += 1
-        await update_job_progress(
-            job_id, current_step, total_steps,
+        progress.publish(
+            current_step, total_steps,
             "Generating critique..." if flow.requires_segments else "Comparing outputs...",
             listing_id=listing_id, run_id=str(eval_run_id),
         )
         await check_cancel()
 
         try:
+            critique_model = step_models.get("evaluation") or critique_resolved.model
             _critique_llm = _create_llm(
-                step_models.get("evaluation") or critique_resolved.model,
+                critique_model,
                 resolved=critique_resolved,
             )
             if hasattr(_critique_llm, 'set_call_purpose'):
@@ -493,6 +630,8 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
                 prerequisites=prerequisites,
                 evaluation=evaluation,
                 thinking=thinking,
+                model=f"{critique_resolved.provider}:{critique_model}",
+                cache_tenant_id=tenant_id,
             )
             evaluation.update(critique_result)
         except JobCancelledError:
@@ -501,7 +640,7 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
             raise PipelineStepError(
                 step="critique",
                 message=safe_error_message(e),
-                partial_result=dict(evaluation),
+                partial_result_factory=lambda: dict(evaluation),
             ) from e
 
         evaluation["status"] = "completed"
@@ -511,43 +650,24 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
         summary_data = _build_summary(flow, evaluation)
 
         # ── Save result to evaluation_runs ───────────────────────────────
-        completed_at = datetime.now(timezone.utc)
-        duration_ms = (time.monotonic() - start_time) * 1000
-
-        async with async_session() as db:
-            result = await db.execute(
-                update(EvaluationRun)
-                .where(
-                    EvaluationRun.id == eval_run_id,
-                    EvaluationRun.tenant_id == tenant_id,
-                    EvaluationRun.status != "cancelled",  # Don't overwrite cancel
-                )
-                .values(
-                    status="completed",
-                    completed_at=completed_at,
-                    duration_ms=duration_ms,
-                    result=evaluation,
-                    summary=summary_data,
-                )
+        # One reading so the stored duration_ms and returned duration_seconds agree.
+        duration = time.monotonic() - start_time
+        completed = await _write_terminal_state(
+            eval_run_id,
+            tenant_id,
+            api_logs=api_logs,
+            analytics_owner=(app_id, user_id),
+            status="completed",
+            duration_ms=duration * 1000,
+            result=evaluation,
+            summary=summary_data,
+        )
+        if not completed:
+            logger.info(
+                "Eval run %s was cancelled before completion write — skipping",
+                eval_run_id,
             )
-            await db.commit()
-            if result.rowcount == 0:
-                logger.info(
-                    "Eval run %s was cancelled before completion write — skipping",
-                    eval_run_id,
-                )
-
-        # Submit analytics population job (fire-and-forget)
-        if result.rowcount > 0:
-            try:
-                from app.services.analytics import submit_analytics_job
-                async with async_session() as db:
-                    await submit_analytics_job(db=db, run_id=eval_run_id, app_id=app_id, tenant_id=tenant_id, user_id=user_id)
-                    await db.commit()
-            except Exception:
-                logger.warning("Failed to submit analytics job for run %s", eval_run_id, exc_info=True)
 
-        duration = time.monotonic() - start_time
         return {
             "listing_id": listing_id,
             "eval_run_id": str(eval_run_id),
@@ -557,20 +677,15 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
 
     except JobCancelledError:
         evaluation["status"] = "cancelled"
-        await finalize_eval_run(
+        await _write_terminal_state(
             eval_run_id,
             tenant_id,
+            api_logs=api_logs,
+            analytics_owner=(app_id, user_id),
             status="cancelled",
             duration_ms=(time.monotonic() - start_time) * 1000,
             result=evaluation,
         )
-        try:
-            from app.services.analytics import submit_analytics_job
-            async with async_session() as db:
-                await submit_analytics_job(db=db, run_id=eval_run_id, app_id=app_id, tenant_id=tenant_id, user_id=user_id)
-                await db.commit()
-        except Exception:
-            logger.warning("Failed to submit analytics job for run %s", eval_run_id, exc_info=True)
         logger.info("Voice-RX evaluation for %s cancelled", listing_id)
         return {"listing_id": listing_id, "eval_run_id": str(eval_run_id), "status": "cancelled"}
 
@@ -587,9 +702,10 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
         # Generate partial summary so list views show what was computed
         partial_summary = _build_summary(flow, evaluation)
 
-        await finalize_eval_run(
+        await _write_terminal_state(
             eval_run_id,
             tenant_id,
+            api_logs=api_logs,
             status="failed",
             duration_ms=(time.monotonic() - start_time) * 1000,
             error_message=f"[{e.step}] {e.message}",
@@ -606,9 +722,10 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
         # Generate partial summary so list views show what was computed
         partial_summary = _build_summary(flow, evaluation)
 
-        await finalize_eval_run(
+        await _write_terminal_state(
             eval_run_id,
             tenant_id,
+            api_logs=api_logs,
             status="failed",
             duration_ms=(time.monotonic() - start_time) * 1000,
             error_message=error_msg,
@@ -617,6 +734,52 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
         )
         raise
 
+    finally:
+        if norm_task is not None:
+            # No-op once awaited; otherwise stops it and retrieves its outcome.
+            norm_task.cancel()
+            await asyncio.gather(norm_task, return_exceptions=True)
+        await progress.close()
+        try:
+            await api_logs.flush()
+        except Exception:
+            logger.warning("Failed to save API logs for run %s", eval_run_id, exc_info=True)
+
+
+async def _write_terminal_state(
+    eval_run_id: uuid.UUID,
+    tenant_id: uuid.UUID,
+    *,
+    api_logs: ApiLogBuffer,
+    analytics_owner: tuple[str, uuid.UUID] | None = None,
+    **finalize_kwargs,
+) -> bool:
+    """Write the terminal run state, buffered API logs and analytics job in one transaction.
+
+    ``analytics_owner`` is ``(app_id, user_id)`` for branches that queue
+    analytics. Logs and analytics each run in a savepoint so a failure there
+    is logged without losing the terminal write. Returns finalize_eval_run's
+    result.
+    """
+    async with async_session() as db:
+        updated = await finalize_eval_run(eval_run_id, tenant_id, db=db, **finalize_kwargs)
+        try:
+            async with db.begin_nested():
+                await api_logs.flush(db=db)
+        except Exception:
+            logger.warning("Failed to save API logs for run %s", eval_run_id, exc_info=True)
+        if updated and analytics_owner is not None:
+            app_id, user_id = analytics_owner
+            try:
+                async with db.begin_nested():
+                    await submit_analytics_job(
+                        db=db, run_id=eval_run_id, app_id=app_id, tenant_id=tenant_id, user_id=user_id,
+                    )
+            except Exception:
+                logger.warning("Failed to submit analytics job for run %s", eval_run_id, exc_info=True)
+        await db.commit()
+    return updated
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Step functions (FlowConfig-driven pipeline)
@@ -626,6 +789,8 @@ async def run_voice_rx_evaluation(job_id, params: dict, *, tenant_id: uuid.UUID,
 async def _run_transcription(
     flow: FlowConfig, llm, listing, audio_bytes, mime_type,
     prompt_text, schema, prerequisites, thinking: str = "low",
+    *, audio_digest: str = "", read_audio: Callable[[], Awaitable[bytes]] | None = None,
+    model: str = "", cache_tenant_id: uuid.UUID | None = None,
 ) -> dict:
     """Step 1: Transcription.
 
@@ -635,6 +800,11 @@ async def _run_transcription(
     Returns dict to merge into evaluation:
       Upload: { "judgeOutput": { "transcript": str, "segments": [...] } }
       API:    { "judgeOutput": { "transcript": str, "structuredData": {...} } }
+
+    When ``cache_tenant_id`` is set, an identical earlier request (same audio,
+    prompt, schema, model) reuses its stored response instead of calling the LLM.
+    ``audio_bytes`` may be None when ``audio_digest`` is known; ``read_audio``
+    then fetches the bytes only if the LLM has to be called.
     """
     resolve_ctx = {
         "listing": {
@@ -644,9 +814,9 @@ async def _run_transcription(
         },
         "prerequisites": prerequisites,
         "use_segments": flow.use_segments_in_prompts,
+        "audio_marker": AUDIO_ATTACHED_MARKER,
     }
-    resolved = resolve_prompt(prompt_text, resolve_ctx)
-    final_prompt = resolved["prompt"].replace("{{audio}}", "[Audio file attached]")
+    final_prompt = resolve_prompt(prompt_text, resolve_ctx)["prompt"]
 
     if not schema:
         raise ValueError(f"No transcription schema configured for {flow.flow_type} flow.")
@@ -694,19 +864,31 @@ async def _run_transcription(
         )
         final_prompt = script_directive + final_prompt
 
-    response_text = await llm.generate_with_audio(
-        prompt=final_prompt,
-        audio_bytes=audio_bytes,
-        mime_type=mime_type,
-        json_schema=schema,
-        system_prompt=transcription_sys,
-        thinking=thinking,
-    )
+    cache_key = None
+    response_text = None
+    if cache_tenant_id is not None:
+        cache_key = _transcription_cache_key(
+            audio_digest or await _audio_digest(audio_bytes),
+            mime_type, final_prompt, transcription_sys, schema, model, thinking,
+        )
+        response_text = await read_cached_response(CacheTranscription, cache_tenant_id, cache_key)
+    cache_hit = response_text is not None
+    if not cache_hit:
+        if audio_bytes is None:
+            audio_bytes = await read_audio()
+        response_text = await llm.generate_with_audio(
+            prompt=final_prompt,
+            audio_bytes=audio_bytes,
+            mime_type=mime_type,
+            json_schema=schema,
+            system_prompt=transcription_sys,
+            thinking=thinking,
+        )
 
     if flow.requires_segments:
         # Upload flow: parse into segments structure
-        transcript_data = parse_transcript_response(response_text)
-        return {
+        transcript_data = await _parse_llm_text(parse_transcript_response, response_text)
+        result = {
             "judgeOutput": {
                 "transcript": transcript_data.get("fullTranscript", ""),
                 "segments": transcript_data.get("segments", []),
@@ -715,7 +897,7 @@ async def _run_transcription(
     else:
         # API flow: response must have {input, rx} matching real API shape
         if isinstance(response_text, str):
-            parsed, was_repaired = _safe_parse_json(response_text)
+            parsed, was_repaired = await _parse_llm_text(_safe_parse_json, response_text)
             if was_repaired:
                 logger.warning(
                     "Transcription response required JSON repair for listing %s — "
@@ -742,16 +924,45 @@ async def _run_transcription(
                 "The transcription schema may be wrong.",
             )
 
-        return {
+        result = {
             "judgeOutput": {
                 "transcript": judge_transcript,
                 "structuredData": judge_rx,
             },
         }
 
+    # Written only after parsing succeeds so a malformed response is never replayed.
+    if cache_key is not None and not cache_hit and isinstance(response_text, str):
+        await write_cached_response(
+            CacheTranscription, cache_tenant_id, cache_key, response_text, _TRANSCRIPTION_CACHE_TTL,
+        )
+    return result
+
+
+async def _parse_llm_text(parser: Callable, text):
+    """Run ``parser`` on an LLM response, off the event loop when the text is large."""
+    if isinstance(text, str) and len(text) > _PARSE_IN_THREAD_CHARS:
+        return await asyncio.to_thread(parser, text)
+    return parser(text)
+
+
+async def _audio_digest(audio_bytes: bytes) -> str:
+    """sha256 hex digest of the audio, computed once per run."""
+    # hashlib releases the GIL on large buffers; multi-MB audio shouldn't stall the loop.
+    return (await asyncio.to_thread(hashlib.sha256, audio_bytes)).hexdigest()
+
+
+def _transcription_cache_key(
+    audio_digest: str, mime_type: str, prompt: str, system_prompt: str,
+    schema: dict, model: str, thinking: str,
+) -> str:
+    """Hash every input that shapes the transcription request."""
+    return request_cache_key(audio_digest, mime_type, prompt, system_prompt, schema, model, thinking)
+
 
 async def _run_normalization(
     flow: FlowConfig, llm, listing, prerequisites, thinking: str = "low",
+    *, model: str = "", cache_tenant_id: uuid.UUID | None = None,
 ) -> dict:
     """Step 2: Normalization (optional).
 
@@ -760,6 +971,11 @@ async def _run_normalization(
       - dict with 'segments' -> segment-level normalization (upload flow)
       - str -> plain text normalization (API flow)
 
+    When ``cache_tenant_id`` is set, an earlier normalization of identical
+    input (transcript, scripts, language, ``model``) is reused instead of
+    calling the LLM: from this worker's memory, else from an earlier run of
+    the same listing.
+
     Returns dict to merge into evaluation:
       { "normalizedOriginal": { "fullTranscript": str, "segments"?: [...] },
         "normalizationMeta": { "enabled": true, ... } }
@@ -770,6 +986,18 @@ async def _run_normalization(
                     prerequisites.get("source_script", "Devanagari"))
     language = prerequisites.get("language", "the source language")
 
+    # The prompt tells the model to return same-script text unchanged, so the
+    # call would only echo the original back.
+    if source_script != "auto" and source_script.strip().casefold() == target_script.strip().casefold():
+        return {
+            "normalizationMeta": {
+                "enabled": True,
+                "skipped": True,
+                "sourceScript": source_script,
+                "targetScript": target_script,
+            },
+        }
+
     # Determine input based on what the listing actually has (not flow flag)
     source_input = _get_normalization_source(listing, flow)
 
@@ -777,27 +1005,67 @@ async def _run_normalization(
         # Nothing to normalize — skip silently
         return {}
 
-    normalized_data = await _normalize_transcript(
-        llm=llm,
-        transcript_input=source_input,
-        source_script=source_script,
-        target_script=target_script,
-        language=language,
-        thinking=thinking,
-    )
+    source_key = request_cache_key(source_input, source_script, target_script, language, model, thinking)
+    normalized_data = None
+    if cache_tenant_id is not None:
+        normalized_data = await _load_prior_normalization(listing.id, cache_tenant_id, source_key)
+    reused = normalized_data is not None
+    if not reused:
+        normalized_data = await _normalize_transcript(
+            llm=llm,
+            transcript_input=source_input,
+            source_script=source_script,
+            target_script=target_script,
+            language=language,
+            thinking=thinking,
+        )
+        if normalized_data and cache_tenant_id is not None:
+            _NORMALIZATION_CACHE.set((cache_tenant_id, source_key), copy.deepcopy(normalized_data))
 
     if not normalized_data:
         return {}
 
-    return {
-        "normalizedOriginal": normalized_data,
-        "normalizationMeta": {
-            "enabled": True,
-            "sourceScript": source_script,
-            "targetScript": target_script,
-            "normalizedAt": datetime.now(timezone.utc).isoformat(),
-        },
+    meta = {
+        "enabled": True,
+        "sourceScript": source_script,
+        "targetScript": target_script,
+        "normalizedAt": normalized_data["generatedAt"],
+        "sourceKey": source_key,
     }
+    if reused:
+        meta["reused"] = True
+    return {"normalizedOriginal": normalized_data, "normalizationMeta": meta}
+
+
+async def _load_prior_normalization(listing_id, tenant_id: uuid.UUID, source_key: str) -> dict | None:
+    """Return a cached normalization for ``source_key``, or the newest earlier one of this listing, or None."""
+
+    async def _load() -> dict:
+        async with read_session() as db:
+            normalized = await db.scalar(
+                select(EvaluationRun.result["normalizedOriginal"])
+                .where(
+                    EvaluationRun.listing_id == listing_id,
+                    EvaluationRun.tenant_id == tenant_id,
+                    EvaluationRun.eval_type == "full_evaluation",
+                    EvaluationRun.result["normalizationMeta"]["sourceKey"].as_string() == source_key,
+                )
+                .order_by(EvaluationRun.created_at.desc())
+                .limit(1)
+            )
+        if normalized is None:
+            raise _NoPriorNormalization
+        return normalized
+
+    try:
+        normalized = await _NORMALIZATION_CACHE.get_or_load((tenant_id, source_key), _load)
+    except _NoPriorNormalization:
+        return None
+    except Exception:
+        logger.warning("Prior normalization lookup failed for listing %s", listing_id, exc_info=True)
+        return None
+    # The run merges this into its result; keep the cached copy pristine.
+    return copy.deepcopy(normalized)
 
 
 def _get_normalization_source(listing, _flow: FlowConfig):
@@ -820,6 +1088,33 @@ def _get_normalization_source(listing, _flow: FlowConfig):
     return None
 
 
+def _batch_segments_by_size(segments: list, max_chars: int) -> list[tuple[list, str]]:
+    """Split segments into consecutive batches whose serialized size stays under ``max_chars``.
+
+    Returns ``(batch, batch_json)`` pairs; the JSON is assembled from the
+    per-segment encodings used for sizing, so each segment is serialized once.
+    """
+    batches: list[tuple[list, str]] = []
+    current: list = []
+    current_json: list[str] = []
+    current_chars = 0
+
+    def _close() -> None:
+        batches.append((current, '{"segments":[' + ",".join(current_json) + "]}"))
+
+    for seg in segments:
+        seg_json = json.dumps(seg, ensure_ascii=False, separators=(",", ":"))
+        if current and current_chars + len(seg_json) > max_chars:
+            _close()
+            current, current_json, current_chars = [], [], 0
+        current.append(seg)
+        current_json.append(seg_json)
+        current_chars += len(seg_json)
+    if current:
+        _close()
+    return batches
+
+
 async def _normalize_transcript(llm, transcript_input, source_script, target_script, language, thinking: str = "low") -> dict | None:
     """Core normalization function. Accepts any format, returns consistent shape.
 
@@ -842,39 +1137,55 @@ async def _normalize_transcript(llm, transcript_input, source_script, target_scr
 
     if has_segments:
         # ── Segment-level normalization ──
-        prompt = NORMALIZATION_PROMPT.format(
-            target_script=target_display,
-            source_instruction=source_instruction,
-            language=language,
-            transcript_json=json.dumps(transcript_input, indent=2),
-        )
         schema = build_normalization_schema(target_display)
-        result = await llm.generate_json(
-            prompt=prompt,
-            system_prompt=NORMALIZATION_SYSTEM_PROMPT,
-            json_schema=schema,
-            thinking=thinking,
-        )
-
-        norm_segments = result.get("segments", [])
-        if not norm_segments:
-            return None
-
-        orig_segments = transcript_input.get("segments", [])
-        normalized_segments = []
-        for idx, seg in enumerate(norm_segments):
-            normalized_segments.append({
+        # Compact and unescaped: \uXXXX escapes and indentation multiply the
+        # token count of non-Latin transcripts without helping the model.
+        transcript_json = json.dumps(transcript_input, ensure_ascii=False, separators=(",", ":"))
+        if len(transcript_json) <= _NORMALIZATION_BATCH_CHARS:
+            batches = [(transcript_input["segments"], transcript_json)]
+        else:
+            batches = _batch_segments_by_size(transcript_input["segments"], _NORMALIZATION_BATCH_CHARS)
+            logger.info("Normalizing %d segments in %d batches", len(transcript_input["segments"]), len(batches))
+
+        async def _normalize_batch(batch_json: str) -> list:
+            prompt = build_normalization_prompt(batch_json, target_display, source_instruction, language)
+            result = await llm.generate_json(
+                prompt=prompt,
+                system_prompt=NORMALIZATION_SYSTEM_PROMPT,
+                json_schema=schema,
+                thinking=thinking,
+            )
+            return result.get("segments", [])
+
+        # Sequential: the logging wrapper reads per-call usage off the shared
+        # provider after each await, so overlapping calls would misattribute it.
+        batch_results = []
+        for _, batch_json in batches:
+            norm_segments = await _normalize_batch(batch_json)
+            if not norm_segments:
+                return None
+            batch_results.append(norm_segments)
+
+        # Seconds come from the original segment at the same position; extra
+        # model segments pair with an empty mapping and get None.
+        normalized_segments = [
+            {
                 "speaker": seg.get("speaker", "Unknown"),
                 "text": seg.get("text", ""),
                 "startTime": seg.get("startTime", "00:00:00"),
                 "endTime": seg.get("endTime", "00:00:00"),
-                "startSeconds": orig_segments[idx].get("startSeconds") if idx < len(orig_segments) else None,
-                "endSeconds": orig_segments[idx].get("endSeconds") if idx < len(orig_segments) else None,
-            })
+                "startSeconds": orig.get("startSeconds"),
+                "endSeconds": orig.get("endSeconds"),
+            }
+            for (orig_segments, _), norm_segments in zip(batches, batch_results)
+            for seg, orig in zip(norm_segments, itertools.chain(orig_segments, itertools.repeat(_EMPTY_SEGMENT)))
+        ]
 
-        full_transcript = "\n".join(
+        # A list lets str.join size the result in one pass; a generator is
+        # copied into a growing list first.
+        full_transcript = "\n".join([
             f"[{s['speaker']}]: {s['text']}" for s in normalized_segments
-        )
+        ])
         return {
             "fullTranscript": full_transcript,
             "segments": normalized_segments,
@@ -883,12 +1194,7 @@ async def _normalize_transcript(llm, transcript_input, source_script, target_scr
     else:
         # ── Plain text normalization ──
         text = transcript_input if isinstance(transcript_input, str) else str(transcript_input)
-        prompt = NORMALIZATION_PROMPT_PLAIN.format(
-            target_script=target_display,
-            source_instruction=source_instruction,
-            language=language,
-            transcript_text=text,
-        )
+        prompt = build_normalization_prompt(text, target_display, source_instruction, language, plain=True)
         schema = build_normalization_schema_plain(target_display)
         result = await llm.generate_json(
             prompt=prompt,
@@ -909,6 +1215,7 @@ async def _normalize_transcript(llm, transcript_input, source_script, target_scr
 
 async def _run_critique(
     flow: FlowConfig, llm, listing, prerequisites, evaluation, thinking: str = "low",
+    *, model: str = "", cache_tenant_id: uuid.UUID | None = None,
 ) -> dict:
     """Step 3: Critique/comparison — TEXT ONLY (no audio).
 
@@ -919,8 +1226,13 @@ async def _run_critique(
     Upload flow: Segment-level comparison (original vs judge).
     API flow: Field-level comparison (API output vs judge output).
 
+    When ``cache_tenant_id`` is set, an identical prior request (same prompt,
+    schema and ``model``) is served from ``cache_critique``; the prompt embeds
+    both transcripts and the rubric, so either changing misses the cache.
+
     Returns dict to merge into evaluation:
-      { "critique": { unified shape }, "_original_segment_count": int }
+      { "critique": { unified shape }, "_original_segment_count": int,
+        "critiqueFromCache": True (on cache hit only) }
     """
     judge_output = evaluation.get("judgeOutput", {})
     normalized = evaluation.get("normalizedOriginal")
@@ -928,40 +1240,22 @@ async def _run_critique(
     if flow.requires_segments:
         # ── Upload flow critique ──
         # Use normalized transcript if available, else original
-        original_transcript = listing.transcript or {}
         if normalized and "segments" in normalized:
-            original_transcript = {**listing.transcript, **normalized}
-
-        original_segments = original_transcript.get("segments", [])
+            original_segments = normalized["segments"]
+        else:
+            original_segments = (listing.transcript or {}).get("segments", [])
         judge_segments = judge_output.get("segments", [])
         total_segments = max(len(original_segments), len(judge_segments))
 
-        # Build indexed comparison table (server-side)
-        table_lines = []
-        for i in range(total_segments):
-            orig = original_segments[i] if i < len(original_segments) else {}
-            judge = judge_segments[i] if i < len(judge_segments) else {}
-            orig_speaker = orig.get("speaker", "?")
-            orig_text = orig.get("text", "[missing]")
-            judge_speaker = judge.get("speaker", "?")
-            judge_text = judge.get("text", "[missing]")
-            table_lines.append(
-                f"Segment {i}: Original=[{orig_speaker}]: {orig_text} | Judge=[{judge_speaker}]: {judge_text}"
-            )
-        comparison_table = "\n".join(table_lines)
+        comparison_table = _build_segment_comparison_table(original_segments, judge_segments)
 
-        # Format prompt with table (no template variables)
-        prompt = UPLOAD_EVALUATION_PROMPT.format(
-            segment_count=total_segments,
-            comparison_table=comparison_table,
-        )
+        # Static rubric prefix + per-run table suffix (prefix is prompt-cacheable)
+        prompt = build_upload_evaluation_prompt(total_segments, comparison_table)
 
         # Call generate_json — NO AUDIO
-        critique_text = await llm.generate_json(
-            prompt=prompt,
-            system_prompt=CRITIQUE_SYSTEM_PROMPT,
-            json_schema=UPLOAD_EVALUATION_SCHEMA,
-            thinking=thinking,
+        critique_text, cache_key, cache_hit = await _generate_critique_json(
+            llm, prompt, UPLOAD_EVALUATION_SCHEMA, UPLOAD_EVALUATION_PROMPT_PREFIX,
+            thinking, model, cache_tenant_id,
         )
 
         # critique_text is already a dict from generate_json
@@ -979,41 +1273,48 @@ async def _run_critique(
             raise PipelineStepError(
                 step="critique",
                 message="LLM critique response missing 'segments' array",
-                partial_result=dict(evaluation),
+                partial_result_factory=lambda: dict(evaluation),
             )
         if not parsed_critique.get("overallAssessment"):
             logger.warning("Critique response missing overallAssessment — using empty string")
+        if cache_key is not None and not cache_hit:
+            await write_cached_response(
+                CacheCritique, cache_tenant_id, cache_key, parsed_critique, _CRITIQUE_CACHE_TTL,
+            )
 
         # Build critique segments with back-fill
         critique_segments = []
-        for seg in parsed_critique.get("segments", []):
+        original_count, judge_count = len(original_segments), len(judge_segments)
+        for seg in segments_val:
             seg_idx = seg.get("segmentIndex", 0)
             critique_segments.append({
                 "segmentIndex": seg_idx,
-                "originalText": (original_segments[seg_idx].get("text", "") if seg_idx < len(original_segments) else ""),
-                "judgeText": (judge_segments[seg_idx].get("text", "") if seg_idx < len(judge_segments) else ""),
-                "discrepancy": str(seg.get("discrepancy", "")),
-                "likelyCorrect": str(seg.get("likelyCorrect", "unclear")),
+                "originalText": (original_segments[seg_idx].get("text", "") if seg_idx < original_count else ""),
+                "judgeText": (judge_segments[seg_idx].get("text", "") if seg_idx < judge_count else ""),
+                "discrepancy": _as_text(seg.get("discrepancy"), ""),
+                "likelyCorrect": _as_text(seg.get("likelyCorrect"), "unclear"),
                 "confidence": seg.get("confidence"),
-                "severity": str(seg.get("severity", "minor")),
+                "severity": _as_text(seg.get("severity"), "minor"),
                 "category": seg.get("category"),
             })
 
         # Server-side statistics (never trust LLM counts)
         critique_indices = {s["segmentIndex"] for s in critique_segments}
         match_count = total_segments - len(critique_indices)
+        severity_counts = Counter(s["severity"] for s in critique_segments)
+        verdict_counts = Counter(s["likelyCorrect"] for s in critique_segments)
         stats = {
             "totalSegments": total_segments,
-            "criticalCount": sum(1 for s in critique_segments if s["severity"] == "critical"),
-            "moderateCount": sum(1 for s in critique_segments if s["severity"] == "moderate"),
-            "minorCount": sum(1 for s in critique_segments if s["severity"] == "minor"),
+            "criticalCount": severity_counts["critical"],
+            "moderateCount": severity_counts["moderate"],
+            "minorCount": severity_counts["minor"],
             "matchCount": match_count,
-            "originalCorrectCount": sum(1 for s in critique_segments if s["likelyCorrect"] == "original"),
-            "judgeCorrectCount": sum(1 for s in critique_segments if s["likelyCorrect"] == "judge"),
-            "unclearCount": sum(1 for s in critique_segments if s["likelyCorrect"] == "unclear"),
+            "originalCorrectCount": verdict_counts["original"],
+            "judgeCorrectCount": verdict_counts["judge"],
+            "unclearCount": verdict_counts["unclear"],
         }
 
-        return {
+        result = {
             "critique": {
                 "flowType": "upload",
                 "overallAssessment": str(parsed_critique.get("overallAssessment", "")),
@@ -1036,26 +1337,20 @@ async def _run_critique(
         judge_transcript = judge_output.get("transcript", "")
         judge_rx = judge_output.get("structuredData", {})
 
-        # Deep per-field comparison (server-side alignment)
-        comparison_entries = build_deep_comparison(api_rx, judge_rx)
-
-        comparison_parts = [
-            "=== SECTION 1: TRANSCRIPT COMPARISON ===",
-            f"API TRANSCRIPT:\n{api_transcript}",
-            f"\nJUDGE TRANSCRIPT:\n{judge_transcript}",
-            "",
-            "=== SECTION 2: FIELD-LEVEL STRUCTURED DATA (pre-aligned) ===",
-            format_comparison_for_prompt(comparison_entries),
-        ]
-        comparison_text = "\n".join(comparison_parts)
+        # Deep per-field comparison (server-side alignment). Large rx payloads
+        # are aligned in a thread so concurrent runs keep their event-loop slices.
+        if _rx_item_count(api_rx) + _rx_item_count(judge_rx) > _COMPARISON_THREAD_MIN_ITEMS:
+            comparison_text = await asyncio.to_thread(
+                _build_api_comparison_text, api_rx, judge_rx, api_transcript, judge_transcript,
+            )
+        else:
+            comparison_text = _build_api_comparison_text(api_rx, judge_rx, api_transcript, judge_transcript)
 
-        prompt = API_EVALUATION_PROMPT.format(comparison=comparison_text)
+        prompt = build_api_evaluation_prompt(comparison_text)
 
-        raw_critique = await llm.generate_json(
-            prompt=prompt,
-            system_prompt=CRITIQUE_SYSTEM_PROMPT,
-            json_schema=API_EVALUATION_SCHEMA,
-            thinking=thinking,
+        raw_critique, cache_key, cache_hit = await _generate_critique_json(
+            llm, prompt, API_EVALUATION_SCHEMA, API_EVALUATION_PROMPT_PREFIX,
+            thinking, model, cache_tenant_id,
         )
 
         if isinstance(raw_critique, str):
@@ -1067,13 +1362,18 @@ async def _run_critique(
             raise PipelineStepError(
                 step="critique",
                 message="LLM critique response missing 'structuredComparison' object",
-                partial_result=dict(evaluation),
+                partial_result_factory=lambda: dict(evaluation),
+            )
+
+        if cache_key is not None and not cache_hit:
+            await write_cached_response(
+                CacheCritique, cache_tenant_id, cache_key, raw_critique, _CRITIQUE_CACHE_TTL,
             )
 
         raw_critique["generatedAt"] = datetime.now(timezone.utc).isoformat()
         raw_critique["model"] = llm.model_name
 
-        return {
+        result = {
             "critique": {
                 "flowType": "api",
                 "overallAssessment": str(raw_critique.get("overallAssessment", "")),
@@ -1085,6 +1385,72 @@ async def _run_critique(
             },
         }
 
+    if cache_hit:
+        result["critiqueFromCache"] = True
+    return result
+
+
+async def _generate_critique_json(
+    llm, prompt: str, schema: dict, cache_prefix: str, thinking: str,
+    model: str, cache_tenant_id: uuid.UUID | None,
+) -> tuple[Any, str | None, bool]:
+    """Run the critique call, serving a cached response when one exists.
+
+    Returns ``(response, cache_key, cache_hit)``; ``cache_key`` is None when
+    caching is off. Callers write the cache only after validating a miss.
+    """
+    cache_key = None
+    if cache_tenant_id is not None:
+        cache_key = request_cache_key(prompt, CRITIQUE_SYSTEM_PROMPT, schema, model, thinking)
+        cached = await read_cached_response(CacheCritique, cache_tenant_id, cache_key)
+        if cached is not None:
+            return cached, cache_key, True
+    response = await llm.generate_json(
+        prompt=prompt,
+        system_prompt=CRITIQUE_SYSTEM_PROMPT,
+        json_schema=schema,
+        thinking=thinking,
+        cache_prefix=cache_prefix,
+    )
+    return response, cache_key, False
+
+
+def _rx_item_count(rx) -> int:
+    """Rough size of an rx payload: list items and object keys per top-level field."""
+    if not isinstance(rx, dict):
+        return 0
+    return sum(len(v) if isinstance(v, (list, dict)) else 1 for v in rx.values())
+
+
+def _build_api_comparison_text(api_rx, judge_rx, api_transcript: str, judge_transcript: str) -> str:
+    """Build the transcript + pre-aligned field comparison block for the API critique."""
+    return "\n".join((
+        "=== SECTION 1: TRANSCRIPT COMPARISON ===",
+        f"API TRANSCRIPT:\n{api_transcript}",
+        f"\nJUDGE TRANSCRIPT:\n{judge_transcript}",
+        "",
+        "=== SECTION 2: FIELD-LEVEL STRUCTURED DATA (pre-aligned) ===",
+        format_comparison_for_prompt(build_deep_comparison(api_rx, judge_rx)),
+    ))
+
+
+def _as_text(value: Any, default: str) -> str:
+    """Coerce an LLM field to text; schema-enforced strings pass through as-is."""
+    if isinstance(value, str):
+        return value
+    return default if value is None else str(value)
+
+
+def _build_segment_comparison_table(original_segments: list, judge_segments: list) -> str:
+    """Build the indexed original-vs-judge segment table for the upload critique."""
+    return "\n".join([
+        f"Segment {i}: Original=[{orig.get('speaker', '?')}]: {orig.get('text', '[missing]')}"
+        f" | Judge=[{judge.get('speaker', '?')}]: {judge.get('text', '[missing]')}"
+        for i, (orig, judge) in enumerate(
+            itertools.zip_longest(original_segments, judge_segments, fillvalue=_EMPTY_SEGMENT)
+        )
+    ])
+
 
 def _build_summary(flow: FlowConfig, evaluation: dict) -> dict | None:
     """Build a consistent summary regardless of flow type.
@@ -1123,44 +1489,35 @@ def _build_summary(flow: FlowConfig, evaluation: dict) -> dict | None:
             summary["overall_accuracy"] = match_count / total
             summary["total_items"] = total
             discrepancy_segments = critique.get("segments", [])
-            severity_dist = _count_severity(discrepancy_segments, key="severity")
-            summary["severity_distribution"] = severity_dist
-            summary["critical_errors"] = severity_dist.get("CRITICAL", 0)
-            summary["moderate_errors"] = severity_dist.get("MODERATE", 0)
-            summary["minor_errors"] = severity_dist.get("MINOR", 0)
+            _add_severity_summary(summary, Counter(seg.get("severity", "none") for seg in discrepancy_segments))
     else:
         # API: count from fieldCritiques
         field_critiques = critique.get("fieldCritiques", [])
         total = len(field_critiques)
         if total > 0:
-            matches = sum(1 for fc in field_critiques if fc.get("match", False))
+            matches = api_extracted = api_correct = 0
+            raw_severities: Counter = Counter()
+            for fc in field_critiques:
+                matched = bool(fc.get("match", False))
+                matches += matched
+                if str(fc.get("apiValue", "(not found)")) != "(not found)":
+                    api_extracted += 1
+                    api_correct += matched
+                raw_severities[fc.get("severity", "none")] += 1
             summary["overall_accuracy"] = matches / total
             summary["total_items"] = total
 
             # Extraction Recall: how many items did the API capture?
-            api_extracted = sum(
-                1 for fc in field_critiques
-                if str(fc.get("apiValue", "(not found)")) != "(not found)"
-            )
             summary["extraction_recall"] = api_extracted / total if total > 0 else 0
             summary["api_extracted_count"] = api_extracted
 
             # Extraction Precision: of what the API extracted, how many were correct?
-            api_correct = sum(
-                1 for fc in field_critiques
-                if str(fc.get("apiValue", "(not found)")) != "(not found)"
-                and fc.get("match", False)
-            )
             summary["extraction_precision"] = (
                 api_correct / api_extracted if api_extracted > 0 else 0
             )
             summary["api_correct_count"] = api_correct
 
-            severity_dist = _count_severity(field_critiques, key="severity")
-            summary["severity_distribution"] = severity_dist
-            summary["critical_errors"] = severity_dist.get("CRITICAL", 0)
-            summary["moderate_errors"] = severity_dist.get("MODERATE", 0)
-            summary["minor_errors"] = severity_dist.get("MINOR", 0)
+            _add_severity_summary(summary, raw_severities)
 
         # Also check for well-known score keys from rawOutput
         raw = critique.get("rawOutput", {})
@@ -1172,12 +1529,24 @@ def _build_summary(flow: FlowConfig, evaluation: dict) -> dict | None:
     return summary if len(summary) > 1 else None
 
 
-def _count_severity(items: list, key: str = "severity") -> dict:
-    """Count severity distribution from a list of items."""
-    dist = {}
-    for item in items:
-        sev = str(item.get(key, "none")).upper()
-        dist[sev] = dist.get(sev, 0) + 1
+def _add_severity_summary(summary: dict, raw_counts: Counter) -> None:
+    """Set the severity distribution and per-level error counts on ``summary``."""
+    severity_dist = _fold_severity_counts(raw_counts)
+    summary["severity_distribution"] = dict(severity_dist)
+    summary["critical_errors"] = severity_dist["CRITICAL"]
+    summary["moderate_errors"] = severity_dist["MODERATE"]
+    summary["minor_errors"] = severity_dist["MINOR"]
+
+
+def _fold_severity_counts(raw_counts: Counter) -> Counter:
+    """Merge raw severity counts under upper-cased labels.
+
+    Callers count raw values so the per-item work is a single dict lookup;
+    only the handful of distinct keys are case-folded here.
+    """
+    dist: Counter = Counter()
+    for raw, count in raw_counts.items():
+        dist[str(raw).upper()] += count
     return dist
 
 
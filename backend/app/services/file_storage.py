@@ -5,6 +5,8 @@ import aiofiles
 from pathlib import Path
 from app.config import settings
 
+_BLOB_DOWNLOAD_CONCURRENCY = 4
+
 
 class FileStorageService:
     """Handles file read/write to local disk or Azure Blob Storage."""
@@ -48,7 +50,8 @@ class FileStorageService:
             async with client:
                 container = client.get_container_client(settings.AZURE_STORAGE_CONTAINER)
                 blob = container.get_blob_client(storage_path)
-                stream = await blob.download_blob()
+                # Parallel ranged GETs; multi-MB recordings otherwise download on one connection.
+                stream = await blob.download_blob(max_concurrency=_BLOB_DOWNLOAD_CONCURRENCY)
                 return await stream.readall()
 
         raise NotImplementedError(f"Read not implemented for {settings.FILE_STORAGE_TYPE}")
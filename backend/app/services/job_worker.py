@@ -17,7 +17,9 @@ import traceback
 import uuid
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy import JSON, and_, bindparam, cast, func, literal_column, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
 from app.config import settings
@@ -555,26 +557,42 @@ async def recover_stale_eval_runs():
     correct terminal state.
     """
     async with async_session() as db:
-        result = await db.execute(
-            select(EvaluationRun)
+        # Only the ids and the job's status are needed; loading full rows would
+        # pull each run's config/result JSONB and one job per run.
+        stale_runs = (await db.execute(
+            select(EvaluationRun.id, EvaluationRun.job_id, BackgroundJob.status)
             .join(BackgroundJob, EvaluationRun.job_id == BackgroundJob.id)
             .where(
                 EvaluationRun.status.in_(("pending", "running")),
                 BackgroundJob.status.in_(["completed", "failed", "cancelled"]),
             )
-        )
-        stale_runs = result.scalars().all()
-        for run in stale_runs:
-            job = await db.get(BackgroundJob, run.job_id)
-            run.status = "cancelled" if job.status == "cancelled" else "failed"
-            run.error_message = "Run was recovered after a server restart."
-            run.completed_at = datetime.now(timezone.utc)
+        )).all()
+        if not stale_runs:
+            return
+        now = datetime.now(timezone.utc)
+        for terminal_status in ("cancelled", "failed"):
+            run_ids = [
+                run_id for run_id, _, job_status in stale_runs
+                if (job_status == "cancelled") == (terminal_status == "cancelled")
+            ]
+            if not run_ids:
+                continue
+            await db.execute(
+                update(EvaluationRun)
+                .where(EvaluationRun.id.in_(run_ids), EvaluationRun.status.in_(("pending", "running")))
+                .values(
+                    status=terminal_status,
+                    error_message="Run was recovered after a server restart.",
+                    completed_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+        for run_id, job_id, job_status in stale_runs:
             logger.warning(
-                f"Recovered stale eval_run {run.id} (job {run.job_id} was {job.status})"
+                f"Recovered stale eval_run {run_id} (job {job_id} was {job_status})"
             )
-        if stale_runs:
-            await db.commit()
-            logger.info(f"Recovered {len(stale_runs)} stale eval_run(s)")
+        await db.commit()
+        logger.info(f"Recovered {len(stale_runs)} stale eval_run(s)")
 
 
 class JobCancelledError(Exception):
@@ -728,37 +746,58 @@ async def process_job(job_id, job_type: str, params: dict) -> dict:
 
 
 async def update_job_progress(
-    job_id, current: int, total: int, message: str = "", **extra
+    job_id, current: int, total: int, message: str = "",
+    *, db: AsyncSession | None = None, **extra
 ):
     """Update job progress (called from within handlers).
 
     Extra kwargs (run_id, listing_id, evaluator_id, etc.) are merged into
     the progress dict.  Preserves run_id from existing progress unless
     explicitly overridden.
+
+    Pass ``db`` to reuse a session the caller already holds (batches that
+    write many updates); the caller must not use it concurrently.
     """
+    if db is not None:
+        await _write_job_progress(db, job_id, current, total, message, extra)
+        return
     async with async_session() as db:
-        job = await db.get(BackgroundJob, job_id)
-        if not job:
-            return
-
-        new_progress = {
-            "current": current,
-            "total": total,
-            "message": message,
-            **extra,
-        }
-
-        # Preserve run_id from previous progress (first-class metadata).
-        # run_id is semantically a relationship (eval_run → job) stored in
-        # the progress dict; it must survive overwrites from step updates.
-        existing_run_id = (
-            job.progress.get("run_id") if isinstance(job.progress, dict) else None
+        await _write_job_progress(db, job_id, current, total, message, extra)
+
+
+# Built once: progress writes are the hottest UPDATE in the worker. The stored
+# run_id is merged under the new dict in SQL so it survives without a SELECT.
+_PROGRESS_UPDATE_STMT = (
+    update(BackgroundJob)
+    .where(BackgroundJob.id == bindparam("b_job_id"))
+    .values(
+        progress=cast(
+            func.jsonb_strip_nulls(
+                func.jsonb_build_object(
+                    literal_column("'run_id'"),
+                    cast(BackgroundJob.progress, JSONB)["run_id"],
+                )
+            ).op("||")(bindparam("b_progress", type_=JSONB)),
+            JSON,
         )
-        if existing_run_id and "run_id" not in extra:
-            new_progress["run_id"] = existing_run_id
+    )
+    .execution_options(synchronize_session=False)
+)
 
-        job.progress = new_progress
-        await db.commit()
+
+async def _write_job_progress(
+    db: AsyncSession, job_id, current: int, total: int, message: str, extra: dict
+) -> None:
+    new_progress = {
+        "current": current,
+        "total": total,
+        "message": message,
+        **extra,
+    }
+    await db.execute(
+        _PROGRESS_UPDATE_STMT, {"b_job_id": job_id, "b_progress": new_progress}
+    )
+    await db.commit()
 
 
 def mark_job_cancelled(job_id) -> None:
@@ -799,11 +838,11 @@ async def is_job_cancelled(job_id, tenant_id: uuid.UUID | None = None) -> bool:
         return False
     _cancel_check_times[job_key] = now
     async with async_session() as db:
-        stmt = select(BackgroundJob).where(BackgroundJob.id == job_id, BackgroundJob.status == "cancelled")
+        # Existence check only — don't load the job's JSON params/progress/result.
+        stmt = select(BackgroundJob.id).where(BackgroundJob.id == job_id, BackgroundJob.status == "cancelled")
         if tenant_id is not None:
             stmt = stmt.where(BackgroundJob.tenant_id == tenant_id)
-        job = await db.scalar(stmt)
-        if job is not None:
+        if await db.scalar(stmt) is not None:
             _cancelled_jobs.add(job_key)
             return True
     return False
@@ -1222,7 +1261,7 @@ async def cascade_dependency_failures(db=None, *, commit: bool = True) -> int:
 
 
 async def recovery_loop():
-    """Periodically recover stale jobs, eval runs, and cascade dependency failures."""
+    """Periodically recover stale jobs, eval runs, cascade dependency failures and prune the LLM cache."""
     logger.info("Recovery loop started (interval=300s)")
     while True:
         await asyncio.sleep(300)
@@ -1231,6 +1270,8 @@ async def recovery_loop():
             await recover_stale_eval_runs()
             await recover_stale_source_sync_runs()
             await cascade_dependency_failures()
+            from app.services.evaluators.llm_cache import prune_expired_responses
+            await prune_expired_responses()
         except Exception as e:
             logger.error(f"Recovery loop error: {e}")
 
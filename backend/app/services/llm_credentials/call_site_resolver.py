@@ -17,7 +17,7 @@ import time
 import uuid
 from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.cost import RefLlmModelsCatalog
@@ -128,28 +128,30 @@ def invalidate_call_site_cache(
         _CACHE.pop(key, None)
 
 
+# Built once at import so each lookup reuses the same statement object and
+# its compiled-cache key instead of reconstructing the SELECT per call.
+_DEFAULT_ROW_STMT = (
+    select(TenantCallSiteDefault)
+    .where(
+        or_(
+            TenantCallSiteDefault.tenant_id == bindparam("tenant_id"),
+            TenantCallSiteDefault.tenant_id.is_(None),
+        ),
+        TenantCallSiteDefault.call_site == bindparam("call_site"),
+    )
+    # false sorts before true, so the tenant row wins when both exist.
+    .order_by(TenantCallSiteDefault.tenant_id.is_(None))
+    .limit(1)
+)
+
+
 async def _lookup_default_row(
     db: AsyncSession, tenant_id: uuid.UUID, call_site: str
 ) -> TenantCallSiteDefault | None:
     """Tenant-specific row first, platform row (``tenant_id IS NULL``) second."""
-    row = (
-        await db.execute(
-            select(TenantCallSiteDefault).where(
-                TenantCallSiteDefault.tenant_id == tenant_id,
-                TenantCallSiteDefault.call_site == call_site,
-            )
-        )
-    ).scalar_one_or_none()
-    if row is not None:
-        return row
-    return (
-        await db.execute(
-            select(TenantCallSiteDefault).where(
-                TenantCallSiteDefault.tenant_id.is_(None),
-                TenantCallSiteDefault.call_site == call_site,
-            )
-        )
-    ).scalar_one_or_none()
+    return await db.scalar(
+        _DEFAULT_ROW_STMT, {"tenant_id": tenant_id, "call_site": call_site},
+    )
 
 
 async def _resolve_credentials_with_single_fallback(
@@ -225,14 +227,12 @@ async def _resolve_azure_model(
     (``needs_mapping=true``); ``CallSiteNotConfiguredError`` if the
     deployment doesn't exist at all.
     """
-    dep_row = (
-        await db.execute(
-            select(TenantLlmDeployment).where(
-                TenantLlmDeployment.credential_id == credential_row.id,
-                TenantLlmDeployment.deployment_name == deployment_name,
-            )
+    dep_row = await db.scalar(
+        select(TenantLlmDeployment).where(
+            TenantLlmDeployment.credential_id == credential_row.id,
+            TenantLlmDeployment.deployment_name == deployment_name,
         )
-    ).scalar_one_or_none()
+    )
     if dep_row is None:
         raise CallSiteNotConfiguredError(
             f"Azure deployment '{deployment_name}' is not declared on this tenant's "
@@ -246,13 +246,11 @@ async def _resolve_azure_model(
             f"/admin/ai-settings/credentials/{credential_row.id}/deployments "
             f"before using it as a default for call site '{call_site}'."
         )
-    catalog_row = (
-        await db.execute(
-            select(RefLlmModelsCatalog).where(
-                RefLlmModelsCatalog.id == dep_row.canonical_model_id
-            )
+    catalog_row = await db.scalar(
+        select(RefLlmModelsCatalog).where(
+            RefLlmModelsCatalog.id == dep_row.canonical_model_id
         )
-    ).scalar_one_or_none()
+    )
     if catalog_row is None:
         # Deployment maps to a catalog row that no longer exists — refuse.
         raise CallSiteNotConfiguredError(
@@ -266,14 +264,12 @@ async def _resolve_azure_model(
 async def _resolve_non_azure_model(
     db: AsyncSession, provider: str, model: str, call_site: str
 ) -> RefLlmModelsCatalog:
-    catalog_row = (
-        await db.execute(
-            select(RefLlmModelsCatalog).where(
-                RefLlmModelsCatalog.provider == provider,
-                RefLlmModelsCatalog.model == model,
-            )
+    catalog_row = await db.scalar(
+        select(RefLlmModelsCatalog).where(
+            RefLlmModelsCatalog.provider == provider,
+            RefLlmModelsCatalog.model == model,
         )
-    ).scalar_one_or_none()
+    )
     if catalog_row is None:
         raise CallSiteNotConfiguredError(
             f"Model '{model}' for provider '{provider}' is not in the catalog "
@@ -396,15 +392,13 @@ async def resolve_llm_call(
     # Look up the credential ORM row again — we need its id for Azure deployments.
     credential_row: TenantLlmCredential | None = None
     if provider == "azure_openai":
-        credential_row = (
-            await db.execute(
-                select(TenantLlmCredential).where(
-                    TenantLlmCredential.tenant_id == tid,
-                    TenantLlmCredential.provider == provider,
-                    TenantLlmCredential.name == creds.name,
-                )
+        credential_row = await db.scalar(
+            select(TenantLlmCredential).where(
+                TenantLlmCredential.tenant_id == tid,
+                TenantLlmCredential.provider == provider,
+                TenantLlmCredential.name == creds.name,
             )
-        ).scalar_one_or_none()
+        )
         if credential_row is None:
             raise CallSiteNotConfiguredError(
                 f"Resolved credential '{creds.name}' for provider '{provider}' "
@@ -124,16 +124,14 @@ async def resolve_credentials(
         return cached[1]
 
     # 1. exact (tenant, provider, name) match
-    row = (
-        await db.execute(
-            select(TenantLlmCredential).where(
-                TenantLlmCredential.tenant_id == tid,
-                TenantLlmCredential.provider == provider,
-                TenantLlmCredential.name == name,
-                TenantLlmCredential.is_enabled.is_(True),
-            )
+    row = await db.scalar(
+        select(TenantLlmCredential).where(
+            TenantLlmCredential.tenant_id == tid,
+            TenantLlmCredential.provider == provider,
+            TenantLlmCredential.name == name,
+            TenantLlmCredential.is_enabled.is_(True),
         )
-    ).scalar_one_or_none()
+    )
 
     # 2. single-credential auto-fallback when default-name asked for and there's exactly one row
     if row is None and name == _DEFAULT_NAME:
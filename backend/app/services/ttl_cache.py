@@ -91,6 +91,15 @@ class TTLCache(Generic[K, V]):
             self._put(key, value)
             return value
 
+    def get(self, key: K) -> V | None:
+        """Return the fresh cached value, or None; never loads."""
+        cached = self._get_fresh(key)
+        return None if cached is _MISSING else cached  # type: ignore[return-value]
+
+    def set(self, key: K, value: V) -> None:
+        """Store ``value`` directly, for callers that produce it outside a loader."""
+        self._put(key, value)
+
     async def _get_lock(self, key: K) -> asyncio.Lock:
         async with self._global_lock:
             lock = self._locks.get(key)
@@ -0,0 +1,65 @@
+import unittest
+
+from app.services.evaluators.comparison_builder import (
+    ComparisonEntry,
+    _compare_array_field,
+    _compare_string_array_field,
+    format_comparison_for_prompt,
+)
+
+
+class FormatComparisonTests(unittest.TestCase):
+    def test_blocks_are_separated_by_blank_lines(self):
+        entries = [
+            ComparisonEntry('rx.medications[0].dosage', '500mg', '500 mg', 'mismatch', 'Amoxicillin'),
+            ComparisonEntry('rx.followUp', '7 days', '7 days', 'match'),
+        ]
+
+        self.assertEqual(
+            format_comparison_for_prompt(entries),
+            '[1] FIELD: rx.medications[0].dosage\n'
+            '    ITEM:  Amoxicillin\n'
+            '    API:   500mg\n'
+            '    JUDGE: 500 mg\n'
+            '    HINT:  mismatch\n'
+            '\n'
+            '[2] FIELD: rx.followUp\n'
+            '    API:   7 days\n'
+            '    JUDGE: 7 days\n'
+            '    HINT:  match',
+        )
+
+    def test_empty_entries(self):
+        self.assertEqual(format_comparison_for_prompt([]), '(no structured data fields to compare)')
+
+
+
+class FieldComparisonTests(unittest.TestCase):
+    def test_array_items_keep_api_then_judge_order(self):
+        entries = _compare_array_field(
+            'medications',
+            api_items=[{'name': 'Paracetamol'}, {'name': 'Amoxicillin'}],
+            judge_items=[{'name': 'amoxicillin'}, {'name': 'Cetirizine'}],
+            key_field='name',
+            sub_fields=[],
+        )
+
+        self.assertEqual(
+            [(e.field_path, e.match_hint) for e in entries],
+            [
+                ('rx.medications[0]', 'api_only'),
+                ('rx.medications[1]', 'match'),
+                ('rx.medications[Cetirizine]', 'judge_only'),
+            ],
+        )
+
+    def test_string_arrays_pad_the_shorter_side(self):
+        entries = _compare_string_array_field('advice', ['rest', 'fluids'], ['rest'])
+
+        self.assertEqual(
+            [(e.api_value, e.judge_value, e.match_hint) for e in entries],
+            [('rest', 'rest', 'match'), ('fluids', '(empty)', 'mismatch')],
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from app.services.evaluators import evaluation_constants as constants
+from app.services.evaluators.llm_base import AnthropicProvider, BedrockProvider
+
+
+class CritiquePromptLayoutTests(unittest.TestCase):
+    def test_static_prefix_precedes_per_run_comparison(self):
+        upload = constants.UPLOAD_EVALUATION_PROMPT_PREFIX + constants.UPLOAD_EVALUATION_PROMPT_SUFFIX.format(
+            segment_count=2, comparison_table='Segment 0: ...',
+        )
+        api = constants.API_EVALUATION_PROMPT_PREFIX + constants.API_EVALUATION_PROMPT_SUFFIX.format(
+            comparison='=== SECTION 1 ===',
+        )
+
+        self.assertTrue(upload.startswith(constants.UPLOAD_EVALUATION_PROMPT_PREFIX))
+        self.assertTrue(upload.endswith('Segment 0: ...'))
+        self.assertTrue(api.endswith('=== SECTION 1 ==='))
+
+    def test_builders_match_formatted_templates(self):
+        self.assertEqual(
+            constants.build_upload_evaluation_prompt(3, 'Segment 0: {literal braces}'),
+            constants.UPLOAD_EVALUATION_PROMPT.format(segment_count=3, comparison_table='Segment 0: {literal braces}'),
+        )
+        self.assertEqual(
+            constants.build_api_evaluation_prompt('=== SECTION 1 ==='),
+            constants.API_EVALUATION_PROMPT.format(comparison='=== SECTION 1 ==='),
+        )
+
+    def test_prefixes_have_no_template_fields(self):
+        for prefix in (constants.UPLOAD_EVALUATION_PROMPT_PREFIX, constants.API_EVALUATION_PROMPT_PREFIX):
+            self.assertNotIn('{', prefix)
+
+
+class AnthropicCachePrefixTests(unittest.TestCase):
+    def test_prefix_becomes_cache_breakpoint(self):
+        provider = object.__new__(AnthropicProvider)
+
+        content = provider._user_content('RUBRIC\nTABLE', 'RUBRIC\n')
+
+        self.assertEqual(content, [
+            {'type': 'text', 'text': 'RUBRIC\n', 'cache_control': {'type': 'ephemeral'}},
+            {'type': 'text', 'text': 'TABLE'},
+        ])
+
+    def test_plain_prompt_without_matching_prefix(self):
+        provider = object.__new__(AnthropicProvider)
+
+        self.assertEqual(provider._user_content('TABLE', None), 'TABLE')
+        self.assertEqual(provider._user_content('TABLE', 'RUBRIC'), 'TABLE')
+
+    def test_bedrock_keeps_plain_prompt(self):
+        provider = object.__new__(BedrockProvider)
+
+        self.assertEqual(provider._user_content('RUBRIC\nTABLE', 'RUBRIC\n'), 'RUBRIC\nTABLE')
+
+
+if __name__ == '__main__':
+    unittest.main()
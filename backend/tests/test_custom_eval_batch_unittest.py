@@ -0,0 +1,230 @@
+import asyncio
+import sys
+import uuid
+import unittest
+from types import ModuleType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+fake_database = ModuleType('app.database')
+fake_database.async_session = None
+sys.modules.setdefault('app.database', fake_database)
+
+import app.services.evaluators.custom_evaluator_runner as runner  # noqa: E402
+import app.services.evaluators.parallel_engine as parallel_engine  # noqa: E402
+
+
+class _FakeSession:
+    def __init__(self, accessible_ids):
+        self._accessible = list(accessible_ids)
+        self.scalar_calls = 0
+        self.opened = 0
+
+    async def __aenter__(self):
+        self.opened += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def scalars(self, _stmt):
+        self.scalar_calls += 1
+        return list(self._accessible)
+
+    async def scalar(self, _stmt):
+        # Sub-runs load their evaluator and listing; one record stands in for both.
+        return SimpleNamespace(
+            id=uuid.uuid4(), name='Tone', prompt='Rate the tone.', output_schema=[], template_id=None,
+            template_branch_key=None, model_id=None, app_id='voice-rx', transcript=None,
+            source_type='upload', api_response=None, audio_file=None,
+        )
+
+    async def execute(self, _stmt):
+        pass
+
+    async def commit(self):
+        pass
+
+
+def _session_factory(session):
+    return lambda: session
+
+
+class CustomEvalBatchTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tenant_id = uuid.uuid4()
+        self.user_id = uuid.uuid4()
+        self.job_id = uuid.uuid4()
+
+    async def _run_batch(self, session, evaluator_ids, fake_run=None, **params):
+        async def _fake_run(job_id, params, *, tenant_id, user_id):
+            return {"eval_run_id": f"run-{params['evaluator_id']}", "status": "completed"}
+
+        batch_params = {"evaluator_ids": evaluator_ids, "listing_id": str(uuid.uuid4()), "parallel": False}
+        batch_params.update(params)
+        self.progress = AsyncMock()
+        with patch.object(runner, 'async_session', _session_factory(session)), \
+                patch.object(runner, 'run_custom_evaluator', side_effect=fake_run or _fake_run) as run_mock, \
+                patch.object(runner, 'update_job_progress', self.progress), \
+                patch.object(parallel_engine, 'is_job_cancelled', AsyncMock(return_value=False)):
+            result = await runner.run_custom_eval_batch(
+                self.job_id, batch_params, tenant_id=self.tenant_id, user_id=self.user_id,
+            )
+        return result, run_mock
+
+    async def test_validation_uses_one_query_and_skips_missing_ids(self):
+        ids = [uuid.uuid4() for _ in range(3)]
+        session = _FakeSession([ids[2], ids[0]])
+
+        result, run_mock = await self._run_batch(session, [str(i) for i in ids])
+
+        self.assertEqual(session.scalar_calls, 1)
+        self.assertEqual(result["total"], 2)
+        ran = [c.kwargs["params"]["evaluator_id"] for c in run_mock.call_args_list]
+        self.assertEqual(ran, [str(ids[0]), str(ids[2])])
+
+    async def test_validation_chunks_large_id_lists(self):
+        ids = [uuid.uuid4() for _ in range(5)]
+        session = _FakeSession(ids)
+
+        with patch.object(runner, '_VALIDATION_CHUNK_SIZE', 2):
+            result, _ = await self._run_batch(session, [str(i) for i in ids])
+
+        self.assertEqual(session.scalar_calls, 3)
+        self.assertEqual(result["total"], 5)
+
+    async def test_no_accessible_evaluators_raises(self):
+        session = _FakeSession([])
+
+        with self.assertRaisesRegex(ValueError, "No valid evaluators found"):
+            await self._run_batch(session, [str(uuid.uuid4())])
+
+    async def test_parallel_batch_respects_concurrency_bound(self):
+        ids = [uuid.uuid4() for _ in range(6)]
+        session = _FakeSession(ids)
+        in_flight = 0
+        peak = 0
+
+        async def _slow_run(job_id, params, *, tenant_id, user_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"eval_run_id": f"run-{params['evaluator_id']}"}
+
+        result, _ = await self._run_batch(
+            session, [str(i) for i in ids], fake_run=_slow_run, parallel=True, concurrency=2,
+        )
+
+        self.assertLessEqual(peak, 2)
+        self.assertEqual(result["completed"], 6)
+        self.assertEqual(len(result["eval_run_ids"]), 6)
+
+    async def test_progress_carries_first_completed_run_id(self):
+        ids = [uuid.uuid4() for _ in range(2)]
+        session = _FakeSession(ids)
+
+        await self._run_batch(session, [str(i) for i in ids])
+
+        per_item = [c for c in self.progress.call_args_list if c.args[3].startswith("Completed ") and "/" in c.args[3]]
+        self.assertTrue(per_item)
+        self.assertEqual(per_item[0].kwargs.get("run_id"), f"run-{ids[0]}")
+
+    async def test_validation_and_progress_share_one_session(self):
+        ids = [uuid.uuid4() for _ in range(3)]
+        session = _FakeSession(ids)
+
+        await self._run_batch(session, [str(i) for i in ids], parallel=True)
+
+        self.assertEqual(session.opened, 1)
+        self.assertEqual(session.scalar_calls, 1)
+        self.assertTrue(self.progress.call_args_list)
+        for call in self.progress.call_args_list:
+            self.assertIs(call.kwargs.get("db"), session)
+
+    async def test_failures_are_counted_once(self):
+        ids = [uuid.uuid4() for _ in range(4)]
+        session = _FakeSession(ids)
+
+        async def _flaky_run(job_id, params, *, tenant_id, user_id):
+            if params["evaluator_id"] in (str(ids[1]), str(ids[3])):
+                raise RuntimeError("llm down")
+            return {"eval_run_id": f"run-{params['evaluator_id']}"}
+
+        result, _ = await self._run_batch(session, [str(i) for i in ids], fake_run=_flaky_run, parallel=True)
+
+        self.assertEqual(result["completed"], 2)
+        self.assertEqual(result["errors"], 2)
+        self.assertEqual(self.progress.call_args_list[-1].args[3], "Completed: 2 success, 2 failed")
+
+    async def test_cancellation_propagates_without_counting_as_error(self):
+        ids = [uuid.uuid4() for _ in range(2)]
+        session = _FakeSession(ids)
+
+        async def _cancelled_run(job_id, params, *, tenant_id, user_id):
+            raise runner.JobCancelledError("cancelled")
+
+        with self.assertRaises(runner.JobCancelledError):
+            await self._run_batch(session, [str(i) for i in ids], fake_run=_cancelled_run)
+
+        final = [c for c in self.progress.call_args_list if c.args[3].startswith("Completed:")]
+        self.assertEqual(final, [])
+
+    async def test_sub_runs_leave_job_progress_to_the_batch(self):
+        ids = [uuid.uuid4() for _ in range(4)]
+        session = _FakeSession(ids)
+        llm = MagicMock()
+        llm.generate_json = AsyncMock(return_value={})
+        resolved = SimpleNamespace(
+            provider='openai', model='gpt-4o', credentials=SimpleNamespace(secret={}, service_account_path=None),
+        )
+        analytics = ModuleType('app.services.analytics')
+        analytics.submit_analytics_job = AsyncMock()
+
+        with patch.object(runner, 'promote_eval_run_to_running', AsyncMock()), \
+                patch.object(runner, 'is_job_cancelled', AsyncMock(return_value=False)), \
+                patch.object(runner, '_resolve_llm_call_for_run', AsyncMock(return_value=resolved)), \
+                patch.object(runner, 'create_llm_provider'), \
+                patch.object(runner, 'make_usage_callback'), \
+                patch.object(runner, 'LoggingLLMWrapper', return_value=llm), \
+                patch.object(runner, 'finalize_eval_run', AsyncMock(return_value=True)), \
+                patch.object(runner, 'ProgressThrottle', return_value=MagicMock(should_write=lambda *a, **kw: False)), \
+                patch.dict(sys.modules, {'app.services.analytics': analytics}):
+            result, _ = await self._run_batch(
+                session, [str(i) for i in ids], fake_run=runner.run_custom_evaluator, parallel=True,
+            )
+
+        self.assertEqual(result["completed"], 4)
+        messages = [c.args[3] for c in self.progress.call_args_list]
+        self.assertEqual(messages, ["Starting 4 evaluators...", "Completed: 4 success, 0 failed"])
+        self.assertFalse(runner._IN_BATCH.get())
+
+
+class BatchResolvedCallMemoTests(unittest.IsolatedAsyncioTestCase):
+    async def _resolve_twice(self):
+        resolve = AsyncMock(side_effect=lambda *a, **kw: object())
+        tenant_id = uuid.uuid4()
+        with patch.object(runner, 'async_session', _session_factory(_FakeSession([]))), \
+                patch.object(runner, 'resolve_llm_call', resolve):
+            first = await runner._resolve_llm_call_for_run(tenant_id, "chat_text", None, "gpt-4o")
+            second = await runner._resolve_llm_call_for_run(tenant_id, "chat_text", None, "gpt-4o")
+        return resolve, first, second
+
+    async def test_batch_scope_resolves_each_call_site_once(self):
+        token = runner._BATCH_RESOLVED_CALLS.set({})
+        try:
+            resolve, first, second = await self._resolve_twice()
+        finally:
+            runner._BATCH_RESOLVED_CALLS.reset(token)
+
+        self.assertEqual(resolve.await_count, 1)
+        self.assertIs(first, second)
+
+    async def test_outside_batch_resolves_every_time(self):
+        resolve, _, _ = await self._resolve_twice()
+
+        self.assertEqual(resolve.await_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
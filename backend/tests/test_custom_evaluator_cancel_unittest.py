@@ -0,0 +1,114 @@
+import asyncio
+import sys
+import uuid
+import unittest
+from types import ModuleType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+fake_database = ModuleType('app.database')
+fake_database.async_session = None
+sys.modules.setdefault('app.database', fake_database)
+
+import app.services.evaluators.custom_evaluator_runner as runner  # noqa: E402
+
+
+class _FakeSession:
+    def __init__(self, *scalars):
+        self._scalars = list(scalars)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def scalar(self, _stmt):
+        return self._scalars.pop(0)
+
+    async def execute(self, _stmt):
+        pass
+
+    async def commit(self):
+        pass
+
+
+class RunCustomEvaluatorCancelTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tenant_id = uuid.uuid4()
+        self.user_id = uuid.uuid4()
+        self.job_id = uuid.uuid4()
+        self.run_id = uuid.uuid4()
+        self.finalize = AsyncMock(return_value=True)
+        self.llm = MagicMock()
+        self.llm.generate_json = AsyncMock(return_value={'score': 1})
+        self.submit_analytics = AsyncMock()
+
+    async def _run(self, *, cancelled_checks):
+        evaluator = SimpleNamespace(
+            name='Tone', prompt='Rate the tone.', output_schema=[], template_id=None,
+            template_branch_key=None, model_id=None,
+        )
+        listing = SimpleNamespace(
+            id=uuid.uuid4(), app_id='voice-rx', transcript=None, source_type='upload',
+            api_response=None, audio_file=None,
+        )
+        session = _FakeSession(evaluator, listing)
+        resolved = SimpleNamespace(
+            provider='openai', model='gpt-4o',
+            credentials=SimpleNamespace(secret={}, service_account_path=None),
+        )
+        params = {
+            'evaluator_id': str(uuid.uuid4()), 'listing_id': str(listing.id),
+            'eval_run_id': str(self.run_id),
+        }
+        analytics = ModuleType('app.services.analytics')
+        analytics.submit_analytics_job = self.submit_analytics
+        with patch.object(runner, 'async_session', lambda: session), \
+                patch.object(runner, 'promote_eval_run_to_running', AsyncMock()), \
+                patch.object(runner, 'update_job_progress', AsyncMock()), \
+                patch.object(runner, 'is_job_cancelled', AsyncMock(side_effect=cancelled_checks)), \
+                patch.object(runner, '_resolve_llm_call_for_run', AsyncMock(return_value=resolved)), \
+                patch.object(runner, 'create_llm_provider'), \
+                patch.object(runner, 'make_usage_callback'), \
+                patch.object(runner, 'LoggingLLMWrapper', return_value=self.llm), \
+                patch.object(runner, 'finalize_eval_run', self.finalize), \
+                patch.dict(sys.modules, {'app.services.analytics': analytics}):
+            await runner.run_custom_evaluator(
+                self.job_id, params, tenant_id=self.tenant_id, user_id=self.user_id,
+            )
+
+    def _assert_finalized_cancelled(self):
+        self.finalize.assert_awaited_once()
+        args, kwargs = self.finalize.call_args
+        self.assertEqual(args, (self.run_id, self.tenant_id))
+        self.assertEqual(kwargs['status'], 'cancelled')
+        self.assertEqual(kwargs['error_message'], 'Cancelled')
+        self.submit_analytics.assert_awaited_once()
+
+    async def test_job_cancelled_before_the_llm_call_finalizes_and_reraises(self):
+        with self.assertRaises(runner.JobCancelledError):
+            await self._run(cancelled_checks=[True])
+
+        self.llm.generate_json.assert_not_awaited()
+        self._assert_finalized_cancelled()
+
+    async def test_batch_sibling_cancellation_finalizes_and_reraises(self):
+        self.llm.generate_json.side_effect = asyncio.CancelledError()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await self._run(cancelled_checks=[False, True])
+
+        self._assert_finalized_cancelled()
+
+    async def test_task_cancellation_without_a_job_cancel_is_left_to_recovery(self):
+        self.llm.generate_json.side_effect = asyncio.CancelledError()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await self._run(cancelled_checks=[False, False])
+
+        self.finalize.assert_not_awaited()
+        self.submit_analytics.assert_not_awaited()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+from app.services.evaluators import evaluation_constants as constants
+
+
+class NormalizationSchemaTests(unittest.TestCase):
+    def test_schema_is_built_once_per_script(self):
+        first = constants.build_normalization_schema('Roman')
+        second = constants.build_normalization_schema('Roman')
+
+        self.assertIs(first, second)
+        self.assertIn('Roman', first['properties']['segments']['items']['properties']['text']['description'])
+        self.assertIsNot(first, constants.build_normalization_schema('Devanagari'))
+
+    def test_plain_schema_is_built_once_per_script(self):
+        schema = constants.build_normalization_schema_plain('Roman')
+
+        self.assertIs(schema, constants.build_normalization_schema_plain('Roman'))
+        self.assertEqual(schema['required'], ['normalized_text'])
+
+
+class NormalizationPromptTests(unittest.TestCase):
+    def test_matches_formatted_templates(self):
+        args = ('Roman', 'The source text is in Devanagari script.', 'Hindi')
+        transcript = '{"segments":[{"text":"{braces} stay"}]}'
+
+        self.assertEqual(
+            constants.build_normalization_prompt(transcript, *args),
+            constants.NORMALIZATION_PROMPT.format(
+                target_script=args[0], source_instruction=args[1], language=args[2], transcript_json=transcript,
+            ),
+        )
+        self.assertEqual(
+            constants.build_normalization_prompt('plain text', *args, plain=True),
+            constants.NORMALIZATION_PROMPT_PLAIN.format(
+                target_script=args[0], source_instruction=args[1], language=args[2], transcript_text='plain text',
+            ),
+        )
+
+    def test_frame_is_formatted_once_per_script_and_language(self):
+        constants._normalization_prompt_frame.cache_clear()
+
+        constants.build_normalization_prompt('a', 'Roman', 'auto', 'Hindi')
+        constants.build_normalization_prompt('b', 'Roman', 'auto', 'Hindi')
+
+        self.assertEqual(constants._normalization_prompt_frame.cache_info().hits, 1)
+
+
+class TranscriptionSystemPromptTests(unittest.TestCase):
+    def test_prompt_is_built_once_per_script_and_language(self):
+        constants.build_transcription_system_prompt.cache_clear()
+
+        first = constants.build_transcription_system_prompt('Latin', 'Hindi')
+
+        self.assertIs(first, constants.build_transcription_system_prompt('Latin', 'Hindi'))
+        self.assertIn('The audio is in Hindi.', first)
+        self.assertEqual(
+            constants.build_transcription_system_prompt('', 'Auto-detect'),
+            'You are an expert medical transcription system.',
+        )
+
+
+class ResolveScriptNameTests(unittest.TestCase):
+    def test_known_unknown_and_auto_scripts(self):
+        self.assertEqual(constants.resolve_script_name('latin'), 'Latin (Roman/English alphabet)')
+        self.assertEqual(constants.resolve_script_name('ol_chiki'), 'Ol_Chiki')
+        self.assertEqual(constants.resolve_script_name('auto'), '')
+        self.assertEqual(constants.resolve_script_name(''), '')
+
+    def test_repeat_lookups_are_memoized(self):
+        constants.resolve_script_name.cache_clear()
+
+        constants.resolve_script_name('tamil')
+        constants.resolve_script_name('tamil')
+
+        self.assertEqual(constants.resolve_script_name.cache_info().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -440,3 +441,133 @@ class JobWorkerHandlerTests(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn('api_key', mock_runner.await_args.kwargs)
         self.assertNotIn('azure_endpoint', mock_runner.await_args.kwargs)
         self.assertNotIn('api_version', mock_runner.await_args.kwargs)
+
+
+class _FakeProgressSession:
+    def __init__(self):
+        self.executed = []
+        self.commits = 0
+
+    async def execute(self, stmt, params=None):
+        self.executed.append((stmt, params))
+
+    async def commit(self):
+        self.commits += 1
+
+
+class JobWorkerProgressTests(unittest.IsolatedAsyncioTestCase):
+    async def test_progress_write_is_one_prebuilt_update(self):
+        db = _FakeProgressSession()
+        job_id = uuid.uuid4()
+
+        await job_worker.update_job_progress(job_id, 2, 5, 'Working', db=db, evaluator_id='ev-1')
+        await job_worker.update_job_progress(job_id, 3, 5, 'Working', db=db)
+
+        self.assertEqual(len(db.executed), 2)
+        self.assertEqual(db.commits, 2)
+        for stmt, _params in db.executed:
+            self.assertIs(stmt, job_worker._PROGRESS_UPDATE_STMT)
+        self.assertEqual(db.executed[0][1], {
+            'b_job_id': job_id,
+            'b_progress': {'current': 2, 'total': 5, 'message': 'Working', 'evaluator_id': 'ev-1'},
+        })
+
+    def test_progress_update_keeps_stored_run_id_in_sql(self):
+        from sqlalchemy.dialects import postgresql
+
+        sql = str(job_worker._PROGRESS_UPDATE_STMT.compile(dialect=postgresql.dialect()))
+
+        self.assertIn("jsonb_build_object('run_id'", sql)
+        self.assertIn('||', sql)
+
+
+class _FakeRecoverySession:
+    def __init__(self, rows):
+        self._rows = rows
+        self.executed = []
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def execute(self, stmt):
+        self.executed.append(stmt)
+        return SimpleNamespace(all=lambda: list(self._rows))
+
+    async def commit(self):
+        self.commits += 1
+
+
+class RecoverStaleEvalRunsTests(unittest.IsolatedAsyncioTestCase):
+    async def test_runs_are_flipped_by_job_status_in_bulk(self):
+        cancelled, failed_a, failed_b = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        session = _FakeRecoverySession([
+            (cancelled, uuid.uuid4(), 'cancelled'),
+            (failed_a, uuid.uuid4(), 'completed'),
+            (failed_b, uuid.uuid4(), 'failed'),
+        ])
+
+        with patch.object(job_worker, 'async_session', lambda: session):
+            await job_worker.recover_stale_eval_runs()
+
+        updates = [stmt.compile().params for stmt in session.executed[1:]]
+        self.assertEqual(len(session.executed), 3)
+        self.assertEqual([p['status'] for p in updates], ['cancelled', 'failed'])
+        self.assertEqual(updates[0]['id_1'], [cancelled])
+        self.assertEqual(updates[1]['id_1'], [failed_a, failed_b])
+        self.assertEqual(session.commits, 1)
+
+    async def test_nothing_stale_skips_commit(self):
+        session = _FakeRecoverySession([])
+
+        with patch.object(job_worker, 'async_session', lambda: session):
+            await job_worker.recover_stale_eval_runs()
+
+        self.assertEqual(len(session.executed), 1)
+        self.assertEqual(session.commits, 0)
+
+
+class _FakeCancelCheckSession:
+    def __init__(self, result=None):
+        self.result = result
+        self.queries = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def scalar(self, _stmt):
+        self.queries += 1
+        await asyncio.sleep(0)
+        return self.result
+
+
+class JobWorkerCancelCheckTests(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self):
+        job_worker._cancel_check_times.clear()
+        job_worker._cancelled_jobs.clear()
+
+    async def test_concurrent_checks_share_one_db_poll_per_interval(self):
+        session = _FakeCancelCheckSession()
+        job_id = uuid.uuid4()
+
+        with patch.object(job_worker, 'async_session', lambda: session):
+            results = await asyncio.gather(*(job_worker.is_job_cancelled(job_id) for _ in range(20)))
+
+        self.assertEqual(results, [False] * 20)
+        self.assertEqual(session.queries, 1)
+
+    async def test_db_cancellation_is_cached_in_memory(self):
+        session = _FakeCancelCheckSession(result=uuid.uuid4())
+        job_id = uuid.uuid4()
+
+        with patch.object(job_worker, 'async_session', lambda: session):
+            self.assertTrue(await job_worker.is_job_cancelled(job_id))
+            self.assertTrue(await job_worker.is_job_cancelled(job_id))
+
+        self.assertEqual(session.queries, 1)
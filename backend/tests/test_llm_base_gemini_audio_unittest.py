@@ -0,0 +1,41 @@
+import io
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from google.genai import types
+
+from app.services.evaluators.llm_base import GeminiProvider
+
+
+class GeminiAudioUploadTests(unittest.TestCase):
+    def setUp(self):
+        self.provider = GeminiProvider(api_key='key', model_name='gemini-2.5-flash')
+        self.provider.client = MagicMock()
+        self.provider.client.files.upload.return_value = SimpleNamespace(
+            name='files/1', state=SimpleNamespace(name='ACTIVE'),
+            uri='https://example.com/files/1', mime_type='audio/wav',
+        )
+        self.provider.client.models.generate_content.return_value = SimpleNamespace(
+            text='{}', usage_metadata=None,
+        )
+
+    def test_audio_is_uploaded_from_memory(self):
+        audio = b'RIFF\x00\x00audio'
+        with patch.object(tempfile, 'NamedTemporaryFile') as named, \
+                patch.object(tempfile, 'mkstemp') as mkstemp:
+            text, _, _, _ = self.provider._sync_generate_with_audio('Transcribe.', audio, 'audio/wav', None)
+
+        self.assertEqual(text, '{}')
+        named.assert_not_called()
+        mkstemp.assert_not_called()
+        upload = self.provider.client.files.upload.call_args.kwargs
+        self.assertIsInstance(upload['file'], io.BytesIO)
+        self.assertEqual(upload['file'].getvalue(), audio)
+        self.assertIsInstance(upload['config'], types.UploadFileConfig)
+        self.assertEqual(upload['config'].mime_type, 'audio/wav')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from app.services.evaluators.llm_base import AnthropicProvider, AzureOpenAIProvider, OpenAIProvider
+
+
+class SharedHttpClientTests(unittest.TestCase):
+    def test_openai_family_shares_one_pool(self):
+        first = OpenAIProvider(api_key='sk-a', model_name='gpt-4o')
+        second = OpenAIProvider(api_key='sk-b', model_name='gpt-4o-mini')
+        azure = AzureOpenAIProvider(
+            api_key='az', model_name='gpt-4o', azure_endpoint='https://example.openai.azure.com',
+        )
+
+        self.assertIs(first.client._client, second.client._client)
+        self.assertIs(first.client._client, azure.client._client)
+        self.assertNotEqual(first.client.api_key, second.client.api_key)
+
+    def test_anthropic_providers_share_one_pool(self):
+        first = AnthropicProvider(api_key='a', model_name='claude-sonnet-4-5')
+        second = AnthropicProvider(api_key='b', model_name='claude-sonnet-4-5')
+
+        self.assertIs(first.client._client, second.client._client)
+
+
+if __name__ == '__main__':
+    unittest.main()
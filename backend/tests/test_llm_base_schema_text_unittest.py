@@ -0,0 +1,36 @@
+import json
+import unittest
+
+from app.services.evaluators import llm_base
+
+
+class SchemaTextTests(unittest.TestCase):
+    def setUp(self):
+        llm_base._SCHEMA_TEXT_CACHE.clear()
+
+    def test_same_schema_object_is_rendered_once(self):
+        schema = {'type': 'object', 'properties': {'segments': {'type': 'array'}}}
+
+        first = llm_base._schema_text(schema)
+
+        self.assertEqual(json.loads(first), schema)
+        self.assertNotIn('\n', first)
+        self.assertIs(llm_base._schema_text(schema), first)
+
+    def test_equal_but_distinct_schemas_are_rendered_separately(self):
+        first = {'type': 'object', 'required': ['a']}
+        second = {'type': 'object', 'required': ['b']}
+
+        self.assertIn('"a"', llm_base._schema_text(first))
+        self.assertIn('"b"', llm_base._schema_text(second))
+
+    def test_cache_stays_bounded(self):
+        schemas = [{'n': i} for i in range(llm_base._SCHEMA_TEXT_CACHE_MAX + 5)]
+        for schema in schemas:
+            llm_base._schema_text(schema)
+
+        self.assertLessEqual(len(llm_base._SCHEMA_TEXT_CACHE), llm_base._SCHEMA_TEXT_CACHE_MAX)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import sys
+import uuid
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import ModuleType, SimpleNamespace
+from unittest.mock import patch
+
+from sqlalchemy import column
+from sqlalchemy.dialects import postgresql
+
+fake_database = ModuleType('app.database')
+fake_database.async_session = None
+fake_database.read_session = None
+sys.modules.setdefault('app.database', fake_database)
+
+import app.services.evaluators.llm_cache as llm_cache  # noqa: E402
+
+
+class _FakeCacheModel:
+    __tablename__ = 'cache_fake'
+    # Same columns read_cached_response filters and selects on.
+    cache_key = column('cache_key')
+    tenant_id = column('tenant_id')
+    response = column('response')
+    expires_at = column('expires_at')
+
+
+class _FakeSession:
+    def __init__(self, response=None, fail=False, rowcount=0, expires_in=timedelta(days=1)):
+        self.response = response
+        self.fail = fail
+        self.rowcount = rowcount
+        self.expires_at = datetime.now(timezone.utc) + expires_in
+        self.executed = 0
+        self.statements = []
+        self.commits = 0
+
+    async def __aenter__(self):
+        if self.fail:
+            raise RuntimeError('db down')
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def execute(self, stmt):
+        self.executed += 1
+        self.statements.append(stmt)
+        row = None
+        if self.response is not None:
+            row = SimpleNamespace(response=self.response, expires_at=self.expires_at)
+        return SimpleNamespace(rowcount=self.rowcount, first=lambda: row)
+
+    async def commit(self):
+        self.commits += 1
+
+
+class LlmCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        llm_cache._HOT_TIER.invalidate()
+        self.tenant_id = uuid.uuid4()
+
+    def test_key_is_order_sensitive_and_stable(self):
+        key = llm_cache.request_cache_key('prompt', {'b': 1, 'a': 2}, 'openai:gpt-4o')
+
+        self.assertEqual(key, llm_cache.request_cache_key('prompt', {'a': 2, 'b': 1}, 'openai:gpt-4o'))
+        self.assertNotEqual(key, llm_cache.request_cache_key('openai:gpt-4o', {'a': 2, 'b': 1}, 'prompt'))
+
+    async def test_db_hit_is_served_from_memory_afterwards(self):
+        session = _FakeSession(response={'overallAssessment': 'ok'})
+        with patch.object(llm_cache, 'read_session', lambda: session):
+            first = await llm_cache.read_cached_response(_FakeCacheModel, self.tenant_id, 'k')
+            second = await llm_cache.read_cached_response(_FakeCacheModel, self.tenant_id, 'k')
+
+        self.assertEqual(first, second)
+        self.assertEqual(session.executed, 1)
+
+    async def test_miss_is_not_remembered(self):
+        session = _FakeSession(response=None)
+        with patch.object(llm_cache, 'read_session', lambda: session):
+            self.assertIsNone(await llm_cache.read_cached_response(_FakeCacheModel, self.tenant_id, 'k'))
+            self.assertIsNone(await llm_cache.read_cached_response(_FakeCacheModel, self.tenant_id, 'k'))
+
+        self.assertEqual(session.executed, 2)
+
+    async def test_memory_hit_does_not_outlive_the_row(self):
+        session = _FakeSession(response={'overallAssessment': 'ok'}, expires_in=timedelta(minutes=1))
+        with patch.object(llm_cache, 'read_session', lambda: session):
+            self.assertIsNotNone(await llm_cache.read_cached_response(_FakeCacheModel, self.tenant_id, 'k'))
+
+        later = datetime.now(timezone.utc) + timedelta(minutes=2)
+        with patch.object(llm_cache, 'datetime', SimpleNamespace(now=lambda tz=None: later)), \
+                patch.object(llm_cache, 'read_session', lambda: _FakeSession(fail=True)):
+            self.assertIsNone(await llm_cache.read_cached_response(_FakeCacheModel, self.tenant_id, 'k'))
+
+        self.assertEqual(session.executed, 1)
+        self.assertIsNone(llm_cache._HOT_TIER.get(('cache_fake', self.tenant_id, 'k')))
+
+    async def test_lookup_error_is_a_miss(self):
+        with patch.object(llm_cache, 'read_session', lambda: _FakeSession(fail=True)):
+            self.assertIsNone(await llm_cache.read_cached_response(_FakeCacheModel, self.tenant_id, 'k'))
+
+    async def test_write_populates_memory_tier_with_an_isolated_copy(self):
+        response = {'segments': []}
+        with patch.object(llm_cache, 'async_session', lambda: _FakeSession()), \
+                patch.object(llm_cache, 'pg_insert'):
+            await llm_cache.write_cached_response(
+                _FakeCacheModel, self.tenant_id, 'k', response, timedelta(days=1),
+            )
+        response['generatedAt'] = 'now'
+
+        with patch.object(llm_cache, 'read_session', lambda: _FakeSession(fail=True)):
+            cached = await llm_cache.read_cached_response(_FakeCacheModel, self.tenant_id, 'k')
+        cached['model'] = 'mutated'
+
+        with patch.object(llm_cache, 'read_session', lambda: _FakeSession(fail=True)):
+            again = await llm_cache.read_cached_response(_FakeCacheModel, self.tenant_id, 'k')
+        self.assertEqual(again, {'segments': []})
+
+    async def test_entries_are_tenant_scoped(self):
+        with patch.object(llm_cache, 'async_session', lambda: _FakeSession()), \
+                patch.object(llm_cache, 'pg_insert'):
+            await llm_cache.write_cached_response(
+                _FakeCacheModel, self.tenant_id, 'k', 'text', timedelta(days=1),
+            )
+
+        with patch.object(llm_cache, 'read_session', lambda: _FakeSession(response=None)):
+            self.assertIsNone(await llm_cache.read_cached_response(_FakeCacheModel, uuid.uuid4(), 'k'))
+
+
+class PruneExpiredResponsesTests(unittest.IsolatedAsyncioTestCase):
+    async def test_deletes_expired_rows_from_every_cache_table(self):
+        session = _FakeSession(rowcount=3)
+        with patch.object(llm_cache, 'async_session', lambda: session):
+            pruned = await llm_cache.prune_expired_responses()
+
+        self.assertEqual(pruned, 6)
+        self.assertEqual(session.commits, 1)
+        compiled = [str(stmt.compile(dialect=postgresql.dialect())) for stmt in session.statements]
+        for table, sql in zip(('cache_transcription', 'cache_critique'), compiled, strict=True):
+            self.assertIn(f'DELETE FROM platform.{table}', sql)
+            self.assertIn('expires_at <', sql)
+
+    async def test_nothing_expired_skips_the_commit(self):
+        session = _FakeSession(rowcount=0)
+        with patch.object(llm_cache, 'async_session', lambda: session):
+            self.assertEqual(await llm_cache.prune_expired_responses(), 0)
+
+        self.assertEqual(session.executed, 2)
+        self.assertEqual(session.commits, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import asyncio
+import sys
+import unittest
+import uuid
+from types import ModuleType
+from unittest.mock import AsyncMock, patch
+
+fake_database = ModuleType('app.database')
+fake_database.async_session = None
+sys.modules.setdefault('app.database', fake_database)
+
+import app.services.evaluators.parallel_engine as parallel_engine  # noqa: E402
+from app.services.job_worker import JobCancelledError  # noqa: E402
+
+
+class RunParallelCancellationTests(unittest.IsolatedAsyncioTestCase):
+    async def test_cancellation_in_one_worker_cancels_in_flight_siblings(self):
+        sibling_cancelled = asyncio.Event()
+        sibling_started = asyncio.Event()
+
+        async def _worker(index, _item):
+            if index == 0:
+                await sibling_started.wait()
+                raise JobCancelledError("cancelled")
+            sibling_started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                sibling_cancelled.set()
+                raise
+
+        with patch.object(parallel_engine, 'is_job_cancelled', AsyncMock(return_value=False)):
+            with self.assertRaises(JobCancelledError):
+                await asyncio.wait_for(
+                    parallel_engine.run_parallel(
+                        [0, 1], _worker, concurrency=2, job_id=uuid.uuid4(), tenant_id=uuid.uuid4(),
+                    ),
+                    timeout=5,
+                )
+
+        self.assertTrue(sibling_cancelled.is_set())
+
+
+if __name__ == '__main__':
+    unittest.main()
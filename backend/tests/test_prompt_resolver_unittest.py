@@ -0,0 +1,62 @@
+import json
+import unittest
+
+from app.services.evaluators.prompt_resolver import AUDIO_ATTACHED_MARKER, resolve_prompt
+
+
+class CompactJsonVariableTests(unittest.TestCase):
+    _API_RESPONSE = {'input': 'बुखार है', 'rx': {'medications': [{'name': 'Paracetamol'}]}}
+
+    def test_api_response_is_compact_and_keeps_non_ascii(self):
+        result = resolve_prompt('API: {{api_response}}', {'listing': {'api_response': self._API_RESPONSE}})
+
+        rendered = result['prompt'][len('API: '):]
+        self.assertEqual(json.loads(rendered), self._API_RESPONSE)
+        self.assertNotIn('\n', rendered)
+        self.assertIn('बुखार', rendered)
+
+    def test_nested_path_variable_is_compact(self):
+        result = resolve_prompt('{{rx.medications}}', {'listing': {'api_response': self._API_RESPONSE}})
+
+        self.assertEqual(result['prompt'], '[{"name":"Paracetamol"}]')
+
+
+class SubstitutionTests(unittest.TestCase):
+    def test_repeated_variable_is_substituted_everywhere(self):
+        result = resolve_prompt('{{language_hint}} / {{language_hint}}', {'prerequisites': {'language': 'Hindi'}})
+
+        self.assertEqual(result['prompt'], 'Hindi / Hindi')
+        self.assertEqual(result['resolved_variables'], {'{{language_hint}}': 'Hindi'})
+
+    def test_tokens_inside_substituted_values_are_not_expanded(self):
+        listing = {'transcript': {'segments': [{'speaker': 'Doctor', 'text': 'say {{language_hint}}'}]}}
+        result = resolve_prompt('{{transcript}} in {{language_hint}}', {
+            'listing': listing, 'prerequisites': {'language': 'Hindi'},
+        })
+
+        self.assertEqual(result['prompt'], '[Doctor]: say {{language_hint}} in Hindi')
+
+    def test_unresolved_variables_are_left_in_place_in_order(self):
+        result = resolve_prompt('{{audio}} then {{unknown}}', {})
+
+        self.assertEqual(result['prompt'], '{{audio}} then {{unknown}}')
+        self.assertEqual(result['unresolved_variables'], ['{{audio}}', '{{unknown}}'])
+
+    def test_audio_marker_is_substituted_in_the_same_pass(self):
+        result = resolve_prompt('Listen: {{audio}}\n{{language_hint}}', {
+            'prerequisites': {'language': 'Hindi'}, 'audio_marker': AUDIO_ATTACHED_MARKER,
+        })
+
+        self.assertEqual(result['prompt'], 'Listen: [Audio file attached]\nHindi')
+        self.assertEqual(result['unresolved_variables'], [])
+
+    def test_preformatted_chat_transcript_is_used(self):
+        result = resolve_prompt('{{chat_transcript}}', {
+            'messages': [{'role': 'user', 'content': 'hi'}], 'chat_transcript': 'User: cached',
+        })
+
+        self.assertEqual(result['prompt'], 'User: cached')
+
+
+if __name__ == '__main__':
+    unittest.main()
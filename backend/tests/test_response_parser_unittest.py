@@ -0,0 +1,73 @@
+import json
+import unittest
+
+from app.services.evaluators import response_parser
+
+
+class ValidatorTests(unittest.TestCase):
+    def test_values_are_case_folded_and_defaulted(self):
+        self.assertEqual(response_parser._validate_severity('CRITICAL'), 'critical')
+        self.assertEqual(response_parser._validate_severity(None), 'none')
+        self.assertEqual(response_parser._validate_severity('bad'), 'none')
+        self.assertEqual(response_parser._validate_likely_correct('Judge'), 'judge')
+        self.assertEqual(response_parser._validate_likely_correct(None), 'unclear')
+        self.assertEqual(response_parser._validate_confidence('HIGH'), 'high')
+        self.assertIsNone(response_parser._validate_confidence(''))
+        self.assertIsNone(response_parser._validate_confidence('certain'))
+
+
+class SafeParseJsonTests(unittest.TestCase):
+    def test_padded_json_parses_directly(self):
+        parsed, repaired = response_parser._safe_parse_json('\n  {"input": "fever", "rx": {}}\n')
+
+        self.assertEqual(parsed, {'input': 'fever', 'rx': {}})
+        self.assertFalse(repaired)
+
+    def test_fenced_json_falls_back_to_extraction(self):
+        parsed, repaired = response_parser._safe_parse_json('```json\n{"input": "fever"}\n```')
+
+        self.assertEqual(parsed, {'input': 'fever'})
+        self.assertFalse(repaired)
+
+
+class ParseTranscriptTests(unittest.TestCase):
+    def test_segments_keep_time_fallbacks_and_build_full_transcript(self):
+        text = json.dumps({'segments': [
+            {'speaker': 'Doctor', 'text': 'fever?', 'startTime': 1.5, 'endTime': '00:00:03'},
+            {'speaker': 'Patient', 'text': 'yes', 'start_time': '00:00:03'},
+            {'text': 'ok', 'startTime': None},
+        ]})
+
+        parsed = response_parser.parse_transcript_response(text)
+        first, second, third = parsed['segments']
+
+        self.assertEqual((first['startTime'], first['startSeconds'], first['endSeconds']), ('1.5', 1.5, None))
+        self.assertEqual((second['startTime'], second['endTime']), ('00:00:03', '2'))
+        self.assertEqual((third['speaker'], third['startTime'], third['startSeconds']), ('Unknown', 'None', None))
+        self.assertEqual(parsed['fullTranscript'], '[Doctor]: fever?\n[Patient]: yes\n[Unknown]: ok')
+
+
+class ParseCritiqueStatisticsTests(unittest.TestCase):
+    def test_counts_are_computed_server_side(self):
+        text = json.dumps({'segments': [
+            {'segmentIndex': 0, 'severity': 'critical', 'likelyCorrect': 'judge'},
+            {'segmentIndex': 2, 'severity': 'Minor', 'likelyCorrect': 'original'},
+            {'segmentIndex': 2, 'severity': 'minor', 'likelyCorrect': 'maybe'},
+        ]})
+
+        stats = response_parser.parse_critique_response(text, [], [], 'gpt-4o', total_segments=5)['statistics']
+
+        self.assertEqual(stats, {
+            'totalSegments': 5,
+            'criticalCount': 1,
+            'moderateCount': 0,
+            'minorCount': 2,
+            'matchCount': 3,
+            'originalCorrectCount': 1,
+            'judgeCorrectCount': 1,
+            'unclearCount': 1,
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,345 @@
+import asyncio
+import sys
+import unittest
+import uuid
+from types import ModuleType, SimpleNamespace
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+fake_database = ModuleType('app.database')
+fake_database.async_session = None
+sys.modules.setdefault('app.database', fake_database)
+
+from app.models.eval_run import EvaluationRun  # noqa: E402
+from app.services.evaluators import runner_utils  # noqa: E402
+from app.services.evaluators.runner_utils import (  # noqa: E402
+    ApiLogBuffer,
+    BackgroundProgress,
+    ProgressThrottle,
+    finalize_eval_run,
+    promote_eval_run_to_running,
+    provider_factory_kwargs,
+)
+
+
+class ProgressThrottleTests(unittest.TestCase):
+    def _should_write(self, throttle, now, current, total, **kwargs):
+        with patch.object(runner_utils.time, 'monotonic', return_value=now):
+            return throttle.should_write(current, total, **kwargs)
+
+    def test_first_write_always_due(self):
+        self.assertTrue(self._should_write(ProgressThrottle(), 100.0, 1, 100))
+
+    def test_skips_small_fast_advances(self):
+        throttle = ProgressThrottle()
+        self._should_write(throttle, 100.0, 1, 100)
+        self.assertFalse(self._should_write(throttle, 100.1, 2, 100))
+        self.assertFalse(self._should_write(throttle, 100.2, 3, 100))
+
+    def test_writes_after_interval_or_step(self):
+        throttle = ProgressThrottle()
+        self._should_write(throttle, 100.0, 1, 100)
+        self.assertTrue(self._should_write(throttle, 100.6, 2, 100))
+        self.assertTrue(self._should_write(throttle, 100.7, 7, 100))
+
+    def test_final_and_forced_writes_bypass_throttle(self):
+        throttle = ProgressThrottle()
+        self._should_write(throttle, 100.0, 1, 100)
+        self.assertTrue(self._should_write(throttle, 100.1, 2, 100, force=True))
+        self.assertTrue(self._should_write(throttle, 100.2, 100, 100))
+
+
+def _resolved(provider, extra_config=None, api_version=None):
+    return SimpleNamespace(
+        provider=provider,
+        api_version=api_version,
+        credentials=SimpleNamespace(extra_config=extra_config or {}),
+    )
+
+
+class BackgroundProgressTests(unittest.IsolatedAsyncioTestCase):
+    async def test_publish_does_not_wait_and_coalesces_to_latest(self):
+        written = []
+        release = asyncio.Event()
+
+        async def _write(current, total, message="", **extra):
+            await release.wait()
+            written.append((current, message))
+
+        progress = BackgroundProgress(_write)
+        progress.publish(1, 3, "Transcribing")
+        await asyncio.sleep(0)
+        progress.publish(2, 3, "Normalizing")
+        progress.publish(3, 3, "Critique", run_id="r1")
+        release.set()
+        await progress.close()
+
+        self.assertEqual(written, [(1, "Transcribing"), (3, "Critique")])
+
+    async def test_write_failure_is_logged_not_raised(self):
+        async def _write(*args, **kwargs):
+            raise RuntimeError("db down")
+
+        progress = BackgroundProgress(_write)
+        progress.publish(1, 3, "Transcribing")
+        with self.assertLogs(runner_utils.logger, level="WARNING"):
+            await progress.close()
+
+    async def test_close_without_publish_is_a_no_op(self):
+        await BackgroundProgress(None).close()
+
+
+class ProviderFactoryKwargsTests(unittest.TestCase):
+    def test_non_azure_providers_need_no_extra_kwargs(self):
+        self.assertEqual(provider_factory_kwargs(_resolved('gemini')), {})
+        self.assertEqual(provider_factory_kwargs(_resolved('openai')), {})
+
+    def test_azure_prefers_resolved_api_version(self):
+        kwargs = provider_factory_kwargs(_resolved(
+            'azure_openai',
+            {'base_url': 'https://x.openai.azure.com', 'api_version': '2024-01-01'},
+            api_version='2025-05-01',
+        ))
+        self.assertEqual(kwargs, {'azure_endpoint': 'https://x.openai.azure.com', 'api_version': '2025-05-01'})
+
+    def test_azure_falls_back_to_default_api_version(self):
+        kwargs = provider_factory_kwargs(_resolved('azure_openai', {'api_version': ''}))
+        self.assertEqual(kwargs, {'azure_endpoint': '', 'api_version': '2025-03-01-preview'})
+
+
+class _FakeLogSession:
+    def __init__(self):
+        self.added = []
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def add_all(self, rows):
+        self.added.extend(rows)
+
+    async def commit(self):
+        self.commits += 1
+
+
+class ApiLogBufferTests(unittest.IsolatedAsyncioTestCase):
+    async def test_flush_writes_all_entries_in_one_commit(self):
+        session = _FakeLogSession()
+        buffer = ApiLogBuffer()
+        run_id = uuid.uuid4()
+
+        await buffer.add({"run_id": str(run_id), "method": "generate_with_audio", "provider": "gemini"})
+        await buffer.add({"run_id": str(run_id), "method": "generate_json"})
+        with patch.object(runner_utils, '_async_session', lambda: session):
+            await buffer.flush()
+            await buffer.flush()
+
+        self.assertEqual(session.commits, 1)
+        self.assertEqual([row.method for row in session.added], ["generate_with_audio", "generate_json"])
+        self.assertEqual(session.added[0].run_id, run_id)
+        self.assertEqual(session.added[1].provider, "unknown")
+
+    async def test_flush_joins_caller_session_without_committing(self):
+        session = _FakeLogSession()
+        session.flushes = 0
+
+        async def _flush():
+            session.flushes += 1
+
+        session.flush = _flush
+        buffer = ApiLogBuffer()
+        await buffer.add({"run_id": str(uuid.uuid4()), "method": "generate_json"})
+        with patch.object(runner_utils, '_async_session', side_effect=AssertionError("opened a session")):
+            await buffer.flush(db=session)
+
+        self.assertEqual(len(session.added), 1)
+        self.assertEqual(session.flushes, 1)
+        self.assertEqual(session.commits, 0)
+
+    async def test_max_pending_flushes_in_batches(self):
+        session = _FakeLogSession()
+        buffer = ApiLogBuffer(max_pending=2)
+        run_id = str(uuid.uuid4())
+
+        with patch.object(runner_utils, '_async_session', lambda: session):
+            for method in ("a", "b", "c"):
+                await buffer.add({"run_id": run_id, "method": method})
+            self.assertEqual(session.commits, 1)
+            await buffer.flush()
+
+        self.assertEqual(session.commits, 2)
+        self.assertEqual([row.method for row in session.added], ["a", "b", "c"])
+
+
+class _FakeUpdateSession(_FakeLogSession):
+    def __init__(self, rowcount):
+        super().__init__()
+        self._rowcount = rowcount
+        self.statements = []
+        self.params = []
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        self.params.append(params)
+        row = ("completed",) if self._rowcount else None
+        return SimpleNamespace(rowcount=self._rowcount, first=lambda: row)
+
+
+class FinalizeEvalRunTests(unittest.IsolatedAsyncioTestCase):
+    async def _finalize(self, rowcount):
+        session = _FakeUpdateSession(rowcount)
+        with patch.object(runner_utils, '_async_session', lambda: session):
+            updated = await finalize_eval_run(
+                uuid.uuid4(), uuid.uuid4(), status="completed", duration_ms=12.0, result={"status": "completed"},
+            )
+        return session, updated
+
+    async def test_reports_whether_the_row_was_written(self):
+        session, updated = await self._finalize(1)
+
+        self.assertTrue(updated)
+        self.assertEqual(len(session.statements), 1)
+        self.assertEqual(session.commits, 1)
+
+    async def test_statement_shape_is_shared_across_runs(self):
+        first, _ = await self._finalize(1)
+        second, _ = await self._finalize(1)
+
+        self.assertIsNot(first.params[0]["b_run_id"], second.params[0]["b_run_id"])
+        self.assertEqual(str(first.statements[0]), str(second.statements[0]))
+        sql = str(first.statements[0].compile(dialect=postgresql.dialect()))
+        self.assertIn("status IN", sql)
+        self.assertIn("RETURNING", sql)
+
+    async def test_concurrent_terminal_state_is_reported_as_not_updated(self):
+        _, updated = await self._finalize(0)
+
+        self.assertFalse(updated)
+
+    async def test_caller_session_is_used_without_committing(self):
+        session = _FakeUpdateSession(1)
+        with patch.object(runner_utils, '_async_session', side_effect=AssertionError("opened a session")):
+            updated = await finalize_eval_run(
+                uuid.uuid4(), uuid.uuid4(), status="failed", duration_ms=1.0, db=session,
+            )
+
+        self.assertTrue(updated)
+        self.assertEqual(len(session.statements), 1)
+        self.assertEqual(session.commits, 0)
+
+
+    def test_statement_compiles_with_the_executed_params(self):
+        stmt = runner_utils._FINALIZE_IN_FLIGHT_RUN_STMT.values(status="failed", duration_ms=1.0)
+        params = {"b_run_id": uuid.uuid4(), "b_tenant_id": uuid.uuid4()}
+
+        sql = str(stmt.compile(dialect=postgresql.dialect(), column_keys=list(params)))
+
+        self.assertIn("tenant_id = %(b_tenant_id)s", sql)
+        self.assertIn("RETURNING", sql)
+
+
+class _SqliteRunSession:
+    """Runs finalize_eval_run's statements for real against an in-memory SQLite table."""
+
+    def __init__(self):
+        engine = create_engine("sqlite://")
+
+        @event.listens_for(engine, "connect")
+        def _attach_schema(dbapi_conn, _record):
+            dbapi_conn.execute("ATTACH DATABASE ':memory:' AS platform")
+
+        EvaluationRun.__table__.create(engine)
+        self.session = Session(engine)
+        self.tenant_id = uuid.uuid4()
+
+    def add_run(self, status):
+        run = EvaluationRun(
+            id=uuid.uuid4(), tenant_id=self.tenant_id, user_id=uuid.uuid4(),
+            app_id="voice-rx", eval_type="full_evaluation", status=status,
+        )
+        self.session.add(run)
+        self.session.commit()
+        return run.id
+
+    def status_of(self, run_id):
+        return self.session.scalar(select(EvaluationRun.status).where(EvaluationRun.id == run_id))
+
+    async def execute(self, stmt, params=None):
+        return self.session.execute(stmt, params)
+
+
+class FinalizeEvalRunExecutionTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.db = _SqliteRunSession()
+
+    async def _finalize(self, run_id, status, tenant_id=None):
+        return await finalize_eval_run(
+            run_id, tenant_id or self.db.tenant_id, status=status, duration_ms=5.0,
+            summary={"status": status}, db=self.db,
+        )
+
+    async def test_running_run_is_finalized(self):
+        run_id = self.db.add_run("running")
+
+        self.assertTrue(await self._finalize(run_id, "completed"))
+        self.assertEqual(self.db.status_of(run_id), "completed")
+
+    async def test_other_tenants_run_is_not_touched(self):
+        run_id = self.db.add_run("running")
+
+        self.assertFalse(await self._finalize(run_id, "completed", tenant_id=uuid.uuid4()))
+        self.assertEqual(self.db.status_of(run_id), "running")
+
+    async def test_failure_does_not_overwrite_a_terminal_run(self):
+        pending = self.db.add_run("pending")
+        terminal = {status: self.db.add_run(status) for status in ("completed", "cancelled", "failed")}
+
+        self.assertTrue(await self._finalize(pending, "failed"))
+        for status, run_id in terminal.items():
+            self.assertFalse(await self._finalize(run_id, "failed"))
+            self.assertEqual(self.db.status_of(run_id), status)
+        self.assertEqual(self.db.status_of(pending), "failed")
+
+    async def test_cancel_fills_in_a_cancelled_run_but_not_a_finished_one(self):
+        cancelled = self.db.add_run("cancelled")
+        running = self.db.add_run("running")
+        finished = {status: self.db.add_run(status) for status in ("completed", "failed")}
+
+        self.assertTrue(await self._finalize(cancelled, "cancelled"))
+        self.assertTrue(await self._finalize(running, "cancelled"))
+        for status, run_id in finished.items():
+            self.assertFalse(await self._finalize(run_id, "cancelled"))
+            self.assertEqual(self.db.status_of(run_id), status)
+        self.assertEqual(self.db.status_of(running), "cancelled")
+
+
+class PromoteEvalRunTests(unittest.IsolatedAsyncioTestCase):
+    async def _promote(self, rowcount):
+        session = _FakeUpdateSession(rowcount)
+        with patch.object(runner_utils, '_async_session', lambda: session):
+            await promote_eval_run_to_running(
+                id=uuid.uuid4(), tenant_id=uuid.uuid4(), user_id=uuid.uuid4(), app_id="voice-rx",
+                eval_type="full_evaluation", job_id=uuid.uuid4(), config={"flow_type": "upload"},
+            )
+        return session
+
+    async def test_placeholder_or_insert_is_one_upsert(self):
+        session = await self._promote(1)
+
+        self.assertEqual(len(session.statements), 1)
+        self.assertIn("ON CONFLICT", str(session.statements[0].compile(dialect=postgresql.dialect())))
+        self.assertEqual(session.commits, 1)
+
+    async def test_row_owned_by_another_tenant_is_rejected(self):
+        with self.assertRaises(ValueError):
+            await self._promote(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
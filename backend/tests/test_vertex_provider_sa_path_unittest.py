@@ -27,5 +27,36 @@ class VertexProviderServiceAccountPathTests(unittest.TestCase):
         self.assertIn("service_account", str(ctx.exception))
 
 
+class ServiceAccountFileCacheTests(unittest.TestCase):
+    def test_rereads_only_when_file_changes(self):
+        from unittest.mock import patch
+
+        from app.services.evaluators import llm_base
+
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.write(fd, b'{"project_id": "a"}')
+        os.close(fd)
+        real_open = open
+        try:
+            with patch("builtins.open", side_effect=real_open) as open_mock:
+                first = llm_base._load_service_account_json(path)
+                second = llm_base._load_service_account_json(path)
+                self.assertEqual(first, second)
+                self.assertEqual(open_mock.call_count, 1)
+
+                with real_open(path, "w") as f:
+                    f.write('{"project_id": "changed"}')
+                self.assertIn("changed", llm_base._load_service_account_json(path))
+                self.assertEqual(open_mock.call_count, 2)
+        finally:
+            os.unlink(path)
+
+    def test_missing_file_raises(self):
+        from app.services.evaluators import llm_base
+
+        with self.assertRaises(FileNotFoundError):
+            llm_base._load_service_account_json("/nonexistent/sa.json")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,568 @@
+import json
+import sys
+import unittest
+import uuid
+from collections import Counter
+from types import ModuleType, SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+fake_database = ModuleType('app.database')
+fake_database.async_session = None
+fake_database.read_session = None
+sys.modules.setdefault('app.database', fake_database)
+
+import app.services.evaluators.voice_rx_runner as runner  # noqa: E402
+from app.services.evaluators.flow_config import FlowConfig  # noqa: E402
+
+
+class _TemplateSession:
+    def __init__(self, row):
+        self._row = row
+        self.queries = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def execute(self, _stmt):
+        self.queries += 1
+        return SimpleNamespace(first=lambda: self._row, one_or_none=lambda: self._row)
+
+
+class DefaultTemplateCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        runner._DEFAULT_TEMPLATE_CACHE.invalidate()
+        self.addCleanup(runner._DEFAULT_TEMPLATE_CACHE.invalidate)
+
+    async def test_prompt_and_schema_load_in_one_query_then_hit_memory(self):
+        session = _TemplateSession(SimpleNamespace(prompt='Transcribe', schema_data={'type': 'object'}))
+
+        with patch.object(runner, 'read_session', lambda: session):
+            for _ in range(3):
+                prompt, schema = await runner._load_default_prompt_and_schema('voice-rx', 'transcription', 'upload')
+
+        self.assertEqual(prompt, 'Transcribe')
+        self.assertEqual(schema, {'type': 'object'})
+        self.assertEqual(session.queries, 1)
+
+    async def test_missing_default_is_not_cached(self):
+        session = _TemplateSession(None)
+
+        with patch.object(runner, 'read_session', lambda: session):
+            for _ in range(2):
+                with self.assertRaisesRegex(ValueError, 'No default transcription template'):
+                    await runner._load_default_prompt_and_schema('voice-rx', 'transcription', 'api')
+
+        self.assertEqual(session.queries, 2)
+
+
+class ListingWithAudioFileTests(unittest.IsolatedAsyncioTestCase):
+    async def _load(self, row):
+        session = _TemplateSession(row)
+        with patch.object(runner, 'read_session', lambda: session):
+            result = await runner._load_listing_with_audio_file(
+                uuid.uuid4(), tenant_id=uuid.uuid4(), user_id=uuid.uuid4(),
+            )
+        return session, result
+
+    async def test_listing_and_file_record_come_from_one_query(self):
+        listing = SimpleNamespace(audio_file={'id': str(uuid.uuid4())})
+        file_record = SimpleNamespace(storage_path='a.wav')
+
+        session, result = await self._load((listing, file_record))
+
+        self.assertEqual(result, (listing, file_record))
+        self.assertEqual(session.queries, 1)
+
+    async def test_each_missing_piece_has_its_own_error(self):
+        cases = [
+            (None, 'not found or not accessible'),
+            ((SimpleNamespace(audio_file=None), None), 'has no audio file'),
+            ((SimpleNamespace(audio_file={'id': 'f1'}), None), 'File record f1 not found'),
+        ]
+        for row, message in cases:
+            with self.assertRaisesRegex(ValueError, message):
+                await self._load(row)
+
+
+class TranscriptionCacheTests(unittest.IsolatedAsyncioTestCase):
+    _RESPONSE = json.dumps({'input': 'patient has fever', 'rx': {'medications': []}})
+
+    async def _transcribe(self, llm, **kwargs):
+        listing = SimpleNamespace(id='listing-1', transcript='orig', api_response={})
+        kwargs.setdefault('audio_bytes', b'RIFF')
+        return await runner._run_transcription(
+            flow=FlowConfig.from_params({}, 'api'),
+            llm=llm,
+            listing=listing,
+            mime_type='audio/wav',
+            prompt_text='Transcribe the audio',
+            schema={'type': 'object', 'properties': {'input': {}, 'rx': {}}},
+            prerequisites={'outputScript': 'auto'},
+            model='gemini:gemini-2.5-pro',
+            **kwargs,
+        )
+
+    async def test_key_changes_with_audio_and_model(self):
+        one, two = await runner._audio_digest(b'one'), await runner._audio_digest(b'two')
+        args = ['prompt', 'system', {'type': 'object'}, 'gemini:a', 'low']
+        base = runner._transcription_cache_key(one, 'audio/wav', *args)
+
+        self.assertEqual(base, runner._transcription_cache_key(one, 'audio/wav', *args))
+        self.assertNotEqual(base, runner._transcription_cache_key(two, 'audio/wav', *args))
+        args[3] = 'gemini:b'
+        self.assertNotEqual(base, runner._transcription_cache_key(one, 'audio/wav', *args))
+
+    async def test_precomputed_digest_skips_rehashing(self):
+        llm = SimpleNamespace(generate_with_audio=AsyncMock(return_value=self._RESPONSE))
+        with patch.object(runner, '_audio_digest', AsyncMock()) as digest, \
+                patch.object(runner, 'read_cached_response', AsyncMock(return_value=None)), \
+                patch.object(runner, 'write_cached_response', AsyncMock()):
+            await self._transcribe(llm, cache_tenant_id=uuid.uuid4(), audio_digest='abc123')
+
+        digest.assert_not_awaited()
+
+    async def test_known_digest_reads_audio_only_on_miss(self):
+        read_audio = AsyncMock(return_value=b'RIFF')
+        for cached, expected_reads in ((self._RESPONSE, 0), (None, 1)):
+            llm = SimpleNamespace(generate_with_audio=AsyncMock(return_value=self._RESPONSE))
+            read_audio.reset_mock()
+            with patch.object(runner, 'read_cached_response', AsyncMock(return_value=cached)), \
+                    patch.object(runner, 'write_cached_response', AsyncMock()):
+                await self._transcribe(
+                    llm, cache_tenant_id=uuid.uuid4(), audio_bytes=None, audio_digest='abc123', read_audio=read_audio,
+                )
+
+            self.assertEqual(read_audio.await_count, expected_reads)
+        self.assertEqual(llm.generate_with_audio.await_args.kwargs['audio_bytes'], b'RIFF')
+
+    async def test_hit_skips_llm_call(self):
+        llm = SimpleNamespace(generate_with_audio=AsyncMock())
+        with patch.object(runner, 'read_cached_response', AsyncMock(return_value=self._RESPONSE)), \
+                patch.object(runner, 'write_cached_response', AsyncMock()) as write:
+            result = await self._transcribe(llm, cache_tenant_id=uuid.uuid4())
+
+        llm.generate_with_audio.assert_not_awaited()
+        write.assert_not_awaited()
+        self.assertEqual(result['judgeOutput']['transcript'], 'patient has fever')
+
+    async def test_miss_stores_parsed_response(self):
+        tenant_id = uuid.uuid4()
+        llm = SimpleNamespace(generate_with_audio=AsyncMock(return_value=self._RESPONSE))
+        with patch.object(runner, 'read_cached_response', AsyncMock(return_value=None)), \
+                patch.object(runner, 'write_cached_response', AsyncMock()) as write:
+            await self._transcribe(llm, cache_tenant_id=tenant_id)
+
+        llm.generate_with_audio.assert_awaited_once()
+        self.assertIs(write.await_args.args[0], runner.CacheTranscription)
+        self.assertEqual(write.await_args.args[1], tenant_id)
+        self.assertEqual(write.await_args.args[3], self._RESPONSE)
+
+    async def test_bypass_never_touches_cache(self):
+        llm = SimpleNamespace(generate_with_audio=AsyncMock(return_value=self._RESPONSE))
+        with patch.object(runner, 'read_cached_response', AsyncMock()) as read, \
+                patch.object(runner, 'write_cached_response', AsyncMock()) as write:
+            await self._transcribe(llm)
+
+        read.assert_not_awaited()
+        write.assert_not_awaited()
+
+
+class ParseLlmTextTests(unittest.IsolatedAsyncioTestCase):
+    async def test_only_large_responses_leave_the_loop(self):
+        with patch.object(runner.asyncio, 'to_thread', AsyncMock(return_value='threaded')) as to_thread, \
+                patch.object(runner, '_PARSE_IN_THREAD_CHARS', 10):
+            self.assertEqual(await runner._parse_llm_text(str.upper, 'small'), 'SMALL')
+            self.assertEqual(await runner._parse_llm_text(str.upper, 'x' * 11), 'threaded')
+
+        to_thread.assert_awaited_once_with(str.upper, 'x' * 11)
+
+
+class CritiqueCacheTests(unittest.IsolatedAsyncioTestCase):
+    _CRITIQUE = {
+        'overallAssessment': 'Mostly accurate',
+        'transcriptComparison': None,
+        'structuredComparison': {'fields': []},
+    }
+
+    async def _critique(self, llm, **kwargs):
+        listing = SimpleNamespace(id='listing-1', api_response={'input': 'fever', 'rx': {}})
+        evaluation = {'judgeOutput': {'transcript': 'fever', 'structuredData': {}}}
+        return await runner._run_critique(
+            flow=FlowConfig.from_params({}, 'api'),
+            llm=llm,
+            listing=listing,
+            prerequisites={},
+            evaluation=evaluation,
+            model='openai:gpt-4o',
+            **kwargs,
+        )
+
+    async def test_hit_skips_llm_call_and_marks_result(self):
+        llm = SimpleNamespace(generate_json=AsyncMock(), model_name='gpt-4o')
+        with patch.object(runner, 'read_cached_response', AsyncMock(return_value=dict(self._CRITIQUE))), \
+                patch.object(runner, 'write_cached_response', AsyncMock()) as write:
+            result = await self._critique(llm, cache_tenant_id=uuid.uuid4())
+
+        llm.generate_json.assert_not_awaited()
+        write.assert_not_awaited()
+        self.assertTrue(result['critiqueFromCache'])
+        self.assertEqual(result['critique']['overallAssessment'], 'Mostly accurate')
+
+    async def test_miss_stores_validated_response_without_run_metadata(self):
+        tenant_id = uuid.uuid4()
+        llm = SimpleNamespace(generate_json=AsyncMock(return_value=dict(self._CRITIQUE)), model_name='gpt-4o')
+        stored = {}
+
+        async def _capture(cache_model, tenant, key, response, ttl):
+            stored.update(model=cache_model, tenant=tenant, response=dict(response))
+
+        with patch.object(runner, 'read_cached_response', AsyncMock(return_value=None)), \
+                patch.object(runner, 'write_cached_response', side_effect=_capture):
+            result = await self._critique(llm, cache_tenant_id=tenant_id)
+
+        self.assertNotIn('critiqueFromCache', result)
+        self.assertIs(stored['model'], runner.CacheCritique)
+        self.assertEqual(stored['tenant'], tenant_id)
+        self.assertNotIn('generatedAt', stored['response'])
+
+    async def test_invalid_response_is_not_cached(self):
+        llm = SimpleNamespace(generate_json=AsyncMock(return_value={'overallAssessment': 'x'}), model_name='gpt-4o')
+        with patch.object(runner, 'read_cached_response', AsyncMock(return_value=None)), \
+                patch.object(runner, 'write_cached_response', AsyncMock()) as write:
+            with self.assertRaises(runner.PipelineStepError):
+                await self._critique(llm, cache_tenant_id=uuid.uuid4())
+
+        write.assert_not_awaited()
+
+    async def test_bypass_never_touches_cache(self):
+        llm = SimpleNamespace(generate_json=AsyncMock(return_value=dict(self._CRITIQUE)), model_name='gpt-4o')
+        with patch.object(runner, 'read_cached_response', AsyncMock()) as read, \
+                patch.object(runner, 'write_cached_response', AsyncMock()) as write:
+            await self._critique(llm)
+
+        read.assert_not_awaited()
+        write.assert_not_awaited()
+
+
+class _TerminalSession:
+    def __init__(self):
+        self.commits = 0
+        self.savepoints = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def begin_nested(self):
+        session = self
+
+        class _Savepoint:
+            async def __aenter__(self):
+                session.savepoints += 1
+
+            async def __aexit__(self, exc_type, exc, tb):
+                return False
+
+        return _Savepoint()
+
+    async def commit(self):
+        self.commits += 1
+
+
+class WriteTerminalStateTests(unittest.IsolatedAsyncioTestCase):
+    async def _finalize(self, *, updated=True, submit=None, analytics=True):
+        session = _TerminalSession()
+        finalize = AsyncMock(return_value=updated)
+        submit = submit or AsyncMock()
+        api_logs = SimpleNamespace(flush=AsyncMock())
+        with patch.object(runner, 'async_session', lambda: session), \
+                patch.object(runner, 'finalize_eval_run', finalize), \
+                patch.object(runner, 'submit_analytics_job', submit):
+            result = await runner._write_terminal_state(
+                uuid.uuid4(), uuid.uuid4(), api_logs=api_logs,
+                analytics_owner=('voice-rx', uuid.uuid4()) if analytics else None,
+                status='completed', duration_ms=1.0,
+            )
+        self.api_logs = api_logs
+        return session, finalize, submit, result
+
+    async def test_terminal_write_logs_and_analytics_share_one_commit(self):
+        session, finalize, submit, result = await self._finalize()
+
+        self.assertTrue(result)
+        self.assertIs(finalize.await_args.kwargs['db'], session)
+        self.assertIs(self.api_logs.flush.await_args.kwargs['db'], session)
+        self.assertIs(submit.await_args.kwargs['db'], session)
+        self.assertEqual(session.savepoints, 2)
+        self.assertEqual(session.commits, 1)
+
+    async def test_skipped_write_does_not_queue_analytics(self):
+        session, _, submit, result = await self._finalize(updated=False)
+
+        self.assertFalse(result)
+        submit.assert_not_awaited()
+        self.api_logs.flush.assert_awaited_once()
+        self.assertEqual(session.commits, 1)
+
+    async def test_failure_path_skips_analytics(self):
+        session, _, submit, _ = await self._finalize(analytics=False)
+
+        submit.assert_not_awaited()
+        self.api_logs.flush.assert_awaited_once()
+        self.assertEqual(session.commits, 1)
+
+    async def test_analytics_failure_keeps_terminal_write(self):
+        session, _, _, result = await self._finalize(submit=AsyncMock(side_effect=RuntimeError('boom')))
+
+        self.assertTrue(result)
+        self.assertEqual(session.commits, 1)
+
+
+class PipelineStepErrorTests(unittest.TestCase):
+    def test_partial_result_is_built_lazily_once(self):
+        evaluation = {'judgeOutput': {'transcript': 'hi'}}
+        calls = []
+
+        def _snapshot():
+            calls.append(1)
+            return dict(evaluation)
+
+        err = runner.PipelineStepError('critique', 'boom', partial_result_factory=_snapshot)
+        self.assertEqual(calls, [])
+
+        self.assertEqual(err.partial_result, evaluation)
+        self.assertIs(err.partial_result, err.partial_result)
+        self.assertEqual(len(calls), 1)
+
+    def test_eager_partial_result_still_supported(self):
+        err = runner.PipelineStepError('transcription', 'boom', partial_result={'a': 1})
+
+        self.assertEqual(err.partial_result, {'a': 1})
+        self.assertIsNone(runner.PipelineStepError('transcription', 'boom').partial_result)
+
+
+class SegmentComparisonTableTests(unittest.TestCase):
+    def test_pads_the_shorter_side(self):
+        table = runner._build_segment_comparison_table(
+            [{'speaker': 'Doctor', 'text': 'Take rest'}, {'speaker': 'Patient', 'text': 'Okay'}],
+            [{'speaker': 'Doctor', 'text': 'Take rest'}],
+        )
+
+        self.assertEqual(table.splitlines(), [
+            'Segment 0: Original=[Doctor]: Take rest | Judge=[Doctor]: Take rest',
+            'Segment 1: Original=[Patient]: Okay | Judge=[?]: [missing]',
+        ])
+
+
+class ApiComparisonTextTests(unittest.TestCase):
+    def test_item_count_covers_lists_objects_and_scalars(self):
+        rx = {'medications': [{}, {}], 'vitals': {'bp': '120/80'}, 'notes': 'rest'}
+
+        self.assertEqual(runner._rx_item_count(rx), 4)
+        self.assertEqual(runner._rx_item_count(None), 0)
+
+    def test_text_contains_both_sections(self):
+        text = runner._build_api_comparison_text({}, {}, 'api says', 'judge says')
+
+        self.assertIn('API TRANSCRIPT:\napi says', text)
+        self.assertIn('JUDGE TRANSCRIPT:\njudge says', text)
+        self.assertTrue(text.endswith('(no structured data fields to compare)'))
+
+
+class AsTextTests(unittest.TestCase):
+    def test_strings_pass_through_and_others_are_coerced(self):
+        text = 'speaker mismatch'
+
+        self.assertIs(runner._as_text(text, ''), text)
+        self.assertEqual(runner._as_text(None, 'minor'), 'minor')
+        self.assertEqual(runner._as_text(3, ''), '3')
+
+
+class SummaryTests(unittest.TestCase):
+    def _severity_summary(self, items):
+        summary = {}
+        runner._add_severity_summary(summary, Counter(item.get('severity', 'none') for item in items))
+        return summary
+
+    def test_severity_counts_are_upper_cased(self):
+        items = [{'severity': 'minor'}, {'severity': 'Critical'}, {}, {'severity': 'minor'}]
+
+        summary = self._severity_summary(items)
+
+        self.assertEqual(summary['severity_distribution'], {'MINOR': 2, 'CRITICAL': 1, 'NONE': 1})
+        self.assertEqual((summary['critical_errors'], summary['moderate_errors'], summary['minor_errors']), (1, 0, 2))
+
+    def test_severity_variants_fold_into_one_bucket(self):
+        items = [{'severity': 'MINOR'}, {'severity': 'minor'}, {'severity': None}, {}]
+
+        summary = self._severity_summary(items)
+
+        self.assertEqual(summary['severity_distribution'], {'MINOR': 2, 'NONE': 2})
+        self.assertIs(type(summary['severity_distribution']), dict)
+
+    def test_api_summary_extraction_metrics(self):
+        evaluation = {
+            'status': 'completed',
+            'judgeOutput': {'transcript': 'x'},
+            'critique': {'fieldCritiques': [
+                {'apiValue': '500mg', 'match': True, 'severity': 'none'},
+                {'apiValue': '(not found)', 'match': False, 'severity': 'critical'},
+                {'apiValue': 'daily', 'match': False, 'severity': 'minor'},
+                {'match': True, 'severity': 'none'},
+            ]},
+        }
+
+        summary = runner._build_summary(FlowConfig.from_params({}, 'api'), evaluation)
+
+        self.assertEqual(summary['overall_accuracy'], 0.5)
+        self.assertEqual(summary['api_extracted_count'], 2)
+        self.assertEqual(summary['api_correct_count'], 1)
+        self.assertEqual(summary['extraction_precision'], 0.5)
+        self.assertEqual(summary['critical_errors'], 1)
+        self.assertEqual(summary['severity_distribution'], {'NONE': 2, 'CRITICAL': 1, 'MINOR': 1})
+
+
+class NormalizationSkipTests(unittest.IsolatedAsyncioTestCase):
+    async def _normalize(self, prerequisites):
+        llm = SimpleNamespace(generate_json=AsyncMock(return_value={'normalized_text': 'namaste'}))
+        listing = SimpleNamespace(transcript=None, api_response={'input': 'namaste'})
+        result = await runner._run_normalization(
+            flow=FlowConfig.from_params({}, 'api'), llm=llm, listing=listing, prerequisites=prerequisites,
+        )
+        return llm, result
+
+    async def test_same_script_skips_llm(self):
+        llm, result = await self._normalize({'sourceScript': 'latin', 'targetScript': ' Latin '})
+
+        llm.generate_json.assert_not_awaited()
+        self.assertNotIn('normalizedOriginal', result)
+        self.assertTrue(result['normalizationMeta']['skipped'])
+
+    async def test_auto_source_still_normalizes(self):
+        llm, _ = await self._normalize({'sourceScript': 'auto', 'targetScript': 'auto'})
+
+        llm.generate_json.assert_awaited_once()
+
+
+class PriorNormalizationReuseTests(unittest.IsolatedAsyncioTestCase):
+    _PREREQS = {'sourceScript': 'devanagari', 'targetScript': 'latin', 'language': 'Hindi'}
+
+    async def _normalize(self, prior, **kwargs):
+        llm = SimpleNamespace(generate_json=AsyncMock(return_value={'normalized_text': 'namaste'}))
+        listing = SimpleNamespace(id=uuid.uuid4(), transcript=None, api_response={'input': 'नमस्ते'})
+        with patch.object(runner, '_load_prior_normalization', AsyncMock(return_value=prior)) as lookup:
+            result = await runner._run_normalization(
+                flow=FlowConfig.from_params({}, 'api'), llm=llm, listing=listing,
+                prerequisites=dict(self._PREREQS), model='openai:gpt-4o', **kwargs,
+            )
+        return llm, lookup, result
+
+    async def test_matching_prior_run_skips_llm(self):
+        prior = {'fullTranscript': 'namaste', 'generatedAt': '2026-01-01T00:00:00+00:00'}
+
+        llm, _, result = await self._normalize(prior, cache_tenant_id=uuid.uuid4())
+
+        llm.generate_json.assert_not_awaited()
+        self.assertEqual(result['normalizedOriginal'], prior)
+        self.assertTrue(result['normalizationMeta']['reused'])
+        self.assertEqual(result['normalizationMeta']['normalizedAt'], prior['generatedAt'])
+
+    async def test_miss_records_source_key_for_later_runs(self):
+        llm, lookup, result = await self._normalize(None, cache_tenant_id=uuid.uuid4())
+
+        llm.generate_json.assert_awaited_once()
+        self.assertEqual(result['normalizationMeta']['sourceKey'], lookup.await_args.args[2])
+        self.assertNotIn('reused', result['normalizationMeta'])
+
+    async def test_bypass_skips_lookup(self):
+        llm, lookup, _ = await self._normalize({'fullTranscript': 'x', 'generatedAt': 'y'})
+
+        lookup.assert_not_awaited()
+        llm.generate_json.assert_awaited_once()
+
+
+class NormalizationCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        runner._NORMALIZATION_CACHE.invalidate()
+
+    async def test_fresh_normalization_serves_any_listing_with_same_input(self):
+        tenant_id = uuid.uuid4()
+        llm = SimpleNamespace(generate_json=AsyncMock(return_value={'normalized_text': 'namaste'}))
+        prereqs = {'sourceScript': 'devanagari', 'targetScript': 'latin', 'language': 'Hindi'}
+
+        results = []
+        for _ in range(2):
+            listing = SimpleNamespace(id=uuid.uuid4(), transcript=None, api_response={'input': 'नमस्ते'})
+            with patch.object(runner, 'read_session', side_effect=RuntimeError('no prior runs')):
+                results.append(await runner._run_normalization(
+                    flow=FlowConfig.from_params({}, 'api'), llm=llm, listing=listing,
+                    prerequisites=dict(prereqs), model='openai:gpt-4o', cache_tenant_id=tenant_id,
+                ))
+
+        llm.generate_json.assert_awaited_once()
+        self.assertTrue(results[1]['normalizationMeta']['reused'])
+        self.assertEqual(results[1]['normalizedOriginal'], results[0]['normalizedOriginal'])
+        self.assertIsNot(results[1]['normalizedOriginal'], results[0]['normalizedOriginal'])
+
+    async def test_other_tenants_do_not_share_entries(self):
+        runner._NORMALIZATION_CACHE.set((uuid.uuid4(), 'key'), {'fullTranscript': 'x'})
+
+        with patch.object(runner, 'read_session', side_effect=RuntimeError('db down')):
+            result = await runner._load_prior_normalization(uuid.uuid4(), uuid.uuid4(), 'key')
+
+        self.assertIsNone(result)
+
+
+class NormalizationBatchingTests(unittest.IsolatedAsyncioTestCase):
+    def _segments(self, n):
+        return [
+            {'speaker': 'Doctor', 'text': f'line {i}', 'startSeconds': i, 'endSeconds': i + 1}
+            for i in range(n)
+        ]
+
+    def test_batches_respect_size_and_order(self):
+        segments = self._segments(5)
+        seg_chars = len(json.dumps(segments[0], ensure_ascii=False, separators=(',', ':')))
+
+        batches = runner._batch_segments_by_size(segments, seg_chars * 2)
+
+        self.assertEqual([len(b) for b, _ in batches], [2, 2, 1])
+        self.assertEqual([seg for batch, _ in batches for seg in batch], segments)
+        for batch, batch_json in batches:
+            self.assertEqual(batch_json, json.dumps({'segments': batch}, ensure_ascii=False, separators=(',', ':')))
+
+    async def test_oversized_transcript_is_normalized_in_batches(self):
+        segments = self._segments(4)
+
+        async def _echo(*, prompt, **kwargs):
+            payload = json.loads(prompt[prompt.index('{"segments"'):].split('\n')[0])
+            return {'segments': [{'speaker': s['speaker'], 'text': s['text'].upper()} for s in payload['segments']]}
+
+        llm = SimpleNamespace(generate_json=AsyncMock(side_effect=_echo))
+        with patch.object(runner, '_NORMALIZATION_BATCH_CHARS', 150):
+            result = await runner._normalize_transcript(llm, {'segments': segments}, 'latin', 'latin', 'Hindi')
+
+        self.assertGreater(llm.generate_json.await_count, 1)
+        self.assertEqual([s['text'] for s in result['segments']], ['LINE 0', 'LINE 1', 'LINE 2', 'LINE 3'])
+        self.assertEqual([s['startSeconds'] for s in result['segments']], [0, 1, 2, 3])
+
+    async def test_extra_model_segments_get_no_seconds(self):
+        segments = self._segments(1)
+        extra = [{'speaker': 'Doctor', 'text': 'a'}, {'text': 'b'}]
+        llm = SimpleNamespace(generate_json=AsyncMock(return_value={'segments': extra}))
+
+        result = await runner._normalize_transcript(llm, {'segments': segments}, 'latin', 'latin', 'Hindi')
+
+        self.assertEqual(
+            [(s['speaker'], s['startSeconds'], s['endTime']) for s in result['segments']],
+            [('Doctor', 0, '00:00:00'), ('Unknown', None, '00:00:00')],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
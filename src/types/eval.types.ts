@@ -124,6 +124,9 @@ export interface NormalizationMeta {
   sourceScript: string;
   targetScript: string;
   normalizedAt?: string;
+  skipped?: boolean;           // source script already matched target; no LLM call
+  sourceKey?: string;          // hash of the normalization inputs, used to reuse prior results
+  reused?: boolean;            // copied from an earlier run of the same listing; no LLM call
 }
 
 export interface UnifiedCritique {
@@ -159,6 +162,7 @@ export interface AIEvaluation {
   critique?: UnifiedCritique;
   normalizedOriginal?: NormalizedOriginal;
   normalizationMeta?: NormalizationMeta;
+  critiqueFromCache?: boolean;
 }
 
 // === HUMAN REVIEW TYPES ===